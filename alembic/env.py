@@ -25,6 +25,15 @@ from app.domain.company.model.keywords_by_position import KeywordsByPosition
 from app.domain.question.model.question import Question
 from app.domain.question.model.answer import Answer
 from app.domain.question.model.answer_comment import AnswerComment
+from app.domain.question.model.question_signature import QuestionSignature
+from app.domain.question.model.question_similarity import QuestionSimilarity
+from app.domain.question.model.question_position import QuestionPosition
+from app.domain.question.model.question_stat import QuestionStat
+from app.domain.company.model.job_posting_position import JobPostingPosition
+from app.domain.company.model.tech_stack_stat import TechStackStat, CompanyTechStackStat, PositionTechStackStat
+from core.cache_bus import CacheEvent
+from core.changes import ChangeSequence, ChangeTombstone
+from core.backfill import BackfillCheckpoint
 from app.domain.user.model.goal_company import GoalCompany
 from app.domain.user.model.user_position import UserPosition
 
@@ -0,0 +1,34 @@
+"""add soft delete columns
+
+Revision ID: 3f1c2a9d7b01
+Revises:
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7b01'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SOFT_DELETE_TABLES = ("company", "question", "answer", "answer_comment")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in SOFT_DELETE_TABLES:
+        op.add_column(table, sa.Column("deleted_at", sa.DateTime(), nullable=True))
+        op.create_index(f"ix_{table}_deleted_at", table, ["deleted_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SOFT_DELETE_TABLES:
+        op.drop_index(f"ix_{table}_deleted_at", table_name=table)
+        op.drop_column(table, "deleted_at")
@@ -0,0 +1,32 @@
+"""add question signature
+
+Revision ID: 8a4e6c2f1d35
+Revises: 3f1c2a9d7b01
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4e6c2f1d35'
+down_revision: Union[str, Sequence[str], None] = '3f1c2a9d7b01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "question_signature",
+        sa.Column("question_id", sa.Integer(), sa.ForeignKey("question.question_id"), primary_key=True),
+        sa.Column("signature", sa.LargeBinary(256), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("question_signature")
@@ -0,0 +1,56 @@
+"""add change versions and tombstones for since sync
+
+Revision ID: a9e3d6b1c472
+Revises: f5c1a7e3b820
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e3d6b1c472'
+down_revision: Union[str, Sequence[str], None] = 'f5c1a7e3b820'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 목록별 시퀀스 row ("answer:<question_id>", "comment:<answer_id>") 는 첫 쓰기 때 만들어진다
+    op.create_table(
+        "change_sequence",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.Column("horizon", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    # 버전은 목록 안에서만 유일하므로 (entity, parent_id, version) 이 키이자 since 조회 인덱스다
+    op.create_table(
+        "change_tombstone",
+        sa.Column("entity", sa.String(30), primary_key=True),
+        sa.Column("parent_id", sa.BigInteger(), primary_key=True, autoincrement=False),
+        sa.Column("version", sa.BigInteger(), primary_key=True, autoincrement=False),
+        sa.Column("entity_id", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(op.f("ix_change_tombstone_created_at"), "change_tombstone", ["created_at"])
+
+    # 기존 row는 버전 0 (처음 받은 sync_token 이후의 변경만 since 조회에 나온다)
+    op.add_column("answer", sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"))
+    op.create_index("ix_answer_question_version", "answer", ["question_id", "version"])
+    op.add_column("answer_comment", sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"))
+    op.create_index("ix_answer_comment_answer_version", "answer_comment", ["answer_id", "version"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_answer_comment_answer_version", table_name="answer_comment")
+    op.drop_column("answer_comment", "version")
+    op.drop_index("ix_answer_question_version", table_name="answer")
+    op.drop_column("answer", "version")
+    op.drop_index(op.f("ix_change_tombstone_created_at"), table_name="change_tombstone")
+    op.drop_table("change_tombstone")
+    op.drop_table("change_sequence")
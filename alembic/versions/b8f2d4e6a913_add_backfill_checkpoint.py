@@ -0,0 +1,40 @@
+"""add backfill checkpoint table for online data backfills
+
+Revision ID: b8f2d4e6a913
+Revises: a9e3d6b1c472
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f2d4e6a913'
+down_revision: Union[str, Sequence[str], None] = 'a9e3d6b1c472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "backfill_checkpoint",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("last_key", sa.BigInteger(), nullable=True),
+        sa.Column("processed", sa.BigInteger(), nullable=False),
+        sa.Column("chunks", sa.Integer(), nullable=False),
+        sa.Column("total_estimate", sa.BigInteger(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("backfill_checkpoint")
@@ -0,0 +1,37 @@
+"""add question stat table for buffered view/answer counters
+
+Revision ID: c3e9a5f7b214
+Revises: b8f2d4e6a913
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9a5f7b214'
+down_revision: Union[str, Sequence[str], None] = 'b8f2d4e6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 질문의 답변 수는 python manage.py backfill question_stat_answers 로 채운다
+    op.create_table(
+        "question_stat",
+        sa.Column("question_id", sa.Integer(), sa.ForeignKey("question.question_id"), primary_key=True),
+        sa.Column("view_count", sa.BigInteger(), nullable=False),
+        sa.Column("answer_count", sa.BigInteger(), nullable=False),
+        sa.Column("score", sa.BigInteger(), nullable=False),
+    )
+    op.create_index("ix_question_stat_score", "question_stat", ["score", "question_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_question_stat_score", table_name="question_stat")
+    op.drop_table("question_stat")
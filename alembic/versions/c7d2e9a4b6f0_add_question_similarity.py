@@ -0,0 +1,37 @@
+"""add question similarity
+
+Revision ID: c7d2e9a4b6f0
+Revises: 8a4e6c2f1d35
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e9a4b6f0'
+down_revision: Union[str, Sequence[str], None] = '8a4e6c2f1d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "question_similarity",
+        sa.Column("question_id", sa.Integer(), sa.ForeignKey("question.question_id"), primary_key=True),
+        sa.Column("similar_question_id", sa.Integer(), sa.ForeignKey("question.question_id"), primary_key=True),
+        sa.Column("score", sa.Float(), nullable=False),
+    )
+    op.create_index(
+        "ix_question_similarity_question_id_score", "question_similarity", ["question_id", "score"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_question_similarity_question_id_score", table_name="question_similarity")
+    op.drop_table("question_similarity")
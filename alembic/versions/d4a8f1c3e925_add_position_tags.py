@@ -0,0 +1,45 @@
+"""add question/job posting position tags
+
+Revision ID: d4a8f1c3e925
+Revises: c7d2e9a4b6f0
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8f1c3e925'
+down_revision: Union[str, Sequence[str], None] = 'c7d2e9a4b6f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "question_position",
+        sa.Column("question_id", sa.Integer(), sa.ForeignKey("question.question_id"), primary_key=True),
+        sa.Column("position_id", sa.Integer(), sa.ForeignKey("position.position_id"), primary_key=True),
+    )
+    op.create_index(op.f("ix_question_position_position_id"), "question_position", ["position_id"])
+    op.create_table(
+        "job_posting_position",
+        sa.Column(
+            "company_job_posting_id", sa.BigInteger(),
+            sa.ForeignKey("company_job_posting.company_job_posting_id"), primary_key=True,
+        ),
+        sa.Column("position_id", sa.Integer(), sa.ForeignKey("position.position_id"), primary_key=True),
+    )
+    op.create_index(op.f("ix_job_posting_position_position_id"), "job_posting_position", ["position_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_job_posting_position_position_id"), table_name="job_posting_position")
+    op.drop_table("job_posting_position")
+    op.drop_index(op.f("ix_question_position_position_id"), table_name="question_position")
+    op.drop_table("question_position")
@@ -0,0 +1,49 @@
+"""add tech stack stat counters
+
+Revision ID: e2b7c5d9a143
+Revises: d4a8f1c3e925
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c5d9a143'
+down_revision: Union[str, Sequence[str], None] = 'd4a8f1c3e925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tech_stack_stat",
+        sa.Column("tech_key", sa.String(100), primary_key=True),
+        sa.Column("tech_name", sa.String(255), nullable=False),
+        sa.Column("posting_count", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_tech_stack_stat_posting_count", "tech_stack_stat", ["posting_count"])
+    op.create_table(
+        "company_tech_stack_stat",
+        sa.Column("company_id", sa.BigInteger(), sa.ForeignKey("company.company_id"), primary_key=True),
+        sa.Column("tech_key", sa.String(100), primary_key=True),
+        sa.Column("posting_count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "position_tech_stack_stat",
+        sa.Column("position_id", sa.Integer(), sa.ForeignKey("position.position_id"), primary_key=True),
+        sa.Column("tech_key", sa.String(100), primary_key=True),
+        sa.Column("posting_count", sa.Integer(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("position_tech_stack_stat")
+    op.drop_table("company_tech_stack_stat")
+    op.drop_index("ix_tech_stack_stat_posting_count", table_name="tech_stack_stat")
+    op.drop_table("tech_stack_stat")
@@ -0,0 +1,37 @@
+"""add cache event log
+
+Revision ID: f5c1a7e3b820
+Revises: e2b7c5d9a143
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c1a7e3b820'
+down_revision: Union[str, Sequence[str], None] = 'e2b7c5d9a143'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "cache_event",
+        sa.Column("event_id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("topic", sa.String(100), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("origin", sa.String(32), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(op.f("ix_cache_event_created_at"), "cache_event", ["created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_cache_event_created_at"), table_name="cache_event")
+    op.drop_table("cache_event")
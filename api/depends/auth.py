@@ -0,0 +1,27 @@
+from typing import Optional
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.orm import Session
+from core.auth import get_current_user, get_optional_current_user
+from core.database import get_db
+from app.domain.user.model.user import User
+
+async def require_admin(current_user: User = Depends(get_current_user)) -> User:
+    """Admin 권한이 있는 사용자만 통과시킵니다."""
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return current_user
+
+async def exact_count_allowed(
+    exact: bool = False,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    db: Session = Depends(get_db)
+) -> bool:
+    """
+    목록의 exact=true (정확한 COUNT) 는 admin 만 쓸 수 있습니다. 그 외에는 추정값(total_exact=false)을 돌려줍니다.
+    exact 를 요청했을 때만 인증을 확인합니다.
+    """
+    if not exact:
+        return False
+    user = await get_optional_current_user(credentials, db)
+    return user is not None and user.role == "admin"
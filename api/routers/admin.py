@@ -0,0 +1,96 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from api.depends.auth import require_admin
+from api.schemas.base import BaseResponse
+from core.compression import compression_stats
+from core.log import log_pipeline
+from core.profiling import profile_store
+from core.slow_query import SLOW_QUERY_MS, slow_query_log
+from app.domain.question.service import stat_service
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+@router.get("/compression", response_model=BaseResponse)
+async def get_compression_stats():
+    """
+    라우트별 응답 압축 통계를 조회합니다.
+
+    - bytes_in / bytes_out / bytes_saved: 압축 전/후 바이트
+    - cpu_ms: 압축에 사용한 CPU 시간 (미리 압축된 응답의 캐시 적중은 0)
+    """
+    return BaseResponse(message="Compression stats", data=compression_stats.snapshot())
+
+@router.delete("/compression", response_model=BaseResponse)
+async def reset_compression_stats():
+    compression_stats.reset()
+    return BaseResponse(message="Compression stats reset", data=None)
+
+@router.get("/profiles", response_model=BaseResponse)
+async def get_profiles():
+    """
+    저장된 요청 프로파일 목록 (최신순).
+    X-Profile 헤더(PROFILE_SECRET) 또는 PROFILE_SAMPLE_RATE 로 프로파일링된 요청이 쌓입니다.
+    """
+    return BaseResponse(message="Request profiles", data=profile_store.list())
+
+@router.get("/profiles/{profile_id}", response_model=BaseResponse)
+async def get_profile(profile_id: str):
+    """함수별 샘플 수(top)와 collapsed stack(folded)을 포함한 프로파일 하나를 조회합니다."""
+    profile = profile_store.load(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return BaseResponse(message="Request profile", data=profile)
+
+@router.get("/profiles/{profile_id}/folded")
+async def download_profile(profile_id: str):
+    """flamegraph.pl / speedscope 용 collapsed stack 파일을 내려받습니다."""
+    profile = profile_store.load(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        profile["folded"],
+        headers={"Content-Disposition": f"attachment; filename=profile-{profile_id}.folded"},
+    )
+
+@router.delete("/profiles", response_model=BaseResponse)
+async def clear_profiles():
+    profile_store.clear()
+    return BaseResponse(message="Request profiles cleared", data=None)
+
+@router.get("/slow-queries", response_model=BaseResponse)
+async def get_slow_queries(limit: int = 100):
+    """
+    SLOW_QUERY_MS 를 넘은 최근 쿼리 (최신순).
+    정규화된 SQL, 파라미터 모양(값 제외), 요청 경로, 자동으로 수집한 EXPLAIN 결과를 포함합니다.
+    """
+    return BaseResponse(
+        message="Slow queries",
+        data={"threshold_ms": SLOW_QUERY_MS, "entries": slow_query_log.snapshot(limit)},
+    )
+
+@router.delete("/slow-queries", response_model=BaseResponse)
+async def clear_slow_queries():
+    slow_query_log.clear()
+    return BaseResponse(message="Slow queries cleared", data=None)
+
+@router.get("/logging", response_model=BaseResponse)
+async def get_logging_stats():
+    """
+    로그 파이프라인 상태.
+
+    - queued: 출력 스레드가 아직 쓰지 않은 레코드 수
+    - dropped: 큐가 가득 차 버린 레코드 수
+    - sampled_out: LOG_SAMPLE_RATES 샘플링으로 건너뛴 레코드 수
+    """
+    return BaseResponse(message="Logging stats", data=log_pipeline.snapshot())
+
+@router.get("/question-stats", response_model=BaseResponse)
+async def get_question_stat_buffer():
+    """
+    이 워커의 질문 조회수/답변 수 버퍼 상태.
+
+    - pending: 다음 flush 를 기다리는 질문 수
+    - dropped: 버퍼가 가득 차 버린 증가분 수
+    - flushes / failures: question_stat 반영 횟수 / 실패 횟수
+    """
+    return BaseResponse(message="Question stat buffer", data=stat_service.snapshot())
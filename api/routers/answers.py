@@ -1,22 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from core.database import get_db
+from core.database import get_db, get_read_db
 from core.auth import get_current_user
-from core.pagination import paginate_cursor
+from core.cache_bus import cache_bus
+from core.changes import changes_since, current_version, encode_sync_token
+from core.pagination import clamp_size, paginate_cursor
+from core.sql import row_exists
 from api.schemas.answer import (
     AnswerResponse, AnswerUpdateRequest, AnswerCommentResponse,
     AnswerCommentCreateRequest, AnswerCommentUpdateRequest
 )
-from api.schemas.base import BaseResponse, CursorPage
+from api.schemas.base import BaseResponse, ChangesPage, CursorPage
 from app.domain.question.model.answer import Answer
 from app.domain.question.model.answer_comment import AnswerComment
+from app.domain.question.repository import answer_comment_repository, answer_repository
+from app.domain.question.service import delete_service, stat_service
 from app.domain.user.model.user import User
-from typing import Optional
+from app.cache_events import THREAD_EVENT, answer_event, comment_event
+from typing import Optional, Union
 
 router = APIRouter(prefix="/answers", tags=["answers"])
 
 @router.get("/{answer_id}", response_model=AnswerResponse)
-async def get_answer(answer_id: int, db: Session = Depends(get_db)):
+async def get_answer(answer_id: int, db: Session = Depends(get_read_db)):
     answer = db.query(Answer).filter(Answer.answer_id == answer_id).first()
     if not answer:
         raise HTTPException(status_code=404, detail="Answer not found")
@@ -29,15 +36,14 @@ async def update_answer(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    answer = db.query(Answer).filter(Answer.answer_id == answer_id).first()
-    if not answer:
-        raise HTTPException(status_code=404, detail="Answer not found")
-
-    if answer.user_id != current_user.user_id:
+    # 존재/작성자 확인과 수정을 UPDATE … WHERE 한 문장으로 처리하고, 실패했을 때만 404/403 을 가린다
+    answer = answer_repository.update_answer(db, answer_id, current_user.user_id, answer_request.answer)
+    if answer is None:
+        if not row_exists(db, Answer.answer_id, answer_id):
+            raise HTTPException(status_code=404, detail="Answer not found")
         raise HTTPException(status_code=403, detail="Not authorized to update this answer")
-
-    answer.answer = answer_request.answer
     db.commit()
+    cache_bus.publish(THREAD_EVENT, **answer_event("updated", answer))
     return BaseResponse(message="Answer updated successfully", data=None)
 
 @router.delete("/{answer_id}", response_model=BaseResponse)
@@ -46,15 +52,18 @@ async def delete_answer(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    answer = db.query(Answer).filter(Answer.answer_id == answer_id).first()
+    answer = db.execute(select(Answer.user_id, Answer.question_id).where(Answer.answer_id == answer_id)).first()
     if not answer:
         raise HTTPException(status_code=404, detail="Answer not found")
 
     if answer.user_id != current_user.user_id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this answer")
 
-    db.delete(answer)
+    question_id = answer.question_id
+    delete_service.delete_answer(db, answer_id, question_id)
     db.commit()
+    stat_service.record_answer(question_id, -1)
+    cache_bus.publish(THREAD_EVENT, **answer_event("deleted", answer_id=answer_id, question_id=question_id))
     return BaseResponse(message="Answer deleted successfully", data=None)
 
 @router.post("/{answer_id}/comments", response_model=BaseResponse)
@@ -64,33 +73,39 @@ async def create_answer_comment(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    answer = db.query(Answer).filter(Answer.answer_id == answer_id).first()
-    if not answer:
+    # 답변 존재 확인은 INSERT … SELECT 의 조건으로 (별도 SELECT/refresh 없음)
+    db_comment = answer_comment_repository.insert_comment(db, answer_id, current_user.user_id, comment_request.comment)
+    if db_comment is None:
         raise HTTPException(status_code=404, detail="Answer not found")
-
-    db_comment = AnswerComment(
-        answer_id=answer_id,
-        user_id=current_user.user_id,
-        comment=comment_request.comment
-    )
-    db.add(db_comment)
     db.commit()
-    db.refresh(db_comment)
+    cache_bus.publish(THREAD_EVENT, **comment_event("created", db_comment))
     return BaseResponse(message="Comment created successfully", data=db_comment.answer_comment_id)
 
-@router.get("/{answer_id}/comments", response_model=CursorPage[AnswerCommentResponse])
+@router.get("/{answer_id}/comments", response_model=Union[CursorPage[AnswerCommentResponse], ChangesPage[AnswerCommentResponse]])
 async def get_answer_comments(
     answer_id: int,
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
-    db: Session = Depends(get_db)
+    since: Optional[str] = None,
+    db: Session = Depends(get_read_db)
 ):
+    """
+    답변의 댓글 목록. 응답의 sync_token 을 since 로 넘기면 그 이후 추가/수정/삭제된 댓글만 돌려준다.
+    """
     answer = db.query(Answer).filter(Answer.answer_id == answer_id).first()
     if not answer:
         raise HTTPException(status_code=404, detail="Answer not found")
 
+    if since:
+        changes = changes_since(db, AnswerComment, AnswerComment.answer_id, answer_id, "comment", since, clamp_size(size))
+        return ChangesPage(**changes._asdict())
+
+    sync_token = encode_sync_token(current_version(db, "comment", answer_id))
     query = db.query(AnswerComment).filter(AnswerComment.answer_id == answer_id).order_by(AnswerComment.answer_comment_id)
-    return paginate_cursor(query, cursor_id, size, AnswerComment.answer_comment_id)
+    page = paginate_cursor(query, cursor_id, size, AnswerComment.answer_comment_id, cursor=cursor)
+    page.sync_token = sync_token
+    return page
 
 @router.patch("/comments/{comment_id}", response_model=BaseResponse)
 async def update_answer_comment(
@@ -99,15 +114,13 @@ async def update_answer_comment(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    comment = db.query(AnswerComment).filter(AnswerComment.answer_comment_id == comment_id).first()
-    if not comment:
-        raise HTTPException(status_code=404, detail="Comment not found")
-
-    if comment.user_id != current_user.user_id:
+    comment = answer_comment_repository.update_comment(db, comment_id, current_user.user_id, comment_request.comment)
+    if comment is None:
+        if not row_exists(db, AnswerComment.answer_comment_id, comment_id):
+            raise HTTPException(status_code=404, detail="Comment not found")
         raise HTTPException(status_code=403, detail="Not authorized to update this comment")
-
-    comment.comment = comment_request.comment
     db.commit()
+    cache_bus.publish(THREAD_EVENT, **comment_event("updated", comment))
     return BaseResponse(message="Comment updated successfully", data=None)
 
 @router.delete("/comments/{comment_id}", response_model=BaseResponse)
@@ -116,13 +129,17 @@ async def delete_answer_comment(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    comment = db.query(AnswerComment).filter(AnswerComment.answer_comment_id == comment_id).first()
+    comment = db.execute(
+        select(AnswerComment.user_id, AnswerComment.answer_id).where(AnswerComment.answer_comment_id == comment_id)
+    ).first()
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
 
     if comment.user_id != current_user.user_id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this comment")
 
-    db.delete(comment)
+    answer_id = comment.answer_id
+    delete_service.delete_answer_comment(db, comment_id, answer_id)
     db.commit()
+    cache_bus.publish(THREAD_EVENT, **comment_event("deleted", comment_id=comment_id, answer_id=answer_id))
     return BaseResponse(message="Comment deleted successfully", data=None)
\ No newline at end of file
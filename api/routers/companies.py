@@ -1,15 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
-from core.database import get_db
+from core.database import get_db, get_read_db
+from core.auth import get_current_user
+from core.cache_bus import cache_bus
+from core.compression import precompressed_response
+from core.counts import count_total
 from core.pagination import paginate_cursor
-from api.schemas.company import CompanyCreateRequest, CompanyResponse, CompanyAnalyzeResponse, PositionResponse, JobPostingResponse
+from core.sql import row_exists
+from api.depends.auth import exact_count_allowed
+from api.schemas.company import CompanyCreateRequest, CompanyResponse, CompanyAnalyzeResponse, PositionResponse, JobPostingResponse, TechStackCountResponse, CompanyOverviewResponse
 from api.schemas.base import BaseResponse, CursorPage
 from app.domain.company.model.company import Company
 from app.domain.company.model.position import Position
 from app.domain.company.model.company_job_posting import CompanyJobPosting
 from app.domain.company.model.company_analyze import CompanyAnalyze
 from app.domain.company.model.tech_stack import TechStack
-from typing import Optional
+from app.domain.company.model.job_posting_position import JobPostingPosition
+from app.domain.user.model.user import User
+from app.domain.user.model.user_position import UserPosition
+from app.domain.company.repository.company_repository import (
+    CompanyRow, JobPostingRow, insert_company, select_company_rows, select_job_posting_rows, with_tech_stacks,
+)
+from app.domain.company.service import catalog_service, delete_service, overview_service, tech_stack_service
+from app.cache_events import COMPANIES_CHANGED
+from typing import List, Optional
 
 router = APIRouter(prefix="/companies", tags=["companies"])
 
@@ -17,17 +32,21 @@ router = APIRouter(prefix="/companies", tags=["companies"])
 @router.get("/", response_model=CursorPage[CompanyResponse])
 async def get_companies(
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
     name: Optional[str] = None,
-    db: Session = Depends(get_db)
+    with_total: bool = False,
+    exact: bool = Depends(exact_count_allowed),
+    db: Session = Depends(get_read_db)
 ):
-    query = db.query(Company)
-
-    if name:
-        query = query.filter(Company.company_name.ilike(f"%{name}%"))
-
-    query = query.order_by(Company.company_id)
-    return paginate_cursor(query, cursor_id, size, Company.company_id)
+    # 응답 컬럼만 읽어 slots 객체로 담는다 (ORM 인스턴스 생성/identity map 등록 없음)
+    query = select_company_rows(name)
+    page = paginate_cursor(query, cursor_id, size, Company.company_id, cursor=cursor, db=db, to_value=CompanyRow.of)
+    if with_total:
+        page.total, page.total_exact = count_total(
+            db, query, "company", Company.company_id, (name,), exact=exact, filtered=bool(name)
+        )
+    return page
 
 @router.post("", response_model=BaseResponse)
 @router.post("/", response_model=BaseResponse)
@@ -38,88 +57,110 @@ async def create_company(
     """
     회사를 생성합니다.
     """
-    # 중복 회사명 검사
-    existing_company = db.query(Company).filter(
-        Company.company_name == company_request.company_name
-    ).first()
-
-    if existing_company:
+    # 중복 회사명 검사와 생성을 INSERT … SELECT WHERE NOT EXISTS 한 문장으로
+    company_id = insert_company(db, company_request.company_name)
+    if company_id is None:
         raise HTTPException(status_code=400, detail="Company with this name already exists")
-
-    # 회사 생성
-    company = Company(company_name=company_request.company_name)
-    db.add(company)
     db.commit()
-    db.refresh(company)
+    cache_bus.publish(COMPANIES_CHANGED, company_ids=[company_id], deleted=False)
 
-    return BaseResponse(message="Company created successfully", data=company.company_id)
+    return BaseResponse(message="Company created successfully", data=company_id)
 
 @router.get("/analyze", response_model=CursorPage[CompanyAnalyzeResponse])
 async def get_company_analyses(
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     회사 분석(Company Analyze) 목록을 조회합니다.
     
     - cursor_id: 커서 기반 페이지네이션을 위한 마지막 company_analyze_id
+    - cursor: 이전 응답의 next_cursor/prev_cursor (있으면 cursor_id 대신 사용)
     - size: 페이지 크기 (기본값: 20)
     """
     query = db.query(CompanyAnalyze).order_by(CompanyAnalyze.company_analyze_id)
-    return paginate_cursor(query, cursor_id, size, CompanyAnalyze.company_analyze_id)
+    return paginate_cursor(query, cursor_id, size, CompanyAnalyze.company_analyze_id, cursor=cursor)
 
 @router.get("/analyze/{analyze_id}", response_model=CompanyAnalyzeResponse)
-async def get_company_analyze(analyze_id: int, db: Session = Depends(get_db)):
+async def get_company_analyze(analyze_id: int, request: Request, db: Session = Depends(get_read_db)):
     """
     특정 회사 분석(Company Analyze)을 단건 조회합니다.
     
     - analyze_id: 분석 ID (company_analyze_id)
+
+    분석 결과는 생성 후 바뀌지 않으므로 인코딩별로 미리 압축한 본문을 캐시해 돌려줍니다.
     """
-    analyze = db.query(CompanyAnalyze).filter(
-        CompanyAnalyze.company_analyze_id == analyze_id
-    ).first()
-    if not analyze:
-        raise HTTPException(status_code=404, detail="Company analyze not found")
-    return analyze
+    def build_body():
+        analyze = db.query(CompanyAnalyze).filter(
+            CompanyAnalyze.company_analyze_id == analyze_id
+        ).first()
+        if not analyze:
+            raise HTTPException(status_code=404, detail="Company analyze not found")
+        return CompanyAnalyzeResponse.model_validate(analyze).model_dump_json().encode()
+
+    return precompressed_response(request, ("company_analyze", analyze_id), build_body)
 
 @router.get("/job-postings", response_model=CursorPage[JobPostingResponse])
 async def get_job_postings(
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
     company_name: Optional[str] = None,
     employment_type: Optional[str] = None,
     work_location: Optional[str] = None,
-    db: Session = Depends(get_db)
+    with_total: bool = False,
+    exact: bool = Depends(exact_count_allowed),
+    db: Session = Depends(get_read_db)
 ):
     """
     채용공고(Job Posting) 목록을 조회합니다.
     
     - cursor_id: 커서 기반 페이지네이션을 위한 마지막 company_job_posting_id
+    - cursor: 이전 응답의 next_cursor/prev_cursor (있으면 cursor_id 대신 사용)
     - size: 페이지 크기 (기본값: 20)
     - company_name: 회사명으로 필터링 (부분 검색)
     - employment_type: 고용 형태로 필터링
     - work_location: 근무 지역으로 필터링
+    - with_total: 전체 개수(total) 포함 여부 (큰 테이블은 추정값, total_exact로 구분)
+    - exact: 추정 대신 정확한 개수를 계산 (admin 만, 그 외에는 무시)
     """
-    query = db.query(CompanyJobPosting).options(selectinload(CompanyJobPosting.tech_stacks))
-
-    # 회사명으로 필터링 (조인 필요)
-    if company_name:
-        query = query.join(Company).filter(Company.company_name.ilike(f"%{company_name}%"))
-    
-    # 고용 형태로 필터링
-    if employment_type:
-        query = query.filter(CompanyJobPosting.employment_type.ilike(f"%{employment_type}%"))
-    
-    # 근무 지역으로 필터링
-    if work_location:
-        query = query.filter(CompanyJobPosting.work_location.ilike(f"%{work_location}%"))
-
-    query = query.order_by(CompanyJobPosting.company_job_posting_id)
-    return paginate_cursor(query, cursor_id, size, CompanyJobPosting.company_job_posting_id)
+    # 회사명(조인)/고용 형태/근무 지역 필터. 응답 컬럼만 읽고 기술스택은 IN 쿼리 한 번으로 붙인다.
+    query = select_job_posting_rows(company_name, employment_type, work_location)
+    page = paginate_cursor(
+        query, cursor_id, size, CompanyJobPosting.company_job_posting_id, cursor=cursor, db=db, to_value=JobPostingRow.of
+    )
+    with_tech_stacks(db, page.values)
+    if with_total:
+        filters = (company_name, employment_type, work_location)
+        page.total, page.total_exact = count_total(
+            db, query, "company_job_posting", CompanyJobPosting.company_job_posting_id, filters,
+            exact=exact, filtered=any(filters),
+        )
+    return page
+
+@router.get("/job-postings/my-position", response_model=CursorPage[JobPostingResponse])
+async def get_my_position_job_postings(
+    cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    size: int = 20,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    사용자의 직무 키워드가 매칭된 채용공고 목록을 조회합니다.
+    """
+    my_position_ids = select(UserPosition.position_id).where(UserPosition.user_id == current_user.user_id)
+    query = db.query(CompanyJobPosting).options(selectinload(CompanyJobPosting.tech_stacks)).filter(
+        CompanyJobPosting.company_job_posting_id.in_(
+            select(JobPostingPosition.company_job_posting_id).where(JobPostingPosition.position_id.in_(my_position_ids))
+        )
+    ).order_by(CompanyJobPosting.company_job_posting_id)
+    return paginate_cursor(query, cursor_id, size, CompanyJobPosting.company_job_posting_id, cursor=cursor)
 
 @router.get("/job-postings/{job_posting_id}", response_model=JobPostingResponse)
-async def get_job_posting(job_posting_id: int, db: Session = Depends(get_db)):
+async def get_job_posting(job_posting_id: int, db: Session = Depends(get_read_db)):
     """
     특정 채용공고(Job Posting)를 조회합니다.
     """
@@ -132,35 +173,72 @@ async def get_job_posting(job_posting_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Job posting not found")
     return job_posting
 
+@router.get("/tech-stacks", response_model=List[TechStackCountResponse])
+async def get_tech_stack_ranking(
+    position_id: Optional[int] = None,
+    limit: int = 20,
+    db: Session = Depends(get_read_db)
+):
+    """
+    채용공고에서 많이 요구하는 기술스택 순위를 조회합니다.
+    "React.js"/"react"처럼 표기만 다른 기술은 하나로 묶어 셉니다.
+
+    - position_id: 해당 직무로 태깅된 채용공고만 집계
+    """
+    return tech_stack_service.top_tech_stacks(db, position_id=position_id, limit=limit)
+
 @router.get("/{company_id}", response_model=CompanyResponse)
-async def get_company(company_id: int, db: Session = Depends(get_db)):
-    company = db.query(Company).filter(Company.company_id == company_id).first()
+async def get_company(company_id: int, db: Session = Depends(get_read_db)):
+    company = catalog_service.get_companies_by_id().get(company_id)
+    if not company:
+        # 다른 워커에서 방금 생성된 회사일 수 있으므로 캐시에 없으면 DB에서 확인
+        company = db.query(Company).filter(Company.company_id == company_id).first()
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
     return company
 
+@router.get("/{company_id}/overview", response_model=CompanyOverviewResponse)
+async def get_company_overview(company_id: int, db: Session = Depends(get_read_db)):
+    """
+    회사 페이지에 필요한 정보를 한 번에 조회합니다.
+    회사 정보, 연도/태그별 질문 수, 최신 분석 요약, 진행 중인 채용공고, 많이 쓰는 기술스택을 포함합니다.
+    """
+    overview = overview_service.get_overview(db, company_id)
+    if overview is None:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return CompanyOverviewResponse.model_validate(overview)
+
 @router.delete("/{company_id}", response_model=BaseResponse)
 async def delete_company(company_id: int, db: Session = Depends(get_db)):
-    company = db.query(Company).filter(Company.company_id == company_id).first()
-    if not company:
+    if not row_exists(db, Company.company_id, company_id):
         raise HTTPException(status_code=404, detail="Company not found")
 
-    db.delete(company)
+    delete_service.delete_company(db, company_id)
     db.commit()
+    cache_bus.publish(COMPANIES_CHANGED, company_ids=[company_id], deleted=True)
     return BaseResponse(message="Company deleted successfully", data=None)
 
+@router.get("/{company_id}/tech-stacks", response_model=List[TechStackCountResponse])
+async def get_company_tech_stacks(company_id: int, limit: int = 20, db: Session = Depends(get_read_db)):
+    """
+    회사 채용공고에서 많이 요구하는 기술스택 순위를 조회합니다.
+    """
+    return tech_stack_service.top_tech_stacks(db, company_id=company_id, limit=limit)
+
 @router.get("/{company_id}/analyze", response_model=CursorPage[CompanyAnalyzeResponse])
 async def get_company_analyses_by_company(
     company_id: int,
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     특정 회사의 분석(Company Analyze) 목록을 조회합니다.
     
     - company_id: 회사 ID
     - cursor_id: 커서 기반 페이지네이션을 위한 마지막 company_analyze_id
+    - cursor: 이전 응답의 next_cursor/prev_cursor (있으면 cursor_id 대신 사용)
     - size: 페이지 크기 (기본값: 20)
     """
     # 회사 존재 확인
@@ -172,4 +250,4 @@ async def get_company_analyses_by_company(
         CompanyAnalyze.company_id == company_id
     ).order_by(CompanyAnalyze.company_analyze_id)
     
-    return paginate_cursor(query, cursor_id, size, CompanyAnalyze.company_analyze_id)
+    return paginate_cursor(query, cursor_id, size, CompanyAnalyze.company_analyze_id, cursor=cursor)
@@ -0,0 +1,108 @@
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from core.push_hub import PUSH_HEARTBEAT_SECONDS, HubFull, push_hub
+from typing import List
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# 연결이 끊겼을 때 클라이언트가 재연결을 시도할 간격 (ms)
+SSE_RETRY_MS = 3000
+
+
+def _channels(question_ids: List[int], answer_ids: List[int]) -> List[str]:
+    return [f"question:{question_id}" for question_id in question_ids] + [f"answer:{answer_id}" for answer_id in answer_ids]
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    question_id: List[int] = Query(default=[]),
+    answer_id: List[int] = Query(default=[]),
+):
+    """
+    Server-Sent Events. question_id 를 구독하면 답변 추가/수정/삭제를, answer_id 를 구독하면 댓글 이벤트를 받는다.
+    resync 이벤트를 받으면 (버퍼가 넘쳐 이벤트를 잃음) 목록 API 에 since 로 변경분을 조회한다.
+    """
+    channels = _channels(question_id, answer_id)
+    if not channels:
+        raise HTTPException(status_code=400, detail="Subscribe to at least one question_id or answer_id")
+    try:
+        subscription = push_hub.connect()
+    except HubFull:
+        raise HTTPException(status_code=503, detail="Too many subscribers, retry later", headers={"Retry-After": "5"})
+    try:
+        push_hub.subscribe(subscription, channels)
+    except ValueError as e:
+        push_hub.disconnect(subscription)
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def events():
+        try:
+            yield f"retry: {SSE_RETRY_MS}\nevent: ready\ndata: {json.dumps({'channels': channels})}\n\n"
+            while True:
+                message = await subscription.next()
+                if message is None:
+                    return
+                name, data = message
+                if name == "ping":
+                    if await request.is_disconnected():
+                        return
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {name}\ndata: {data}\n\n"
+        finally:
+            push_hub.disconnect(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def websocket_events(websocket: WebSocket):
+    """
+    WebSocket 구독. 클라이언트는 {"subscribe": ["question:1", "answer:3"]} / {"unsubscribe": [...]} 를 보내고,
+    서버는 SSE 와 같은 이벤트 JSON 을 보낸다 (하트비트는 {"type": "ping"}).
+    """
+    try:
+        subscription = push_hub.connect()
+    except HubFull:
+        await websocket.close(code=1013)
+        return
+    await websocket.accept()
+
+    async def receive_commands():
+        while True:
+            text = await websocket.receive_text()
+            try:
+                command = json.loads(text)
+                push_hub.subscribe(subscription, command.get("subscribe", []))
+                push_hub.unsubscribe(subscription, command.get("unsubscribe", []))
+            except (ValueError, AttributeError) as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                continue
+            await websocket.send_json({"type": "subscribed", "channels": sorted(subscription.channels)})
+
+    async def send_events():
+        while True:
+            message = await subscription.next(PUSH_HEARTBEAT_SECONDS)
+            if message is None:
+                await websocket.close(code=1001)
+                return
+            name, data = message
+            await websocket.send_text(json.dumps({"type": "ping"}) if name == "ping" else data)
+
+    tasks = [asyncio.create_task(receive_commands()), asyncio.create_task(send_events())]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() and not isinstance(task.exception(), (WebSocketDisconnect, RuntimeError)):
+                raise task.exception()
+    finally:
+        for task in tasks:
+            task.cancel()
+        push_hub.disconnect(subscription)
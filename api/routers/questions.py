@@ -1,58 +1,70 @@
-from charset_normalizer import from_bytes
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import case
-from core.database import get_db
+from sqlalchemy import case, literal, select
+from core.database import get_db, get_read_db
 from core.auth import get_current_user
-from core.pagination import paginate_cursor
-from api.schemas.question import QuestionResponse, QuestionCreateRequest, QuestionUpdateRequest
+from core.cache_bus import cache_bus
+from core.changes import changes_since, current_version, encode_sync_token
+from core.counts import count_total
+from core.pagination import SortKey, clamp_size, encode_cursor, paginate_cursor, paginate_keyset
+from core.sql import row_exists
+from api.depends.auth import exact_count_allowed
+from api.schemas.question import QuestionResponse, QuestionCreateRequest, QuestionUpdateRequest, SimilarQuestionResponse
 from api.schemas.answer import AnswerResponse, AnswerCreateRequest
-from api.schemas.base import BaseResponse, CursorPage
-from app.domain.question.model.question import Question
+from api.schemas.base import BaseResponse, ChangesPage, CursorPage
+from app.domain.question.model.question import Question, QuestionTag
 from app.domain.question.model.answer import Answer
+from app.domain.question.model.question_position import QuestionPosition
+from app.domain.question.model.question_similarity import QuestionSimilarity
+from app.domain.question.model.question_stat import QuestionStat
+from app.domain.question.service import dedup_service, delete_service, import_service, similarity_service, stat_service
+from app.domain.question.service.export_service import EXPORT_WRITERS, EXPORT_MEDIA_TYPES
+from app.domain.question.repository import answer_repository, question_repository
+from app.domain.question.repository.answer_repository import AnswerRow, select_answer_rows
+from app.domain.question.repository.question_repository import QuestionRow, question_filters, select_question_rows
 from app.domain.user.model.user import User
 from app.domain.company.model.company import Company
+from app.cache_events import COMPANIES_CHANGED, QUESTIONS_CHANGED, THREAD_EVENT, answer_event
+from app.domain.company.service import position_keyword_service
 from app.domain.user.model.user_position import UserPosition
 from app.domain.user.model.goal_company import GoalCompany
 from app.domain.company.model.position import Position
-from typing import Optional
-import csv
+from typing import List, Literal, Optional, Union
 import io
 from datetime import date
-import re
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
-def normalize_company_name(company_name: str) -> str:
-    """회사명을 정규화합니다."""
-    # 공백 제거 및 소문자 변환
-    normalized = company_name.strip()
-
-    # 주식회사, (주), 회사 등 불필요한 접미사 제거
-    suffixes = ['주식회사', '(주)', '㈜', '회사', 'Inc', 'inc', 'Corp', 'corp', 'Co.', 'co.', 'Ltd', 'ltd', '(최종면접)', '(기술면접)', '(2차면접)', '(비대면면접)', 'ai 면접', '(컬쳐핏)', ]
-    for suffix in suffixes:
-        if normalized.endswith(suffix):
-            normalized = normalized[:-len(suffix)].strip()
-
-    # 특수문자 제거 (일부만)
-    normalized = re.sub(r'[^\w가-힣\s]', '', normalized)
-
-    return normalized.strip()
-
 @router.post("/single", response_model=BaseResponse)
 async def create_question(
     question_request: QuestionCreateRequest,
+    background_tasks: BackgroundTasks,
+    on_duplicate: Literal["flag", "skip", "allow"] = "flag",
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     질문을 단건 등록합니다.
+
+    - on_duplicate: 비슷한 질문이 이미 있을 때의 처리
+      - flag: 등록하고 data.duplicate_of에 유사 질문 id를 돌려줌 (기본값)
+      - skip: 등록하지 않고 409 반환
+      - allow: 검사하지 않음
     """
     # 회사 존재 확인
-    company = db.query(Company).filter(Company.company_id == question_request.company_id).first()
-    if not company:
+    if not row_exists(db, Company.company_id, question_request.company_id):
         raise HTTPException(status_code=404, detail="Company not found")
 
+    # 유사 질문 검사
+    signature, duplicates = None, []
+    if on_duplicate != "allow":
+        signature, duplicates = dedup_service.find_duplicates(db, question_request.question)
+        if duplicates and on_duplicate == "skip":
+            raise HTTPException(status_code=409, detail="Similar question already exists")
+    else:
+        signature = dedup_service.minhash(question_request.question)
+
     # 질문 생성
     question = Question(
         registrant_id=current_user.user_id,
@@ -64,9 +76,22 @@ async def create_question(
     )
 
     db.add(question)
+    db.flush()
+    dedup_service.save_signatures(db, [(question.question_id, signature)])
+    position_keyword_service.tag_questions(db, [question])
+    stat_service.create_stats(db, [question.question_id])
     db.commit()
-    db.refresh(question)
+    dedup_service.index_signatures([(question.question_id, signature)])
+    cache_bus.publish(
+        QUESTIONS_CHANGED, question_ids=[question.question_id], company_ids=[question_request.company_id], deleted=False
+    )
+    background_tasks.add_task(similarity_service.refresh_questions, [question.question_id])
 
+    if duplicates:
+        return BaseResponse(
+            message="질문 등록 성공 (유사 질문 있음)",
+            data={"duplicate_of": [question_id for question_id, _ in duplicates]}
+        )
     return BaseResponse(message="질문 등록 성공", data=None)
 
 @router.get("/sample-csv")
@@ -93,21 +118,60 @@ async def download_sample_csv():
         }
     )
 
+@router.get("/export")
+async def export_questions(
+    format: Literal["csv", "ndjson", "xlsx"] = "csv",
+    search: Optional[str] = None,
+    company_name: Optional[str] = None,
+    question_at: Optional[str] = None,
+    tag: Optional[QuestionTag] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    질문을 CSV / NDJSON / XLSX로 내보냅니다.
+    Admin만 접근 가능합니다.
+    필터는 질문 목록 조회와 같고, CSV/XLSX는 업로드 형식(company,question,category,question_at)과 호환됩니다.
+    결과는 서버 사이드 커서에서 바로 스트리밍되므로 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    from fastapi.responses import StreamingResponse
+
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    conditions = question_filters(search, company_name, question_at, tag)
+    return StreamingResponse(
+        EXPORT_WRITERS[format](conditions),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f"attachment; filename=questions.{format}"
+        }
+    )
+
 @router.post("", response_model=BaseResponse)
 @router.post("/", response_model=BaseResponse)
 async def create_questions_from_csv(
+    background_tasks: BackgroundTasks,
     question: UploadFile = File(...),
+    on_duplicate: Literal["flag", "skip", "allow"] = "flag",
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    CSV 파일을 업로드하여 질문들을 bulk insert합니다.
+    CSV/XLSX 파일, 또는 CSV/XLSX 여러 개를 묶은 ZIP 파일을 업로드하여 질문들을 bulk insert합니다.
     Admin만 접근 가능합니다.
     CSV 형식: company,question,category,question_at
     - question: 면접 질문, 꼬리 질문들이 많음
     - category: 지원 분야
     - company: 지원 회사명
     - question_at: 몇 학년도 데이터인지
+
+    ZIP 안의 파일들은 워커 프로세스에서 병렬로 파싱한 뒤 한 트랜잭션으로 넣습니다.
+    한 파일이라도 형식이 잘못되면 아무것도 등록하지 않고 파일별 오류를 돌려줍니다.
+
+    - on_duplicate: 기존 질문 또는 같은 업로드 안의 질문과 거의 같은 질문 처리
+      - flag: 등록하고 개수만 집계 (기본값)
+      - skip: 등록하지 않음
+      - allow: 검사하지 않음
     """
     # Admin 권한 체크
     if current_user.role != "admin":
@@ -115,83 +179,50 @@ async def create_questions_from_csv(
 
     # 파일 형식 검증
     filename = question.filename.lower()
-    if not filename.endswith('.csv') and not filename.endswith('.xlsx'):
-        raise HTTPException(status_code=400, detail="CSV or XLSX file required")
+    if not filename.endswith(('.csv', '.xlsx', '.zip')):
+        raise HTTPException(status_code=400, detail="CSV, XLSX or ZIP file required")
 
     try:
         content = await question.read()
-        
-        # 파일 형식에 따라 처리
-        if filename.endswith('.xlsx'):
-            # XLSX 파일 처리
-            import openpyxl
-            workbook = openpyxl.load_workbook(io.BytesIO(content))
-            sheet = workbook.active
-            
-            # 헤더 추출 (첫 번째 행)
-            headers = [cell.value for cell in sheet[1]]
-            
-            # 데이터 행을 딕셔너리로 변환
-            rows = []
-            for row_cells in sheet.iter_rows(min_row=2, values_only=True):
-                row_dict = dict(zip(headers, row_cells))
-                rows.append(row_dict)
+        # ZIP 해제와 DB 적재/커밋은 동기 작업이므로 스레드 풀에서 (이벤트 루프를 막지 않도록)
+        if filename.endswith('.zip'):
+            files = await run_in_threadpool(import_service.extract_archive, content)
         else:
-            # CSV 파일 읽기 (한글 지원)
-            encoding = from_bytes(content).best().encoding or "utf-8"
-            csv_content = content.decode(encoding, errors="replace")
-            csv_reader = csv.DictReader(io.StringIO(csv_content))
-            rows = list(csv_reader)
-        
-        questions_to_insert = []
-        for row in rows:
-            # 필수 필드 검증
-            if not all(key in row for key in ['company', 'question', 'category', 'question_at']):
-                raise HTTPException(status_code=400, detail="CSV must contain: company, question, category, question_at")
-
-            # 회사명 전처리
-            normalized_company_name = normalize_company_name(row['company'])
-
-            # 회사 조회 또는 생성
-            company = db.query(Company).filter(Company.company_name == normalized_company_name).first()
-            if not company:
-                company = Company(company_name=normalized_company_name)
-                db.add(company)
-                db.flush()  # ID를 얻기 위해 flush
-
-            # tag 자동 분류 (기본값: tenacity)
-            tag = "technology" if "기술" in row['category'] or "개발" in row['category'] else "tenacity"
-
-            question_obj = Question(
-                registrant_id=current_user.user_id,
-                company_id=company.company_id,
-                question=row['question'],
-                category=row['category'],
-                tag=tag,
-                question_at=date(int(row['question_at']), 1, 1)  # 년도를 Date로 변환
-            )
-            questions_to_insert.append(question_obj)
-
-        # Bulk insert
-        db.add_all(questions_to_insert)
-        db.commit()
-
-        return BaseResponse(message="질문 등록 성공.", data=None)
-
+            files = [(question.filename, content)]
+        # 인코딩 감지/XLSX 파싱/시그니처 계산은 이벤트 루프 밖(프로세스 풀)에서
+        parsed = await import_service.parse_files(files)
+        result = await run_in_threadpool(import_service.load_questions, db, current_user.user_id, parsed, on_duplicate)
+        await run_in_threadpool(db.commit)
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=400, detail=f"CSV processing failed: {str(e)}")
 
+    dedup_service.index_signatures(result.signatures)
+    # 업로드 중 새 회사가 생겼을 수 있으므로 회사 캐시도 무효화
+    cache_bus.publish(COMPANIES_CHANGED, company_ids=result.company_ids, deleted=False)
+    cache_bus.publish(QUESTIONS_CHANGED, question_ids=result.question_ids, company_ids=result.company_ids, deleted=False)
+    background_tasks.add_task(similarity_service.refresh_questions, result.question_ids)
+
+    data = {"inserted": len(result.question_ids), "skipped_duplicates": result.skipped, "flagged_duplicates": result.flagged}
+    if filename.endswith('.zip'):
+        data["files"] = result.files
+    return BaseResponse(message="질문 등록 성공.", data=data)
+
 @router.get("", response_model=CursorPage[QuestionResponse])
 @router.get("/", response_model=CursorPage[QuestionResponse])
 async def get_questions(
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
     search: Optional[str] = None,
     company_name: Optional[str] = None,
     question_at: Optional[str] = None,
+    tag: Optional[QuestionTag] = None,
+    sort: Literal["priority", "popular"] = "priority",
+    with_total: bool = False,
+    exact: bool = Depends(exact_count_allowed),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     질문 목록을 조회합니다.
@@ -199,12 +230,22 @@ async def get_questions(
     - search: 질문 내용 전체 검색 (LIKE 검색)
     - company_name: 회사명으로 필터링 (부분 검색)
     - question_at: 학년도로 필터링 (예: 2024)
+    - tag: 질문 태그로 필터링
+    - with_total: 전체 개수(total) 포함 여부 (큰 테이블은 추정값, total_exact로 구분)
+    - exact: 추정 대신 정확한 개수를 계산 (admin 만, 그 외에는 무시)
+    - sort: priority(기본, 아래 우선순위 정렬) 또는 popular(인기순)
 
     우선순위 정렬:
     - Goal Company 매칭: +2점 (사용자가 등록한 목표 회사)
     - User Position 매칭: +1점 (질문 category에 사용자의 직무명 포함)
     - 점수 내림차순 → question_id 내림차순
+
+    인기순 정렬:
+    - 조회수 + 답변 수 가중합(question_stat.score) 내림차순 → question_id 내림차순
+    - 집계는 워커가 주기적으로 반영하므로 수 초 늦을 수 있다 (조회/답변이 없는 질문은 점수 0 으로 맨 뒤에)
     """
+    if sort == "popular":
+        return _get_popular_questions(cursor, size, search, company_name, question_at, tag, with_total, exact, db)
 
     # 사용자의 goal_company 목록 조회 (list로 변환)
     user_goal_company_ids = [
@@ -223,7 +264,7 @@ async def get_questions(
     # position 이름 리스트 생성
     position_names = [pos.position_name for pos in user_positions if pos.position_name]
 
-    # 우선순위 점수 계산
+    # 우선순위 점수 계산 (매칭 대상이 없으면 상수 0, SQL 식으로 유지해야 정렬/seek 조건에 쓸 수 있다)
     # Goal Company 매칭: +2점
     if user_goal_company_ids:
         goal_company_score = case(
@@ -231,7 +272,7 @@ async def get_questions(
             else_=0
         )
     else:
-        goal_company_score = 0
+        goal_company_score = literal(0)
 
     # User Position 매칭: +1점
     if position_names:
@@ -242,86 +283,164 @@ async def get_questions(
             else_=0
         )
     else:
-        position_score = 0
+        position_score = literal(0)
 
     # 총 우선순위 점수
     priority_score = goal_company_score + position_score
 
-    # 쿼리 구성
-    query = db.query(Question)
-
-    # 전체 검색 - 질문 내용에서 검색
-    if search:
-        query = query.filter(Question.question.ilike(f"%{search}%"))
-
-    # 회사명 필터 (부분 검색) - left outer join으로 안전하게 처리
-    if company_name:
-        from sqlalchemy.orm import aliased
-        company_alias = aliased(Company)
-        query = query.outerjoin(company_alias, Question.company_id == company_alias.company_id)
-        query = query.filter(company_alias.company_name.ilike(f"%{company_name}%"))
-
-    # 학년도 필터 (부분 검색)
-    if question_at:
-        from sqlalchemy import cast, String
-        query = query.filter(cast(Question.question_at, String).ilike(f"%{question_at}%"))
-
-    # 우선순위 점수를 추가하여 조회
-    query = query.add_columns(priority_score.label('priority'))
-
-    # 우선순위 점수 내림차순 → question_id 내림차순 정렬
-    query = query.order_by(priority_score.desc(), Question.question_id.desc())
-
-    # 전체 데이터 조회
-    all_results = query.all()
+    # 쿼리 구성 (검색/회사명/학년도/태그 필터)
+    # 응답 컬럼만 읽어 slots 객체로 담는다 (ORM 인스턴스 생성/identity map 등록 없음)
+    query = select_question_rows(*question_filters(search, company_name, question_at, tag))
+
+    # 우선순위 점수 내림차순 → question_id 내림차순 keyset 페이지네이션
+    # (전체를 읽어 메모리에서 자르지 않고, 정렬 키 (점수, id) 다음부터 size + 1 건만 읽는다)
+    keys = [SortKey(priority_score, descending=True, name="priority"), SortKey(Question.question_id, descending=True)]
+    if not cursor and cursor_id is not None:
+        # 예전 클라이언트의 cursor_id(마지막 question_id)는 그 질문의 점수를 조회해 커서로 바꾼다
+        priority = db.query(priority_score).filter(Question.question_id == cursor_id).scalar()
+        if priority is not None:
+            cursor = encode_cursor(keys, [priority, cursor_id])
+
+    page = paginate_keyset(
+        query.add_columns(priority_score.label("priority")),
+        keys,
+        cursor,
+        size,
+        key_of=lambda row: [row.priority, row.question_id],
+        to_value=QuestionRow.of,
+        db=db,
+    )
+    if with_total:
+        # 점수는 정렬에만 쓰이므로 개수는 필터 값만으로 캐시한다
+        filters = (search, company_name, question_at, tag)
+        page.total, page.total_exact = count_total(
+            db, query, "question", Question.question_id, filters, exact=exact, filtered=any(filters)
+        )
+    return page
 
-    # 메모리에서 페이지네이션 처리
-    # (우선순위 정렬이 적용된 상태에서 안전하게 페이지네이션)
-    start_index = 0
-    if cursor_id is not None:
-        # cursor_id를 찾아서 그 다음부터 시작
-        for idx, (q, _) in enumerate(all_results):
-            if q.question_id == cursor_id:
-                start_index = idx + 1
-                break
+def _get_popular_questions(cursor, size, search, company_name, question_at, tag, with_total, exact, db: Session):
+    # question_stat 의 (score, question_id) 인덱스를 내림차순으로 읽으며 질문을 조인한다
+    query = select_question_rows(*question_filters(search, company_name, question_at, tag)).join(
+        QuestionStat, QuestionStat.question_id == Question.question_id
+    )
+    keys = [SortKey(QuestionStat.score, descending=True, name="score"), SortKey(QuestionStat.question_id, descending=True)]
+    page = paginate_keyset(
+        query.add_columns(QuestionStat.score.label("score")),
+        keys,
+        cursor,
+        size,
+        key_of=lambda row: [row.score, row.question_id],
+        to_value=QuestionRow.of,
+        db=db,
+    )
+    if with_total:
+        # 인기순 목록은 집계가 있는 질문만이라 개수 캐시 키를 따로 둔다
+        filters = ("popular", search, company_name, question_at, tag)
+        page.total, page.total_exact = count_total(
+            db, query, "question", Question.question_id, filters, exact=exact, filtered=True
+        )
+    return page
 
-    # 페이지 슬라이싱
-    page_results = all_results[start_index:start_index + size + 1]
-    questions = [q[0] for q in page_results]
+@router.get("/duplicates", response_model=BaseResponse)
+async def get_duplicate_report(
+    threshold: float = dedup_service.DUPLICATE_THRESHOLD,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    기존 질문 전체에서 거의 같은 질문 묶음을 찾아 큰 묶음부터 보여줍니다.
+    Admin만 접근 가능합니다.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
 
-    # has_next 판단
-    has_next = len(questions) > size
-    values = questions[:size]
+    return BaseResponse(message="중복 질문 리포트", data=dedup_service.duplicate_report(db, threshold, limit))
 
-    # CursorPage 응답 생성
-    return CursorPage(values=values, has_next=has_next)
+@router.get("/my-position", response_model=CursorPage[QuestionResponse])
+async def get_my_position_questions(
+    cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    size: int = 20,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    사용자의 직무 키워드가 매칭된 질문 목록을 조회합니다.
+    직무 태그(question_position)는 질문 저장 시점에 키워드 자동자로 매겨 둡니다.
+    """
+    my_position_ids = select(UserPosition.position_id).where(UserPosition.user_id == current_user.user_id)
+    query = db.query(Question).filter(Question.question_id.in_(
+        select(QuestionPosition.question_id).where(QuestionPosition.position_id.in_(my_position_ids))
+    )).order_by(Question.question_id)
+    return paginate_cursor(query, cursor_id, size, Question.question_id, cursor=cursor)
 
 @router.get("/{question_id}", response_model=QuestionResponse)
-async def get_question(question_id: int, db: Session = Depends(get_db)):
+async def get_question(question_id: int, db: Session = Depends(get_read_db)):
     question = db.query(Question).filter(Question.question_id == question_id).first()
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
+    # 조회수는 메모리에만 더하고 주기적으로 question_stat 에 반영한다 (요청 중 쓰기 없음)
+    stat_service.record_view(question_id)
     return question
 
-@router.patch("/{question_id}", response_model=BaseResponse)
-async def update_question(
+@router.get("/{question_id}/similar", response_model=List[SimilarQuestionResponse])
+async def get_similar_questions(
     question_id: int,
-    question_request: QuestionUpdateRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    size: int = similarity_service.SIMILAR_TOP_K,
+    db: Session = Depends(get_read_db)
 ):
+    """
+    다른 회사의 유사 질문을 유사도 순으로 조회합니다.
+    미리 계산된 question_similarity 테이블에서 읽고, 아직 계산되지 않은 질문은 메모리 인덱스에서 찾습니다.
+    """
     question = db.query(Question).filter(Question.question_id == question_id).first()
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
 
-    if not current_user.role == "admin":
-        if question.registrant_id != current_user.user_id:
-            raise HTTPException(status_code=403, detail="Not authorized to update this question")
+    rows = (
+        db.query(Question, QuestionSimilarity.score)
+        .join(QuestionSimilarity, QuestionSimilarity.similar_question_id == Question.question_id)
+        .filter(QuestionSimilarity.question_id == question_id)
+        .order_by(QuestionSimilarity.score.desc())
+        .limit(size)
+        .all()
+    )
+
+    index = similarity_service.get_loaded_index()
+    if not rows and index is not None:
+        neighbors = dict(index.neighbors(question_id, size))
+        if neighbors:
+            questions = db.query(Question).filter(Question.question_id.in_(list(neighbors))).all()
+            rows = sorted(((q, neighbors[q.question_id]) for q in questions), key=lambda row: -row[1])
 
-    question.question = question_request.question
-    question.category = question_request.category
-    question.tag = question_request.tag
+    return [SimilarQuestionResponse(question=QuestionResponse.model_validate(q), score=score) for q, score in rows]
+
+@router.patch("/{question_id}", response_model=BaseResponse)
+async def update_question(
+    question_id: int,
+    question_request: QuestionUpdateRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    # 존재/권한 확인과 수정을 UPDATE … WHERE 한 문장으로 처리하고, 실패했을 때만 404/403 을 가린다
+    question = question_repository.update_question(
+        db, question_id, current_user.user_id, current_user.role == "admin",
+        question_request.question, question_request.category, question_request.tag,
+    )
+    if question is None:
+        if not row_exists(db, Question.question_id, question_id):
+            raise HTTPException(status_code=404, detail="Question not found")
+        raise HTTPException(status_code=403, detail="Not authorized to update this question")
+
+    signature = dedup_service.minhash(question_request.question)
+    dedup_service.update_signature(db, question_id, signature)
+    position_keyword_service.tag_questions(db, [question])
     db.commit()
+    dedup_service.index_signatures([(question_id, signature)])
+    cache_bus.publish(QUESTIONS_CHANGED, question_ids=[question_id], company_ids=[question.company_id], deleted=False)
+    background_tasks.add_task(similarity_service.refresh_questions, [question_id])
     return BaseResponse(message="Question updated successfully", data=None)
 
 @router.delete("/{question_id}", response_model=BaseResponse)
@@ -330,7 +449,9 @@ async def delete_question(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    question = db.query(Question).filter(Question.question_id == question_id).first()
+    question = db.execute(
+        select(Question.registrant_id, Question.company_id).where(Question.question_id == question_id)
+    ).first()
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
 
@@ -338,8 +459,12 @@ async def delete_question(
         if question.registrant_id != current_user.user_id:
             raise HTTPException(status_code=403, detail="Not authorized to delete this question")
 
-    db.delete(question)
+    company_id = question.company_id
+    delete_service.delete_question(db, question_id)
     db.commit()
+    dedup_service.forget_question(question_id)
+    similarity_service.forget_question(question_id)
+    cache_bus.publish(QUESTIONS_CHANGED, question_ids=[question_id], company_ids=[company_id], deleted=True)
     return BaseResponse(message="Question deleted successfully", data=None)
 
 @router.post("/{question_id}/answers", response_model=BaseResponse)
@@ -349,30 +474,38 @@ async def create_answer(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    question = db.query(Question).filter(Question.question_id == question_id).first()
-    if not question:
+    # 질문 존재 확인은 INSERT … SELECT 의 조건으로 (별도 SELECT/refresh 없음)
+    db_answer = answer_repository.insert_answer(db, question_id, current_user.user_id, answer_request.answer)
+    if db_answer is None:
         raise HTTPException(status_code=404, detail="Question not found")
-
-    db_answer = Answer(
-        question_id=question_id,
-        user_id=current_user.user_id,
-        answer=answer_request.answer
-    )
-    db.add(db_answer)
     db.commit()
-    db.refresh(db_answer)
+    stat_service.record_answer(question_id)
+    cache_bus.publish(THREAD_EVENT, **answer_event("created", db_answer))
     return BaseResponse(message="Answer created successfully", data=db_answer.answer_id)
 
-@router.get("/{question_id}/answers", response_model=CursorPage[AnswerResponse])
+@router.get("/{question_id}/answers", response_model=Union[CursorPage[AnswerResponse], ChangesPage[AnswerResponse]])
 async def get_question_answers(
     question_id: int,
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
-    db: Session = Depends(get_db)
+    since: Optional[str] = None,
+    db: Session = Depends(get_read_db)
 ):
+    """
+    질문의 답변 목록. 응답의 sync_token 을 since 로 넘기면 그 이후 추가/수정/삭제된 답변만 돌려준다.
+    """
     question = db.query(Question).filter(Question.question_id == question_id).first()
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
 
-    query = db.query(Answer).filter(Answer.question_id == question_id).order_by(Answer.answer_id)
-    return paginate_cursor(query, cursor_id, size, Answer.answer_id)
\ No newline at end of file
+    if since:
+        changes = changes_since(db, Answer, Answer.question_id, question_id, "answer", since, clamp_size(size))
+        return ChangesPage(**changes._asdict())
+
+    # 목록보다 먼저 읽어야 조회 도중 바뀐 답변이 다음 since 조회에서 빠지지 않는다
+    sync_token = encode_sync_token(current_version(db, "answer", question_id))
+    query = select_answer_rows(question_id)
+    page = paginate_cursor(query, cursor_id, size, Answer.answer_id, cursor=cursor, db=db, to_value=AnswerRow.of)
+    page.sync_token = sync_token
+    return page
\ No newline at end of file
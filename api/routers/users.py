@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session, selectinload
-from core.database import get_db
+from core.database import get_db, get_read_db
 from core.auth import get_current_user
-from core.pagination import paginate_cursor
+from core.cache_bus import cache_bus
+from core.pagination import SortKey, clamp_size, decode_cursor, encode_cursor, paginate_cursor
 from api.schemas.user import UserResponse, UserCreateRequest, UserUpdateRequest, UserPositionUpdateRequest
 from api.schemas.company import PositionResponse, CompanyResponse
 from api.schemas.base import BaseResponse, CursorPage
@@ -11,10 +12,14 @@ from app.domain.company.model.position import Position
 from app.domain.company.model.company import Company
 from app.domain.user.model.user_position import UserPosition
 from app.domain.user.model.goal_company import GoalCompany
+from app.cache_events import USER_GOALS_CHANGED
+from app.domain.company.service import catalog_service
 from typing import Optional
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+POSITION_KEYS = [SortKey(Position.position_id)]
+
 @router.get("", response_model=UserResponse)
 @router.get("/", response_model=UserResponse)
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
@@ -40,11 +45,23 @@ async def update_user(
 @router.get("/positions", response_model=CursorPage[PositionResponse])
 async def get_all_positions(
     cursor_id: Optional[int] = None,
-    size: int = 20,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    size: int = 20
 ):
-    query = db.query(Position).order_by(Position.position_id)
-    return paginate_cursor(query, cursor_id, size, Position.position_id)
+    # 직무 목록은 거의 바뀌지 않으므로 카탈로그 캐시에서 페이지를 자른다
+    positions = catalog_service.get_positions()
+    if cursor:
+        cursor_id = decode_cursor(POSITION_KEYS, cursor)[0][0]
+    if cursor_id is not None:
+        positions = [p for p in positions if p.position_id > cursor_id]
+    size = clamp_size(size)
+    has_next = len(positions) > size
+    positions = positions[:size]
+    return CursorPage(
+        values=positions,
+        has_next=has_next,
+        next_cursor=encode_cursor(POSITION_KEYS, [positions[-1].position_id]) if has_next else None,
+    )
 
 @router.patch("/positions", response_model=BaseResponse)
 async def update_user_goals(
@@ -67,36 +84,39 @@ async def update_user_goals(
         db.add(goal_company)
 
     db.commit()
+    cache_bus.publish(USER_GOALS_CHANGED, user_id=current_user.user_id)
     return BaseResponse(message="User goals updated successfully", data=None)
 
 @router.get("/positions/my", response_model=CursorPage[PositionResponse])
 async def get_user_positions(
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     query = (db.query(Position)
              .join(UserPosition)
              .filter(UserPosition.user_id == current_user.user_id)
              .order_by(Position.position_id))
-    return paginate_cursor(query, cursor_id, size, Position.position_id)
+    return paginate_cursor(query, cursor_id, size, Position.position_id, cursor=cursor)
 
 @router.get("/companies/my", response_model=CursorPage[CompanyResponse])
 async def get_user_goal_companies(
     cursor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     size: int = 20,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     query = (db.query(Company)
              .join(GoalCompany)
              .filter(GoalCompany.user_id == current_user.user_id)
              .order_by(Company.company_id))
-    return paginate_cursor(query, cursor_id, size, Company.company_id)
+    return paginate_cursor(query, cursor_id, size, Company.company_id, cursor=cursor)
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, db: Session = Depends(get_db)):
+async def get_user(user_id: int, db: Session = Depends(get_read_db)):
     user = db.query(User).filter(User.user_id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Any, List, Generic, TypeVar
+from typing import Any, List, Generic, Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -9,4 +9,21 @@ class BaseResponse(BaseModel):
 
 class CursorPage(BaseModel, Generic[T]):
     values: List[T]
-    has_next: bool
\ No newline at end of file
+    has_next: bool
+    has_prev: bool = False
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    # with_total 요청 시에만 채워진다 (total_exact=False 이면 추정값)
+    total: Optional[int] = None
+    total_exact: Optional[bool] = None
+    # since 동기화를 지원하는 목록에서만 채워진다 (다음 조회에 since 로 넘긴다)
+    sync_token: Optional[str] = None
+
+class ChangesPage(BaseModel, Generic[T]):
+    """since 토큰 이후 추가/수정된 항목(values)과 삭제된 id(deleted)"""
+    values: List[T]
+    deleted: List[int]
+    since: str
+    has_more: bool
+    # true 이면 토큰이 너무 오래되어 삭제 기록이 지워졌으므로 전체 목록을 다시 받아야 한다
+    reset: bool = False
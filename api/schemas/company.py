@@ -36,6 +36,14 @@ class TechStackResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TechStackCountResponse(BaseModel):
+    tech_key: str
+    tech_name: str
+    posting_count: int
+
+    class Config:
+        from_attributes = True
+
 class JobPostingResponse(BaseModel):
     company_job_posting_id: int
     company_id: int | None
@@ -52,3 +60,26 @@ class JobPostingResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class QuestionCountResponse(BaseModel):
+    year: int
+    tag: str
+    count: int
+
+class AnalyzeSummaryResponse(BaseModel):
+    company_analyze_id: int
+    analyzed_at: datetime | None
+    from_field: str | None
+    summary: str
+
+class CompanyOverviewResponse(BaseModel):
+    company: CompanyResponse
+    question_total: int
+    question_counts: List[QuestionCountResponse]
+    latest_analyze: AnalyzeSummaryResponse | None
+    open_job_postings: List[JobPostingResponse]
+    tech_stacks: List[TechStackCountResponse]
+
+    class Config:
+        from_attributes = True
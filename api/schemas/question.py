@@ -29,4 +29,8 @@ class QuestionCreateRequest(BaseModel):
 class QuestionUpdateRequest(BaseModel):
     question: str
     category: str
-    tag: QuestionTag
\ No newline at end of file
+    tag: QuestionTag
+
+class SimilarQuestionResponse(BaseModel):
+    question: QuestionResponse
+    score: float
\ No newline at end of file
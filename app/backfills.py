@@ -0,0 +1,103 @@
+"""
+등록된 데이터 backfill (python manage.py backfill <name>).
+
+새 backfill 은 여기에 register(Backfill(...)) 로 추가한다. source 는 아직 채워지지 않은 row 만 고르도록 필터를 두면
+중간에 새로 들어온 row (API 가 직접 채운 row) 는 자연히 건너뛴다.
+"""
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from core.backfill import Backfill, register
+from core.cache_bus import CacheBus, DatabaseBackend, LocalBackend, cache_bus
+from app.cache_events import QUESTIONS_CHANGED
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.service import position_keyword_service
+from app.domain.question.model.question import Question
+from app.domain.question.model.question_signature import QuestionSignature
+from app.domain.question.model.question_stat import QuestionStat
+from app.domain.question.service import dedup_service, stat_service
+
+
+def _question_signatures(db: Session, question_ids: List[int]):
+    rows = db.execute(select(Question.question_id, Question.question).where(Question.question_id.in_(question_ids))).all()
+    dedup_service.save_signatures(db, [(question_id, dedup_service.minhash(text)) for question_id, text in rows])
+
+
+_publisher: Optional[CacheBus] = None
+
+
+def _server_bus() -> CacheBus:
+    """
+    backfill 은 서버 밖(manage.py)에서 돌므로 이벤트가 프로세스를 벗어나야 한다.
+    local 백엔드로 설정돼 있어도 cache_event 테이블(database 백엔드)로 보낸다.
+    서버도 database(기본값)나 redis 백엔드여야 받는다.
+    """
+    global _publisher
+    if _publisher is None:
+        _publisher = CacheBus(DatabaseBackend()) if isinstance(cache_bus.backend, LocalBackend) else cache_bus
+    return _publisher
+
+
+def _publish_questions(question_ids: List[int]):
+    # 떠 있는 워커들의 중복/유사 질문 인덱스에 새 시그니처를 반영시킨다
+    _server_bus().publish(QUESTIONS_CHANGED, question_ids=question_ids, company_ids=[], deleted=False)
+
+
+def _question_positions(db: Session, question_ids: List[int]):
+    questions = db.execute(
+        select(Question.question_id, Question.question, Question.category).where(Question.question_id.in_(question_ids))
+    ).all()
+    position_keyword_service.tag_questions(db, questions)
+
+
+def _job_posting_positions(db: Session, posting_ids: List[int]):
+    postings = db.execute(
+        select(CompanyJobPosting).where(CompanyJobPosting.company_job_posting_id.in_(posting_ids))
+    ).scalars().all()
+    position_keyword_service.tag_job_postings(db, postings)
+
+
+register(Backfill(
+    name="question_signatures",
+    description="시그니처가 없는 질문의 중복 탐지용 MinHash 시그니처",
+    key=Question.question_id,
+    source=select(Question.question_id)
+    .outerjoin(QuestionSignature, QuestionSignature.question_id == Question.question_id)
+    .where(QuestionSignature.question_id.is_(None)),
+    process=_question_signatures,
+    after_chunk=_publish_questions,
+))
+
+register(Backfill(
+    name="question_positions",
+    description="전체 질문의 직무 태그 재계산 (직무 키워드 변경 후)",
+    key=Question.question_id,
+    source=select(Question.question_id),
+    process=_question_positions,
+))
+
+register(Backfill(
+    name="job_posting_positions",
+    description="전체 채용공고의 직무 태그와 직무별 기술스택 카운터 재계산 (직무 키워드 변경 후)",
+    key=CompanyJobPosting.company_job_posting_id,
+    source=select(CompanyJobPosting.company_job_posting_id),
+    process=_job_posting_positions,
+))
+
+register(Backfill(
+    name="question_stats",
+    description="question_stat row 가 없는 기존 질문에 0 으로 된 row 생성 (인기순 목록에 나오도록)",
+    key=Question.question_id,
+    source=select(Question.question_id)
+    .outerjoin(QuestionStat, QuestionStat.question_id == Question.question_id)
+    .where(QuestionStat.question_id.is_(None)),
+    process=stat_service.create_stats,
+))
+
+register(Backfill(
+    name="question_stat_answers",
+    description="질문별 집계(question_stat)의 답변 수와 인기 점수를 실제 답변 수로 재계산",
+    key=Question.question_id,
+    source=select(Question.question_id),
+    process=stat_service.recount_answers,
+))
@@ -0,0 +1,85 @@
+from core.cache_bus import CacheBus
+from core.compression import clear_precompressed
+from core.counts import invalidate_counts
+from core.database import SessionLocal
+from core.push_hub import push_hub
+from app.domain.company.service import catalog_service, overview_service
+from app.domain.question.service import dedup_service, similarity_service
+
+# 쓰기 API가 커밋 후 cache_bus.publish 하는 토픽. 모든 워커의 프로세스 내 캐시가 같은 핸들러로 무효화된다.
+COMPANIES_CHANGED = "companies.changed"   # company_ids, deleted
+QUESTIONS_CHANGED = "questions.changed"   # question_ids, company_ids, deleted
+USER_GOALS_CHANGED = "user_goals.changed"  # user_id
+# 캐시가 아니라 push 구독자에게 보내는 스레드 이벤트. 모든 워커의 push_hub 가 받아 자기 구독자에게 전달한다.
+THREAD_EVENT = "threads.event"  # channel, event
+
+
+def _on_companies_changed(payload: dict):
+    company_ids = payload.get("company_ids", [])
+    catalog_service.invalidate_companies()
+    overview_service.invalidate_companies(company_ids)
+    invalidate_counts("company")
+    if payload.get("deleted"):
+        # 회사 삭제는 질문/채용공고까지 지우므로 그 캐시들도 함께 정리
+        invalidate_counts("question", "company_job_posting")
+        clear_precompressed()
+        dedup_service.invalidate_index()
+        for company_id in company_ids:
+            similarity_service.forget_company(company_id)
+
+
+def _on_questions_changed(payload: dict):
+    overview_service.invalidate_companies(payload.get("company_ids", []))
+    invalidate_counts("question")
+
+
+def _sync_question_indexes(payload: dict):
+    """다른 워커에서 바뀐 질문을 이 워커의 중복/유사 질문 인덱스에 반영 (발행한 워커는 직접 반영함)"""
+    question_ids = payload.get("question_ids", [])
+    if payload.get("deleted"):
+        for question_id in question_ids:
+            dedup_service.forget_question(question_id)
+            similarity_service.forget_question(question_id)
+        return
+    if dedup_service.get_loaded_index() is None and similarity_service.get_loaded_index() is None:
+        return
+    db = SessionLocal()
+    try:
+        dedup_service.sync_questions(db, question_ids)
+        similarity_service.sync_questions(db, question_ids)
+    finally:
+        db.close()
+
+
+def answer_event(kind: str, answer=None, answer_id: int = None, question_id: int = None) -> dict:
+    """THREAD_EVENT payload (created/updated 는 답변 내용과 version 포함, deleted 는 id 만)"""
+    event = {"type": f"answer.{kind}", "answer_id": answer.answer_id if answer else answer_id}
+    if answer is not None:
+        question_id = answer.question_id
+        event.update(version=answer.version, data={
+            "answer_id": answer.answer_id, "question_id": answer.question_id,
+            "user_id": answer.user_id, "answer": answer.answer,
+        })
+    return {"channel": f"question:{question_id}", "event": {"question_id": question_id, **event}}
+
+
+def comment_event(kind: str, comment=None, comment_id: int = None, answer_id: int = None) -> dict:
+    event = {"type": f"comment.{kind}", "answer_comment_id": comment.answer_comment_id if comment else comment_id}
+    if comment is not None:
+        answer_id = comment.answer_id
+        event.update(version=comment.version, data={
+            "answer_comment_id": comment.answer_comment_id, "answer_id": comment.answer_id,
+            "user_id": comment.user_id, "comment": comment.comment,
+        })
+    return {"channel": f"answer:{answer_id}", "event": {"answer_id": answer_id, **event}}
+
+
+def _push_thread_event(payload: dict):
+    push_hub.publish(payload["channel"], payload["event"])
+
+
+def register(bus: CacheBus):
+    bus.subscribe(COMPANIES_CHANGED, _on_companies_changed)
+    bus.subscribe(QUESTIONS_CHANGED, _on_questions_changed)
+    bus.subscribe(QUESTIONS_CHANGED, _sync_question_indexes, remote_only=True)
+    bus.subscribe(THREAD_EVENT, _push_thread_event)
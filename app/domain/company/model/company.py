@@ -1,7 +1,8 @@
 from sqlalchemy import Column, BigInteger, String
 from core.database import Base
+from core.soft_delete import SoftDeleteMixin
 
-class Company(Base):
+class Company(SoftDeleteMixin, Base):
     __tablename__ = "company"
 
     company_id = Column(BigInteger, primary_key=True)
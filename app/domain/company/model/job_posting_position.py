@@ -0,0 +1,9 @@
+from sqlalchemy import Column, BigInteger, Integer, ForeignKey
+from core.database import Base
+
+class JobPostingPosition(Base):
+    __tablename__ = "job_posting_position"
+
+    # 채용공고 본문에서 직무 키워드가 매칭된 직무
+    company_job_posting_id = Column(BigInteger, ForeignKey("company_job_posting.company_job_posting_id"), nullable=False, primary_key=True)
+    position_id = Column(Integer, ForeignKey("position.position_id"), nullable=False, primary_key=True, index=True)
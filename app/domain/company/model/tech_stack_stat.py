@@ -0,0 +1,32 @@
+from sqlalchemy import Column, BigInteger, Integer, String, ForeignKey, Index
+from core.database import Base
+
+# tech_stack row 수를 정규화된 기술명(tech_key) 기준으로 미리 집계해 둔 카운터 테이블들
+# (tech_stack_service가 쓰기 시점에 증감하고, manage.py rebuild-tech-stack-stats로 전체 재계산한다)
+
+class TechStackStat(Base):
+    __tablename__ = "tech_stack_stat"
+
+    tech_key = Column(String(100), primary_key=True)
+    tech_name = Column(String(255), nullable=False)
+    posting_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_tech_stack_stat_posting_count", "posting_count"),
+    )
+
+
+class CompanyTechStackStat(Base):
+    __tablename__ = "company_tech_stack_stat"
+
+    company_id = Column(BigInteger, ForeignKey("company.company_id"), primary_key=True)
+    tech_key = Column(String(100), primary_key=True)
+    posting_count = Column(Integer, nullable=False, default=0)
+
+
+class PositionTechStackStat(Base):
+    __tablename__ = "position_tech_stack_stat"
+
+    position_id = Column(Integer, ForeignKey("position.position_id"), primary_key=True)
+    tech_key = Column(String(100), primary_key=True)
+    posting_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from typing import Optional, Sequence
+from sqlalchemy import exists, insert, literal, select
+from sqlalchemy.orm import Session
+from core.sql import insert_returning_id, row_class
+from app.domain.company.model.company import Company
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.model.tech_stack import TechStack
+
+# 목록 응답 모델에 필요한 컬럼만 읽는 읽기 전용 select. ORM 인스턴스 대신 Row 를 작은 slots 객체로 옮겨 담는다.
+COMPANY_LIST_COLUMNS = (Company.company_id, Company.company_name)
+CompanyRow = row_class("CompanyRow", COMPANY_LIST_COLUMNS)
+JOB_POSTING_LIST_COLUMNS = (
+    CompanyJobPosting.company_job_posting_id,
+    CompanyJobPosting.company_id,
+    CompanyJobPosting.job_id,
+    CompanyJobPosting.overview,
+    CompanyJobPosting.key_responsibilities,
+    CompanyJobPosting.preferred_qualifications,
+    CompanyJobPosting.benefits_and_perks,
+    CompanyJobPosting.hiring_process,
+    CompanyJobPosting.employment_type,
+    CompanyJobPosting.application_deadline,
+    CompanyJobPosting.work_location,
+)
+JobPostingRow = row_class("JobPostingRow", JOB_POSTING_LIST_COLUMNS, extra=("tech_stacks",))
+TECH_STACK_COLUMNS = (TechStack.tech_stack_id, TechStack.tech_name)
+TechStackRow = row_class("TechStackRow", TECH_STACK_COLUMNS)
+
+
+def select_company_rows(name: Optional[str] = None):
+    statement = select(*COMPANY_LIST_COLUMNS)
+    if name:
+        statement = statement.where(Company.company_name.ilike(f"%{name}%"))
+    return statement
+
+
+def select_job_posting_rows(
+    company_name: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    work_location: Optional[str] = None,
+):
+    statement = select(*JOB_POSTING_LIST_COLUMNS)
+    if company_name:
+        statement = statement.join(Company, Company.company_id == CompanyJobPosting.company_id).where(
+            Company.company_name.ilike(f"%{company_name}%")
+        )
+    if employment_type:
+        statement = statement.where(CompanyJobPosting.employment_type.ilike(f"%{employment_type}%"))
+    if work_location:
+        statement = statement.where(CompanyJobPosting.work_location.ilike(f"%{work_location}%"))
+    return statement
+
+
+def with_tech_stacks(db: Session, postings: Sequence[JobPostingRow]) -> Sequence[JobPostingRow]:
+    """채용공고에 기술스택을 한 번의 IN 쿼리로 채운다 (selectinload 대체)."""
+    stacks = defaultdict(list)
+    posting_ids = [posting.company_job_posting_id for posting in postings]
+    if posting_ids:
+        for row in db.execute(
+            select(*TECH_STACK_COLUMNS, TechStack.company_job_position_id)
+            .where(TechStack.company_job_position_id.in_(posting_ids))
+            .order_by(TechStack.tech_stack_id)
+        ):
+            stacks[row.company_job_position_id].append(TechStackRow.of(row))
+    for posting in postings:
+        posting.tech_stacks = stacks[posting.company_job_posting_id]
+    return postings
+
+
+def insert_company(db: Session, company_name: str) -> Optional[int]:
+    """같은 이름의 (삭제 대기 아닌) 회사가 없을 때만 넣는다 (INSERT … SELECT WHERE NOT EXISTS). 이미 있으면 None."""
+    duplicate = exists().where(Company.company_name == company_name, Company.deleted_at.is_(None))
+    stmt = insert(Company).from_select([Company.company_name], select(literal(company_name)).where(~duplicate))
+    return insert_returning_id(db, stmt, Company.company_id)
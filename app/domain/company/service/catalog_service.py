@@ -0,0 +1,54 @@
+import os
+from typing import Dict, List, NamedTuple
+from sqlalchemy import select
+from core.cache import TTLCache
+from core.database import SessionLocal
+from app.domain.company.model.company import Company
+from app.domain.company.model.position import Position
+
+CATALOG_CACHE_SECONDS = int(os.getenv("CATALOG_CACHE_SECONDS", "300"))
+
+_catalog = TTLCache(ttl=CATALOG_CACHE_SECONDS, maxsize=8)
+
+
+class CompanyEntry(NamedTuple):
+    company_id: int
+    company_name: str
+
+
+class PositionEntry(NamedTuple):
+    position_id: int
+    position_name: str
+
+
+def _load(statement):
+    # 복제 지연으로 방금 바뀐 회사/직무가 빠진 목록을 TTL 동안 들고 있지 않도록 primary 에서 읽는다
+    db = SessionLocal()
+    try:
+        return db.execute(statement).all()
+    finally:
+        db.close()
+
+
+def get_companies_by_id() -> Dict[int, CompanyEntry]:
+    """전체 회사 목록(id → 회사)을 캐시에서 가져옵니다."""
+    def load():
+        rows = _load(select(Company.company_id, Company.company_name))
+        return {row.company_id: CompanyEntry(*row) for row in rows}
+    return _catalog.get_or_load("companies", load)
+
+
+def get_positions() -> List[PositionEntry]:
+    """전체 직무 목록을 position_id 순으로 캐시에서 가져옵니다."""
+    def load():
+        rows = _load(select(Position.position_id, Position.position_name).order_by(Position.position_id))
+        return [PositionEntry(*row) for row in rows]
+    return _catalog.get_or_load("positions", load)
+
+
+def invalidate_companies():
+    _catalog.invalidate("companies")
+
+
+def invalidate_positions():
+    _catalog.invalidate("positions")
@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from core.purge import CascadeStep, SET_BASED, delete_cascade, purge_cascade
+from core.soft_delete import SOFT_DELETE_ENABLED
+from app.domain.company.model.company import Company
+from app.domain.company.model.company_analyze import CompanyAnalyze
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.model.job_posting_position import JobPostingPosition
+from app.domain.company.model.tech_stack import TechStack
+from app.domain.company.model.tech_stack_stat import CompanyTechStackStat
+from app.domain.company.service import tech_stack_service
+from app.domain.question.model.question import Question
+from app.domain.question.service.delete_service import mark_questions_deleted, question_cascade
+from app.domain.user.model.goal_company import GoalCompany
+
+
+def company_cascade(company_where) -> List[CascadeStep]:
+    """회사에 딸린 질문/답변/댓글, 채용공고/기술스택, 분석, 목표회사를 지우고 마지막에 회사를 지운다."""
+    company_ids = select(Company.company_id).where(company_where)
+    posting_ids = select(CompanyJobPosting.company_job_posting_id).where(
+        CompanyJobPosting.company_id.in_(company_ids)
+    )
+    return question_cascade(Question.company_id.in_(company_ids)) + [
+        CascadeStep(TechStack, TechStack.company_job_position_id.in_(posting_ids), TechStack.tech_stack_id),
+        CascadeStep(
+            JobPostingPosition, JobPostingPosition.company_job_posting_id.in_(posting_ids),
+            (JobPostingPosition.company_job_posting_id, JobPostingPosition.position_id),
+        ),
+        CascadeStep(CompanyJobPosting, CompanyJobPosting.company_id.in_(company_ids), CompanyJobPosting.company_job_posting_id),
+        CascadeStep(
+            CompanyTechStackStat, CompanyTechStackStat.company_id.in_(company_ids),
+            (CompanyTechStackStat.company_id, CompanyTechStackStat.tech_key),
+        ),
+        CascadeStep(CompanyAnalyze, CompanyAnalyze.company_id.in_(company_ids), CompanyAnalyze.company_analyze_id),
+        CascadeStep(GoalCompany, GoalCompany.company_id.in_(company_ids), (GoalCompany.user_id, GoalCompany.company_id)),
+        CascadeStep(Company, company_where, Company.company_id),
+    ]
+
+
+def delete_company(db: Session, company_id: int):
+    """회사와 모든 하위 데이터를 삭제합니다. soft delete 모드에서는 표시만 하고 purger에 맡깁니다."""
+    tech_stack_service.remove_company(db, company_id)
+    if SOFT_DELETE_ENABLED:
+        # 조회는 각 row 의 deleted_at 만 보므로 하위 질문/답변/댓글에도 같은 시각을 기록한다
+        deleted_at = datetime.utcnow()
+        mark_questions_deleted(db, Question.company_id == company_id, deleted_at)
+        db.execute(
+            update(Company).where(Company.company_id == company_id)
+            .values(deleted_at=deleted_at)
+            .execution_options(**SET_BASED)
+        )
+    else:
+        delete_cascade(db, company_cascade(Company.company_id == company_id))
+
+
+def purge_deleted_companies(db: Session, batch_size: int, max_batches: int) -> int:
+    return purge_cascade(db, company_cascade(Company.deleted_at.is_not(None)), batch_size, max_batches)
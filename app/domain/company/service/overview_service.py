@@ -0,0 +1,94 @@
+import os
+from datetime import date
+from typing import Iterable, Optional
+from sqlalchemy import extract, func, or_, select
+from sqlalchemy.orm import Session
+from core.cache import TTLCache
+from app.domain.company.model.company import Company
+from app.domain.company.model.company_analyze import CompanyAnalyze
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.repository.company_repository import (
+    CompanyRow, JobPostingRow, select_company_rows, select_job_posting_rows, with_tech_stacks,
+)
+from app.domain.company.service import tech_stack_service
+from app.domain.question.model.question import Question
+
+OVERVIEW_CACHE_SECONDS = int(os.getenv("OVERVIEW_CACHE_SECONDS", "120"))
+OVERVIEW_POSTING_LIMIT = int(os.getenv("OVERVIEW_POSTING_LIMIT", "10"))
+ANALYZE_SUMMARY_LENGTH = 300
+
+_overviews = TTLCache(ttl=OVERVIEW_CACHE_SECONDS, maxsize=2048)
+
+
+def _load(db: Session, company_id: int) -> Optional[dict]:
+    # 캐시에 넣으므로 세션에 묶인 ORM 인스턴스 대신 컬럼 값만 담은 row 로 읽는다
+    company = db.execute(select_company_rows().where(Company.company_id == company_id)).first()
+    if not company:
+        return None
+
+    # 연도/태그별 질문 수 (GROUP BY 한 번)
+    year = extract("year", Question.question_at)
+    question_counts = db.execute(
+        select(year.label("year"), Question.tag, func.count().label("count"))
+        .where(Question.company_id == company_id)
+        .group_by(year, Question.tag)
+        .order_by(year.desc(), Question.tag)
+    ).all()
+
+    latest_analyze = (
+        db.query(CompanyAnalyze)
+        .filter(CompanyAnalyze.company_id == company_id)
+        .order_by(CompanyAnalyze.analyzed_at.desc(), CompanyAnalyze.company_analyze_id.desc())
+        .first()
+    )
+
+    # 마감일이 없거나 지나지 않은 공고 (기술스택은 IN 쿼리 한 번)
+    open_postings = with_tech_stacks(db, [
+        JobPostingRow.of(row) for row in db.execute(
+            select_job_posting_rows()
+            .where(
+                CompanyJobPosting.company_id == company_id,
+                or_(CompanyJobPosting.application_deadline.is_(None), CompanyJobPosting.application_deadline >= date.today()),
+            )
+            .order_by(CompanyJobPosting.application_deadline.is_(None), CompanyJobPosting.application_deadline)
+            .limit(OVERVIEW_POSTING_LIMIT)
+        )
+    ])
+
+    return {
+        "company": CompanyRow.of(company),
+        "question_total": sum(row.count for row in question_counts),
+        "question_counts": [
+            {"year": int(row.year), "tag": row.tag, "count": row.count} for row in question_counts
+        ],
+        "latest_analyze": latest_analyze and {
+            "company_analyze_id": latest_analyze.company_analyze_id,
+            "analyzed_at": latest_analyze.analyzed_at,
+            "from_field": latest_analyze.from_field,
+            "summary": (latest_analyze.result or "")[:ANALYZE_SUMMARY_LENGTH],
+        },
+        "open_job_postings": open_postings,
+        "tech_stacks": tech_stack_service.top_tech_stacks(db, company_id=company_id, limit=10),
+    }
+
+
+def get_overview(db: Session, company_id: int) -> Optional[dict]:
+    """
+    회사 페이지에 필요한 섹션을 모아 회사별로 캐시합니다. 없는 회사는 캐시하지 않는다.
+    값은 응답 모델(CompanyOverviewResponse)의 필드 이름을 키로 하는 dict 이며 모델은 라우터가 만든다.
+    """
+    overview = _overviews.get(company_id)
+    if overview is None:
+        overview = _load(db, company_id)
+        if overview is not None:
+            _overviews.set(company_id, overview)
+    return overview
+
+
+def invalidate_companies(company_ids: Iterable[int]):
+    for company_id in set(company_ids):
+        _overviews.invalidate(company_id)
+
+
+def invalidate_all():
+    _overviews.clear()
@@ -0,0 +1,108 @@
+import os
+import re
+from typing import Iterable, List, Set
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+from core.cache import TTLCache
+from core.keyword_matcher import KeywordAutomaton
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.model.job_posting_position import JobPostingPosition
+from app.domain.company.model.keywords_by_position import KeywordsByPosition
+from app.domain.company.model.position import Position
+from app.domain.company.service import tech_stack_service
+from app.domain.question.model.question import Question
+from app.domain.question.model.question_position import QuestionPosition
+
+KEYWORD_CACHE_SECONDS = int(os.getenv("KEYWORD_CACHE_SECONDS", "600"))
+
+_matcher = TTLCache(ttl=KEYWORD_CACHE_SECONDS, maxsize=1)
+
+# keywords 컬럼은 쉼표/줄바꿈/세미콜론으로 구분된 키워드 목록
+_KEYWORD_SEPARATORS = re.compile(r"[,;\n]+")
+
+
+def parse_keywords(keywords: str | None) -> List[str]:
+    return [keyword.strip() for keyword in _KEYWORD_SEPARATORS.split(keywords or "") if keyword.strip()]
+
+
+def get_matcher(db: Session) -> KeywordAutomaton:
+    """직무명과 KeywordsByPosition 키워드 전체로 만든 자동자 (payload = position_id)"""
+    def load():
+        automaton = KeywordAutomaton()
+        for position_id, position_name in db.execute(select(Position.position_id, Position.position_name)):
+            if position_name:
+                automaton.add(position_name, position_id)
+        for position_id, keywords in db.execute(select(KeywordsByPosition.position_id, KeywordsByPosition.keywords)):
+            for keyword in parse_keywords(keywords):
+                automaton.add(keyword, position_id)
+        return automaton.build()
+    return _matcher.get_or_load("automaton", load)
+
+
+def invalidate_keywords():
+    _matcher.clear()
+
+
+def match_question(matcher: KeywordAutomaton, question: Question) -> Set[int]:
+    return matcher.match(question.question, question.category)
+
+
+def match_job_posting(matcher: KeywordAutomaton, posting: CompanyJobPosting) -> Set[int]:
+    return matcher.match(posting.overview, posting.key_responsibilities, posting.preferred_qualifications)
+
+
+def tag_questions(db: Session, questions: Iterable[Question]):
+    """질문들의 직무 태그를 다시 매긴다. flush 이후(question_id 확정) 호출하고 커밋은 호출한 쪽에서 한다."""
+    matcher = get_matcher(db)
+    questions = list(questions)
+    if not questions:
+        return
+    db.execute(delete(QuestionPosition).where(
+        QuestionPosition.question_id.in_([q.question_id for q in questions])
+    ))
+    rows = [
+        {"question_id": q.question_id, "position_id": position_id}
+        for q in questions for position_id in match_question(matcher, q)
+    ]
+    if rows:
+        db.execute(insert(QuestionPosition), rows)
+
+
+def tag_job_postings(db: Session, postings: Iterable[CompanyJobPosting]):
+    matcher = get_matcher(db)
+    postings = list(postings)
+    if not postings:
+        return
+    posting_ids = [p.company_job_posting_id for p in postings]
+    # 직무별 기술스택 카운터는 태그 기준이므로 태그를 바꾸기 전후로 빼고 더한다
+    tech_stack_service.adjust_position_counts(db, posting_ids, -1)
+    db.execute(delete(JobPostingPosition).where(JobPostingPosition.company_job_posting_id.in_(posting_ids)))
+    rows = [
+        {"company_job_posting_id": p.company_job_posting_id, "position_id": position_id}
+        for p in postings for position_id in match_job_posting(matcher, p)
+    ]
+    if rows:
+        db.execute(insert(JobPostingPosition), rows)
+    tech_stack_service.adjust_position_counts(db, posting_ids, 1)
+
+
+def retag_all(db: Session, chunk_size: int = 500) -> dict:
+    """키워드가 바뀐 뒤 전체 질문/채용공고의 직무 태그를 청크 단위로 다시 매깁니다."""
+    invalidate_keywords()
+    counts = {}
+    for model, id_column, tag in (
+        (Question, Question.question_id, tag_questions),
+        (CompanyJobPosting, CompanyJobPosting.company_job_posting_id, tag_job_postings),
+    ):
+        last_id, total = 0, 0
+        while True:
+            chunk = db.query(model).filter(id_column > last_id).order_by(id_column).limit(chunk_size).all()
+            if not chunk:
+                break
+            tag(db, chunk)
+            db.commit()
+            last_id = getattr(chunk[-1], id_column.key)
+            total += len(chunk)
+            db.expunge_all()
+        counts[model.__tablename__] = total
+    return counts
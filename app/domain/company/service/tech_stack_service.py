@@ -0,0 +1,254 @@
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, event, select, tuple_
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, attributes
+from core.sql import upsert_increment
+from app.domain.company.model.company import Company
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.model.job_posting_position import JobPostingPosition
+from app.domain.company.model.tech_stack import TechStack
+from app.domain.company.model.tech_stack_stat import TechStackStat, CompanyTechStackStat, PositionTechStackStat
+
+ALL_SCOPES = ("all", "company", "position")
+
+# 정규화 키 → 대표 키 (표기가 다른 같은 기술을 하나로 모은다)
+TECH_ALIASES = {
+    "reactjs": "react",
+    "nodejs": "node",
+    "vuejs": "vue",
+    "nextjs": "next",
+    "nestjs": "nest",
+    "expressjs": "express",
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "postgres": "postgresql",
+    "mongo": "mongodb",
+    "springframework": "spring",
+    "amazonwebservices": "aws",
+    "c#": "csharp",
+    "c++": "cpp",
+}
+
+# 대표 키의 표시 이름 (없으면 처음 들어온 원래 표기를 쓴다)
+TECH_DISPLAY_NAMES = {
+    "react": "React",
+    "node": "Node.js",
+    "vue": "Vue.js",
+    "next": "Next.js",
+    "nest": "NestJS",
+    "express": "Express",
+    "javascript": "JavaScript",
+    "typescript": "TypeScript",
+    "go": "Go",
+    "kubernetes": "Kubernetes",
+    "postgresql": "PostgreSQL",
+    "mongodb": "MongoDB",
+    "mysql": "MySQL",
+    "spring": "Spring",
+    "springboot": "Spring Boot",
+    "aws": "AWS",
+    "csharp": "C#",
+    "cpp": "C++",
+}
+
+
+def normalize_tech_name(tech_name: Optional[str]) -> Tuple[str, str]:
+    """기술명을 (정규화 키, 표시 이름)으로 바꾼다. "React.js", "react", "ReactJS"는 모두 ("react", "React")"""
+    display = " ".join(unicodedata.normalize("NFKC", tech_name or "").split())
+    key = re.sub(r"[\s\-_]+", "", display.lower())
+    if key.endswith(".js") and len(key) > 3:
+        key = key[:-3] + "js"
+    key = TECH_ALIASES.get(key, key)
+    return key[:100], TECH_DISPLAY_NAMES.get(key, display)[:255]
+
+
+def _posting_context(connection: Connection, posting_ids: Iterable[int], scopes: Sequence[str]):
+    """채용공고별 회사와 직무 태그"""
+    posting_ids = {posting_id for posting_id in posting_ids if posting_id is not None}
+    company_by_posting: Dict[int, int] = {}
+    positions_by_posting: Dict[int, List[int]] = defaultdict(list)
+    if not posting_ids:
+        return company_by_posting, positions_by_posting
+    if "company" in scopes:
+        company_by_posting = dict(connection.execute(
+            select(CompanyJobPosting.company_job_posting_id, CompanyJobPosting.company_id)
+            .where(CompanyJobPosting.company_job_posting_id.in_(posting_ids))
+        ).all())
+    if "position" in scopes:
+        for posting_id, position_id in connection.execute(
+            select(JobPostingPosition.company_job_posting_id, JobPostingPosition.position_id)
+            .where(JobPostingPosition.company_job_posting_id.in_(posting_ids))
+        ):
+            positions_by_posting[posting_id].append(position_id)
+    return company_by_posting, positions_by_posting
+
+
+def _count(stacks, company_by_posting, positions_by_posting, scopes):
+    overall, by_company, by_position, names = Counter(), Counter(), Counter(), {}
+    for posting_id, tech_name in stacks:
+        key, display = normalize_tech_name(tech_name)
+        if not key:
+            continue
+        names.setdefault(key, display)
+        if "all" in scopes:
+            overall[key] += 1
+        if "company" in scopes and company_by_posting.get(posting_id) is not None:
+            by_company[(company_by_posting[posting_id], key)] += 1
+        if "position" in scopes:
+            for position_id in positions_by_posting.get(posting_id, ()):
+                by_position[(position_id, key)] += 1
+    return overall, by_company, by_position, names
+
+
+def _write(connection: Connection, counts, sign: int):
+    overall, by_company, by_position, names = counts
+    upsert_increment(connection, TechStackStat.__table__, ["tech_key"], "posting_count", [
+        {"tech_key": key, "tech_name": names[key], "posting_count": sign * count}
+        for key, count in overall.items()
+    ])
+    upsert_increment(connection, CompanyTechStackStat.__table__, ["company_id", "tech_key"], "posting_count", [
+        {"company_id": company_id, "tech_key": key, "posting_count": sign * count}
+        for (company_id, key), count in by_company.items()
+    ])
+    upsert_increment(connection, PositionTechStackStat.__table__, ["position_id", "tech_key"], "posting_count", [
+        {"position_id": position_id, "tech_key": key, "posting_count": sign * count}
+        for (position_id, key), count in by_position.items()
+    ])
+    if sign < 0:
+        # 방금 뺀 키 중 0 이 된 row 만 지운다 (회사/직무 카운터는 posting_count 인덱스가 없어 전체 조건이면 풀 스캔)
+        if overall:
+            connection.execute(delete(TechStackStat).where(
+                TechStackStat.tech_key.in_(list(overall)), TechStackStat.posting_count <= 0
+            ))
+        if by_company:
+            connection.execute(delete(CompanyTechStackStat).where(
+                tuple_(CompanyTechStackStat.company_id, CompanyTechStackStat.tech_key).in_(list(by_company)),
+                CompanyTechStackStat.posting_count <= 0,
+            ))
+        if by_position:
+            connection.execute(delete(PositionTechStackStat).where(
+                tuple_(PositionTechStackStat.position_id, PositionTechStackStat.tech_key).in_(list(by_position)),
+                PositionTechStackStat.posting_count <= 0,
+            ))
+
+
+def apply_tech_stacks(
+    connection: Connection,
+    stacks: List[Tuple[Optional[int], Optional[str]]],
+    sign: int,
+    scopes: Sequence[str] = ALL_SCOPES,
+):
+    """(채용공고 id, 기술명) 목록만큼 카운터를 더하거나(sign=1) 뺀다(sign=-1)."""
+    if not stacks:
+        return
+    company_by_posting, positions_by_posting = _posting_context(connection, (p for p, _ in stacks), scopes)
+    _write(connection, _count(stacks, company_by_posting, positions_by_posting, scopes), sign)
+
+
+def _stacks_of_postings(connection: Connection, posting_where) -> List[Tuple[int, str]]:
+    return connection.execute(
+        select(TechStack.company_job_position_id, TechStack.tech_name)
+        .where(TechStack.company_job_position_id.in_(
+            select(CompanyJobPosting.company_job_posting_id).where(posting_where)
+        ))
+    ).all()
+
+
+def adjust_position_counts(db: Session, posting_ids: List[int], sign: int):
+    """직무 태그를 바꾸기 전(sign=-1)/후(sign=1)에 호출해 직무별 카운터를 맞춘다."""
+    connection = db.connection()
+    stacks = _stacks_of_postings(connection, CompanyJobPosting.company_job_posting_id.in_(posting_ids))
+    apply_tech_stacks(connection, stacks, sign, scopes=("position",))
+
+
+def remove_company(db: Session, company_id: int):
+    """회사 삭제 시 그 회사 채용공고의 기술스택을 카운터에서 뺀다 (soft delete 시점에 바로 반영)."""
+    connection = db.connection()
+    apply_tech_stacks(connection, _stacks_of_postings(connection, CompanyJobPosting.company_id == company_id), -1)
+
+
+def rebuild(db: Session) -> int:
+    """카운터 테이블을 비우고 현재 tech_stack 전체로 다시 채웁니다. 커밋은 호출한 쪽에서 한다."""
+    connection = db.connection()
+    for model in (TechStackStat, CompanyTechStackStat, PositionTechStackStat):
+        connection.execute(delete(model))
+
+    company_by_posting: Dict[int, int] = {}
+    positions_by_posting: Dict[int, List[int]] = defaultdict(list)
+    for posting_id, position_id in db.execute(
+        select(JobPostingPosition.company_job_posting_id, JobPostingPosition.position_id)
+    ):
+        positions_by_posting[posting_id].append(position_id)
+
+    # 삭제 대기 회사의 채용공고는 soft delete 조건으로 빠진다
+    stacks = []
+    for posting_id, company_id, tech_name in db.execute(
+        select(TechStack.company_job_position_id, CompanyJobPosting.company_id, TechStack.tech_name)
+        .join(CompanyJobPosting, CompanyJobPosting.company_job_posting_id == TechStack.company_job_position_id)
+        .join(Company, Company.company_id == CompanyJobPosting.company_id)
+    ):
+        company_by_posting[posting_id] = company_id
+        stacks.append((posting_id, tech_name))
+
+    _write(connection, _count(stacks, company_by_posting, positions_by_posting, ALL_SCOPES), 1)
+    return len(stacks)
+
+
+def top_tech_stacks(
+    db: Session,
+    company_id: Optional[int] = None,
+    position_id: Optional[int] = None,
+    limit: int = 20,
+):
+    """미리 집계된 카운터에서 많이 쓰인 기술스택 순으로 조회합니다."""
+    if company_id is not None:
+        scoped = CompanyTechStackStat
+        condition = CompanyTechStackStat.company_id == company_id
+    elif position_id is not None:
+        scoped = PositionTechStackStat
+        condition = PositionTechStackStat.position_id == position_id
+    else:
+        return db.execute(
+            select(TechStackStat.tech_key, TechStackStat.tech_name, TechStackStat.posting_count)
+            .order_by(TechStackStat.posting_count.desc(), TechStackStat.tech_key)
+            .limit(limit)
+        ).all()
+    return db.execute(
+        select(scoped.tech_key, TechStackStat.tech_name, scoped.posting_count)
+        .join(TechStackStat, TechStackStat.tech_key == scoped.tech_key)
+        .where(condition)
+        .order_by(scoped.posting_count.desc(), scoped.tech_key)
+        .limit(limit)
+    ).all()
+
+
+@event.listens_for(Session, "after_flush")
+def _track_tech_stacks(session, flush_context):
+    """ORM으로 tech_stack row를 추가/수정/삭제하면 같은 트랜잭션 안에서 카운터를 증감한다."""
+    added, removed = [], []
+    for obj in session.new:
+        if isinstance(obj, TechStack):
+            added.append((obj.company_job_position_id, obj.tech_name))
+    for obj in session.deleted:
+        if isinstance(obj, TechStack):
+            removed.append((obj.company_job_position_id, obj.tech_name))
+    for obj in session.dirty:
+        if not isinstance(obj, TechStack):
+            continue
+        name = attributes.get_history(obj, "tech_name")
+        posting = attributes.get_history(obj, "company_job_position_id")
+        if not (name.has_changes() or posting.has_changes()):
+            continue
+        old_name = name.deleted[0] if name.deleted else obj.tech_name
+        old_posting = posting.deleted[0] if posting.deleted else obj.company_job_position_id
+        removed.append((old_posting, old_name))
+        added.append((obj.company_job_position_id, obj.tech_name))
+    if added or removed:
+        connection = session.connection()
+        apply_tech_stacks(connection, removed, -1)
+        apply_tech_stacks(connection, added, 1)
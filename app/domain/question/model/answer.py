@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, ForeignKey
 from core.database import Base
+from core.changes import VersionedMixin
+from core.soft_delete import SoftDeleteMixin
 
-class Answer(Base):
+class Answer(VersionedMixin, SoftDeleteMixin, Base):
     __tablename__ = "answer"
+    # since 조회 (질문별 변경 버전 범위 스캔)
+    __table_args__ = (Index("ix_answer_question_version", "question_id", "version"),)
+    __version_entity__ = "answer"
+    __version_parent__ = "question_id"
 
     answer_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     question_id = Column(Integer, ForeignKey("question.question_id"), nullable=False)
     user_id = Column(Integer, ForeignKey("user.user_id"), nullable=False)
-    answer = Column(String(255), nullable=False)
\ No newline at end of file
+    answer = Column(String(255), nullable=False)
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, ForeignKey
 from core.database import Base
+from core.changes import VersionedMixin
+from core.soft_delete import SoftDeleteMixin
 
-class AnswerComment(Base):
+class AnswerComment(VersionedMixin, SoftDeleteMixin, Base):
     __tablename__ = "answer_comment"
+    # since 조회 (답변별 변경 버전 범위 스캔)
+    __table_args__ = (Index("ix_answer_comment_answer_version", "answer_id", "version"),)
+    __version_entity__ = "comment"
+    __version_parent__ = "answer_id"
 
     answer_comment_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     answer_id = Column(Integer, ForeignKey("answer.answer_id"), nullable=False)
     user_id = Column(Integer, ForeignKey("user.user_id"), nullable=False)
-    comment = Column(String(255), nullable=False)
\ No newline at end of file
+    comment = Column(String(255), nullable=False)
@@ -1,12 +1,13 @@
 from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum, Text
 from core.database import Base
+from core.soft_delete import SoftDeleteMixin
 import enum
 
 class QuestionTag(str, enum.Enum):
     TENACITY = "tenacity"
     TECHNOLOGY = "technology"
 
-class Question(Base):
+class Question(SoftDeleteMixin, Base):
     __tablename__ = "question"
 
     question_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -15,4 +16,4 @@ class Question(Base):
     question = Column(Text, nullable=False)
     category = Column(String(100))
     tag = Column(Enum(QuestionTag, native_enum=False), nullable=False)
-    question_at = Column(Date, nullable=False)
\ No newline at end of file
+    question_at = Column(Date, nullable=False)
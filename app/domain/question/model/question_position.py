@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from core.database import Base
+
+class QuestionPosition(Base):
+    __tablename__ = "question_position"
+
+    # 질문 본문/카테고리에서 직무 키워드가 매칭된 직무 (저장 시점에 태깅)
+    question_id = Column(Integer, ForeignKey("question.question_id"), nullable=False, primary_key=True)
+    position_id = Column(Integer, ForeignKey("position.position_id"), nullable=False, primary_key=True, index=True)
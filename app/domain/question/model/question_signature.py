@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, ForeignKey, LargeBinary
+from core.database import Base
+
+class QuestionSignature(Base):
+    __tablename__ = "question_signature"
+
+    # 질문 텍스트의 MinHash 시그니처 (중복 탐지 인덱스를 재시작 시 재계산 없이 복원하기 위해 저장)
+    question_id = Column(Integer, ForeignKey("question.question_id"), primary_key=True)
+    signature = Column(LargeBinary(256), nullable=False)
\ No newline at end of file
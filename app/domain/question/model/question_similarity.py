@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, Index
+from core.database import Base
+
+class QuestionSimilarity(Base):
+    __tablename__ = "question_similarity"
+
+    # question_id 기준으로 미리 계산해 둔 다른 회사의 유사 질문 top-k
+    question_id = Column(Integer, ForeignKey("question.question_id"), primary_key=True)
+    similar_question_id = Column(Integer, ForeignKey("question.question_id"), primary_key=True)
+    score = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_question_similarity_question_id_score", "question_id", "score"),
+    )
\ No newline at end of file
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, BigInteger, Integer, ForeignKey, Index
+from core.database import Base
+
+# 질문별 조회수/답변 수 집계 테이블. 요청마다 갱신하지 않고 워커가 메모리에 모은 증가분을
+# stat_service 가 주기적으로 한 번에 upsert 한다 (값은 근사치).
+# score = view_count + POPULARITY_ANSWER_WEIGHT * answer_count 로, 인기순 목록은 (score, question_id) 인덱스를 탄다.
+
+class QuestionStat(Base):
+    __tablename__ = "question_stat"
+
+    question_id = Column(Integer, ForeignKey("question.question_id"), primary_key=True)
+    view_count = Column(BigInteger, nullable=False, default=0)
+    answer_count = Column(BigInteger, nullable=False, default=0)
+    score = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_question_stat_score", "score", "question_id"),
+    )
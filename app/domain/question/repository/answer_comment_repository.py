@@ -0,0 +1,40 @@
+from typing import Optional
+from sqlalchemy import insert, literal, select, update
+from sqlalchemy.orm import Session
+from core.changes import stamp_version
+from core.sql import insert_returning_id, update_returning
+from app.domain.question.model.answer import Answer
+from app.domain.question.model.answer_comment import AnswerComment
+
+
+def insert_comment(db: Session, answer_id: int, user_id: int, text: str) -> Optional[AnswerComment]:
+    """답변이 보이는 상태일 때만 댓글을 넣는다 (INSERT … SELECT). 답변이 없으면 None. 버전은 넣은 뒤 매긴다."""
+    source = (
+        select(literal(answer_id), literal(user_id), literal(text))
+        .select_from(Answer)
+        .where(Answer.answer_id == answer_id, Answer.visible_criteria())
+    )
+    stmt = insert(AnswerComment).from_select([AnswerComment.answer_id, AnswerComment.user_id, AnswerComment.comment], source)
+    comment_id = insert_returning_id(db, stmt, AnswerComment.answer_comment_id)
+    if comment_id is None:
+        return None
+    version = stamp_version(db, AnswerComment, AnswerComment.answer_comment_id, comment_id, answer_id)
+    return AnswerComment(answer_comment_id=comment_id, answer_id=answer_id, user_id=user_id, comment=text, version=version)
+
+
+def update_comment(db: Session, comment_id: int, user_id: int, text: str) -> Optional[AnswerComment]:
+    """작성자 본인의 댓글만 수정한다. 대상이 없거나 권한이 없으면 None."""
+    stmt = (
+        update(AnswerComment)
+        .where(
+            AnswerComment.answer_comment_id == comment_id,
+            AnswerComment.user_id == user_id,
+            AnswerComment.visible_criteria(),
+        )
+        .values(comment=text)
+    )
+    row = update_returning(db, stmt, AnswerComment.answer_id)
+    if row is None:
+        return None
+    version = stamp_version(db, AnswerComment, AnswerComment.answer_comment_id, comment_id, row.answer_id)
+    return AnswerComment(answer_comment_id=comment_id, answer_id=row.answer_id, user_id=user_id, comment=text, version=version)
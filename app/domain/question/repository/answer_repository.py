@@ -0,0 +1,48 @@
+from typing import Optional
+from sqlalchemy import insert, literal, select, update
+from sqlalchemy.orm import Session
+from core.changes import stamp_version
+from core.sql import insert_returning_id, row_class, update_returning
+from app.domain.question.model.answer import Answer
+from app.domain.question.model.question import Question
+
+# 목록 응답(AnswerResponse)에 필요한 컬럼만 읽는 읽기 전용 select
+ANSWER_LIST_COLUMNS = (Answer.answer_id, Answer.question_id, Answer.user_id, Answer.answer)
+AnswerRow = row_class("AnswerRow", ANSWER_LIST_COLUMNS)
+
+
+def select_answer_rows(question_id: int):
+    return select(*ANSWER_LIST_COLUMNS).where(Answer.question_id == question_id)
+
+
+def insert_answer(db: Session, question_id: int, user_id: int, text: str) -> Optional[Answer]:
+    """
+    질문이 보이는 상태일 때만 답변을 넣는다 (INSERT … SELECT 한 문장, 질문 존재 확인 포함).
+    질문이 없으면 None. 돌려주는 Answer 는 이벤트 발행용 transient 객체다.
+    변경 버전은 넣기에 성공한 뒤 매긴다 (질문별 시퀀스 잠금을 커밋 직전에만 잡는다).
+    """
+    source = (
+        select(literal(question_id), literal(user_id), literal(text))
+        .select_from(Question)
+        .where(Question.question_id == question_id, Question.visible_criteria())
+    )
+    stmt = insert(Answer).from_select([Answer.question_id, Answer.user_id, Answer.answer], source)
+    answer_id = insert_returning_id(db, stmt, Answer.answer_id)
+    if answer_id is None:
+        return None
+    version = stamp_version(db, Answer, Answer.answer_id, answer_id, question_id)
+    return Answer(answer_id=answer_id, question_id=question_id, user_id=user_id, answer=text, version=version)
+
+
+def update_answer(db: Session, answer_id: int, user_id: int, text: str) -> Optional[Answer]:
+    """작성자 본인의 답변만 수정한다 (UPDATE … WHERE owner). 대상이 없거나 권한이 없으면 None."""
+    stmt = (
+        update(Answer)
+        .where(Answer.answer_id == answer_id, Answer.user_id == user_id, Answer.visible_criteria())
+        .values(answer=text)
+    )
+    row = update_returning(db, stmt, Answer.question_id)
+    if row is None:
+        return None
+    version = stamp_version(db, Answer, Answer.answer_id, answer_id, row.question_id)
+    return Answer(answer_id=answer_id, question_id=row.question_id, user_id=user_id, answer=text, version=version)
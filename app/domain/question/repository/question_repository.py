@@ -0,0 +1,76 @@
+from typing import List, Optional
+from sqlalchemy import select, cast, update, String
+from sqlalchemy.orm import Session
+from core.sql import row_class, update_returning
+from app.domain.question.model.question import Question, QuestionTag
+from app.domain.company.model.company import Company
+
+
+def question_filters(
+    search: Optional[str] = None,
+    company_name: Optional[str] = None,
+    question_at: Optional[str] = None,
+    tag: Optional[QuestionTag] = None,
+) -> List:
+    """
+    질문 목록/내보내기에서 공통으로 쓰는 필터 조건을 만듭니다.
+
+    - search: 질문 내용 전체 검색 (LIKE 검색)
+    - company_name: 회사명으로 필터링 (부분 검색)
+    - question_at: 학년도로 필터링 (예: 2024)
+    - tag: 질문 태그
+    """
+    conditions = []
+
+    if search:
+        conditions.append(Question.question.ilike(f"%{search}%"))
+
+    # 회사명 필터는 조인 대신 semi-join으로 처리해 어느 쿼리에나 붙일 수 있게 한다
+    if company_name:
+        conditions.append(Question.company_id.in_(
+            select(Company.company_id).where(Company.company_name.ilike(f"%{company_name}%"))
+        ))
+
+    if question_at:
+        conditions.append(cast(Question.question_at, String).ilike(f"%{question_at}%"))
+
+    if tag:
+        conditions.append(Question.tag == tag)
+
+    return conditions
+
+
+# 목록 응답(QuestionResponse)에 필요한 컬럼만. ORM 인스턴스/identity map 없이 Row 로 읽는다.
+QUESTION_LIST_COLUMNS = (
+    Question.question_id,
+    Question.company_id,
+    Question.registrant_id,
+    Question.question,
+    Question.category,
+    Question.tag,
+    Question.question_at,
+)
+QuestionRow = row_class("QuestionRow", QUESTION_LIST_COLUMNS)
+
+
+def select_question_rows(*conditions):
+    """읽기 전용 질문 목록 select (soft delete 필터는 ORM 컬럼 select 에도 똑같이 붙는다)"""
+    return select(*QUESTION_LIST_COLUMNS).where(*conditions)
+
+
+def update_question(
+    db: Session, question_id: int, user_id: int, is_admin: bool,
+    question: str, category: Optional[str], tag: QuestionTag,
+) -> Optional[Question]:
+    """
+    등록자(관리자는 모두)의 질문만 수정한다 (UPDATE … WHERE owner 한 문장). 대상이 없거나 권한이 없으면 None.
+    돌려주는 Question 은 직무 태깅/이벤트 발행용 transient 객체다.
+    """
+    conditions = [Question.question_id == question_id, Question.visible_criteria()]
+    if not is_admin:
+        conditions.append(Question.registrant_id == user_id)
+    stmt = update(Question).where(*conditions).values(question=question, category=category, tag=tag)
+    row = update_returning(db, stmt, Question.company_id)
+    if row is None:
+        return None
+    return Question(question_id=question_id, company_id=row.company_id, question=question, category=category, tag=tag)
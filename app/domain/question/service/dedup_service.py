@@ -0,0 +1,284 @@
+"""
+질문 텍스트 near-duplicate 탐지.
+
+문자 3-gram shingle 집합의 MinHash 시그니처(NUM_PERM개)를 BANDS개 밴드로 나눠 LSH 버킷에 넣는다.
+같은 버킷을 하나라도 공유하는 질문만 후보로 보고, 시그니처 일치 비율(추정 Jaccard 유사도)로 최종 판정한다.
+시그니처는 question_signature 테이블에 저장되어 재시작 시 다시 계산하지 않고 인덱스를 복원한다.
+"""
+import array
+import operator
+import os
+import random
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from app.domain.question.model.question import Question
+from app.domain.question.model.question_signature import QuestionSignature
+from app.domain.question.service.text import char_shingles
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+DUPLICATE_THRESHOLD = float(os.getenv("QUESTION_DUPLICATE_THRESHOLD", "0.8"))
+
+_MERSENNE = (1 << 61) - 1
+_MASK = 0xFFFFFFFF
+# 시그니처가 DB에 저장되므로 해시 파라미터는 고정 시드로 만든다 (바꾸면 rebuild 필요)
+_rng = random.Random(20250901)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)]
+_BAND_BYTES = ROWS * 4
+
+
+def minhash(text: str) -> Optional[bytes]:
+    """질문 텍스트의 MinHash 시그니처 (uint32 x NUM_PERM). 비교할 문자가 없으면 None."""
+    hashes = {zlib.crc32(shingle.encode("utf-8")) for shingle in char_shingles(text)}
+    if not hashes:
+        return None
+    return array.array("I", [
+        min((a * x + b) % _MERSENNE for x in hashes) & _MASK
+        for a, b in _PERMUTATIONS
+    ]).tobytes()
+
+
+def similarity(left: array.array, right: array.array) -> float:
+    """두 시그니처(array)의 추정 Jaccard 유사도"""
+    return sum(map(operator.eq, left, right)) / NUM_PERM
+
+
+def _band_keys(signature: bytes) -> List[int]:
+    return [
+        zlib.crc32(signature[band * _BAND_BYTES:(band + 1) * _BAND_BYTES]) | (band << 32)
+        for band in range(BANDS)
+    ]
+
+
+class LSHIndex:
+    def __init__(self):
+        # 비교가 잦으므로 시그니처는 array로 풀어서 보관한다 (bytes와 크기는 비슷하다)
+        self._signatures: Dict[int, array.array] = {}
+        # 버킷 값은 메모리를 아끼려고 질문이 하나면 int, 여럿이면 set으로 둔다
+        self._buckets: Dict[int, object] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def add(self, question_id: int, signature: bytes):
+        with self._lock:
+            if question_id in self._signatures:
+                self._remove(question_id)
+            self._signatures[question_id] = array.array("I", signature)
+            for key in _band_keys(signature):
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    self._buckets[key] = question_id
+                elif isinstance(bucket, set):
+                    bucket.add(question_id)
+                else:
+                    self._buckets[key] = {bucket, question_id}
+
+    def remove(self, question_id: int):
+        with self._lock:
+            self._remove(question_id)
+
+    def _remove(self, question_id: int):
+        signature = self._signatures.pop(question_id, None)
+        if signature is None:
+            return
+        for key in _band_keys(signature.tobytes()):
+            bucket = self._buckets.get(key)
+            if isinstance(bucket, set):
+                bucket.discard(question_id)
+                if len(bucket) == 1:
+                    self._buckets[key] = next(iter(bucket))
+            elif bucket == question_id:
+                del self._buckets[key]
+
+    def candidates(self, signature: bytes) -> Set[int]:
+        found = set()
+        with self._lock:
+            for key in _band_keys(signature):
+                bucket = self._buckets.get(key)
+                if isinstance(bucket, set):
+                    found.update(bucket)
+                elif bucket is not None:
+                    found.add(bucket)
+        return found
+
+    def query(self, signature: bytes, threshold: float = DUPLICATE_THRESHOLD) -> List[Tuple[int, float]]:
+        """threshold 이상 유사한 질문을 유사도 내림차순으로 돌려줍니다."""
+        matches = []
+        values = array.array("I", signature)
+        for question_id in self.candidates(signature):
+            other = self._signatures.get(question_id)
+            if other is None:
+                continue
+            score = similarity(values, other)
+            if score >= threshold:
+                matches.append((question_id, score))
+        return sorted(matches, key=lambda match: -match[1])
+
+    def items(self) -> List[Tuple[int, bytes]]:
+        with self._lock:
+            return [(question_id, signature.tobytes()) for question_id, signature in self._signatures.items()]
+
+
+_index: Optional[LSHIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index(db: Session) -> LSHIndex:
+    """저장된 시그니처로 인덱스를 (처음 한 번) 메모리에 올립니다. 삭제 대기 중인 질문은 제외됩니다."""
+    global _index
+    if _index is not None:
+        return _index
+    with _index_lock:
+        if _index is None:
+            index = LSHIndex()
+            rows = db.execute(
+                select(QuestionSignature.question_id, QuestionSignature.signature)
+                .join(Question, Question.question_id == QuestionSignature.question_id)
+                .execution_options(yield_per=5000)
+            )
+            for question_id, signature in rows:
+                index.add(question_id, signature)
+            _index = index
+    return _index
+
+
+def get_loaded_index() -> Optional[LSHIndex]:
+    return _index
+
+
+def invalidate_index():
+    """대량 삭제처럼 개별 반영이 어려운 변경 후 호출하면 다음 사용 시 다시 읽어옵니다."""
+    global _index
+    _index = None
+
+
+def find_duplicates(db: Session, text: str, pending: Optional[LSHIndex] = None) -> Tuple[Optional[bytes], List[Tuple[int, float]]]:
+    """
+    text와 유사한 기존 질문을 찾습니다. (시그니처, [(question_id, 유사도)])를 돌려줍니다.
+    pending에는 같은 업로드 안에서 먼저 처리한 row들을 넣어 파일 내부 중복도 잡는다.
+    pending의 id는 아직 DB id가 아니라 업로드 내 row 번호(음수)다.
+    """
+    signature = minhash(text)
+    return signature, match_signature(db, signature, pending)
+
+
+def match_signature(db: Session, signature: Optional[bytes], pending: Optional[LSHIndex] = None) -> List[Tuple[int, float]]:
+    """이미 계산한 시그니처(대량 업로드는 워커 프로세스에서 계산)로 유사 질문을 찾습니다."""
+    if signature is None:
+        return []
+    matches = get_index(db).query(signature)
+    if pending is not None:
+        matches += pending.query(signature)
+    return matches
+
+
+def save_signatures(db: Session, signatures: Iterable[Tuple[int, bytes]]):
+    """새 질문들의 시그니처를 저장합니다. 커밋 후 index_signatures로 메모리 인덱스에 반영하세요."""
+    rows = [{"question_id": question_id, "signature": signature} for question_id, signature in signatures if signature]
+    if rows:
+        db.execute(insert(QuestionSignature), rows)
+
+
+def update_signature(db: Session, question_id: int, signature: Optional[bytes]):
+    if signature is None:
+        return
+    updated = db.execute(
+        update(QuestionSignature).where(QuestionSignature.question_id == question_id)
+        .values(signature=signature)
+    ).rowcount
+    if not updated:
+        save_signatures(db, [(question_id, signature)])
+
+
+def index_signatures(signatures: Iterable[Tuple[int, bytes]]):
+    if _index is None:
+        return
+    for question_id, signature in signatures:
+        if signature:
+            _index.add(question_id, signature)
+
+
+def sync_questions(db: Session, question_ids: List[int]):
+    """다른 워커에서 추가/수정/삭제된 질문의 시그니처를 DB에서 다시 읽어 메모리 인덱스에 맞춘다."""
+    if _index is None or not question_ids:
+        return
+    rows = dict(db.execute(
+        select(QuestionSignature.question_id, QuestionSignature.signature)
+        .join(Question, Question.question_id == QuestionSignature.question_id)
+        .where(QuestionSignature.question_id.in_(question_ids))
+    ).all())
+    for question_id in question_ids:
+        _index.remove(question_id)
+        if rows.get(question_id):
+            _index.add(question_id, rows[question_id])
+
+
+def forget_question(question_id: int):
+    if _index is not None:
+        _index.remove(question_id)
+
+
+def duplicate_report(db: Session, threshold: float = DUPLICATE_THRESHOLD, limit: int = 100) -> List[dict]:
+    """
+    기존 질문 전체에서 near-duplicate 묶음을 찾습니다. 큰 묶음부터 limit개를 돌려줍니다.
+    """
+    index = get_index(db)
+    parent: Dict[int, int] = {}
+
+    def find(x):
+        while parent.get(x, x) != x:
+            parent[x] = parent.get(parent[x], parent[x])
+            x = parent[x]
+        return x
+
+    for question_id, signature in index.items():
+        for other_id, _ in index.query(signature, threshold):
+            if other_id != question_id:
+                root, other_root = find(question_id), find(other_id)
+                if root != other_root:
+                    parent[max(root, other_root)] = min(root, other_root)
+
+    clusters: Dict[int, Set[int]] = {}
+    for question_id in list(parent):
+        root = find(question_id)
+        clusters.setdefault(root, {root}).add(question_id)
+    groups = sorted((sorted(ids) for ids in clusters.values() if len(ids) > 1), key=lambda ids: (-len(ids), ids[0]))[:limit]
+
+    texts = {}
+    ids = [question_id for group in groups for question_id in group]
+    for start in range(0, len(ids), 1000):
+        texts.update(db.execute(
+            select(Question.question_id, Question.question).where(Question.question_id.in_(ids[start:start + 1000]))
+        ).all())
+    return [
+        {"question_ids": group, "questions": [texts.get(question_id) for question_id in group]}
+        for group in groups
+    ]
+
+
+def rebuild_signatures(db: Session, chunk_size: int = 1000) -> int:
+    """시그니처가 없는 질문의 시그니처를 계산해 저장합니다 (기존 데이터 backfill). 처리한 질문 수를 반환."""
+    total = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Question.question_id, Question.question)
+            .outerjoin(QuestionSignature, QuestionSignature.question_id == Question.question_id)
+            .where(QuestionSignature.question_id.is_(None), Question.question_id > last_id)
+            .order_by(Question.question_id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        save_signatures(db, [(question_id, minhash(text)) for question_id, text in rows])
+        db.commit()
+        total += len(rows)
+        last_id = rows[-1].question_id
+    invalidate_index()
+    return total
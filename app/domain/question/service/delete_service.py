@@ -0,0 +1,120 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from core.changes import record_deletion
+from core.purge import CascadeStep, SET_BASED, delete_cascade, purge_cascade
+from core.soft_delete import SOFT_DELETE_ENABLED
+from app.domain.question.model.question import Question
+from app.domain.question.model.answer import Answer
+from app.domain.question.model.answer_comment import AnswerComment
+from app.domain.question.model.question_position import QuestionPosition
+from app.domain.question.model.question_signature import QuestionSignature
+from app.domain.question.model.question_similarity import QuestionSimilarity
+from app.domain.question.model.question_stat import QuestionStat
+
+
+# cascade 함수는 id 서브쿼리 대신 루트 테이블에 대한 조건을 받는다.
+# MySQL은 DELETE 대상 테이블을 같은 문장의 서브쿼리에서 읽을 수 없기 때문이다.
+
+def answer_cascade(answer_where) -> List[CascadeStep]:
+    """answer_where 조건의 답변에 대해 댓글 → 답변 순서의 삭제 단계"""
+    answer_ids = select(Answer.answer_id).where(answer_where)
+    return [
+        CascadeStep(AnswerComment, AnswerComment.answer_id.in_(answer_ids), AnswerComment.answer_comment_id),
+        CascadeStep(Answer, answer_where, Answer.answer_id),
+    ]
+
+
+def question_cascade(question_where) -> List[CascadeStep]:
+    """question_where 조건의 질문에 대해 댓글 → 답변 → 시그니처/유사도/직무 태그/집계 → 질문 순서의 삭제 단계"""
+    question_ids = select(Question.question_id).where(question_where)
+    answer_ids = select(Answer.answer_id).where(Answer.question_id.in_(question_ids))
+    return [
+        CascadeStep(AnswerComment, AnswerComment.answer_id.in_(answer_ids), AnswerComment.answer_comment_id),
+        CascadeStep(Answer, Answer.question_id.in_(question_ids), Answer.answer_id),
+        CascadeStep(QuestionSignature, QuestionSignature.question_id.in_(question_ids), QuestionSignature.question_id),
+        CascadeStep(
+            QuestionPosition, QuestionPosition.question_id.in_(question_ids),
+            (QuestionPosition.question_id, QuestionPosition.position_id),
+        ),
+        CascadeStep(
+            QuestionSimilarity, QuestionSimilarity.question_id.in_(question_ids),
+            (QuestionSimilarity.question_id, QuestionSimilarity.similar_question_id),
+        ),
+        CascadeStep(
+            QuestionSimilarity, QuestionSimilarity.similar_question_id.in_(question_ids),
+            (QuestionSimilarity.question_id, QuestionSimilarity.similar_question_id),
+        ),
+        CascadeStep(QuestionStat, QuestionStat.question_id.in_(question_ids), QuestionStat.question_id),
+        CascadeStep(Question, question_where, Question.question_id),
+    ]
+
+
+def _mark_deleted(db: Session, model, where, deleted_at: datetime):
+    db.execute(
+        update(model).where(where, model.deleted_at.is_(None)).values(deleted_at=deleted_at)
+        .execution_options(**SET_BASED)
+    )
+
+
+def mark_answers_deleted(db: Session, answer_where, deleted_at: datetime):
+    """
+    answer_where 조건의 답변과 하위 댓글에 deleted_at 을 기록합니다.
+    조회 필터는 row 자신의 deleted_at 만 보므로 하위 row 에도 같이 기록해야 숨겨집니다.
+    """
+    answer_ids = select(Answer.answer_id).where(answer_where)
+    _mark_deleted(db, AnswerComment, AnswerComment.answer_id.in_(answer_ids), deleted_at)
+    _mark_deleted(db, Answer, answer_where, deleted_at)
+
+
+def mark_questions_deleted(db: Session, question_where, deleted_at: datetime):
+    """question_where 조건의 질문과 하위 답변/댓글에 deleted_at 을 기록합니다."""
+    question_ids = select(Question.question_id).where(question_where)
+    mark_answers_deleted(db, Answer.question_id.in_(question_ids), deleted_at)
+    _mark_deleted(db, Question, question_where, deleted_at)
+
+
+def delete_question(db: Session, question_id: int):
+    """질문과 하위 답변/댓글을 삭제합니다. soft delete 모드에서는 표시만 하고 purger에 맡깁니다."""
+    if SOFT_DELETE_ENABLED:
+        mark_questions_deleted(db, Question.question_id == question_id, datetime.utcnow())
+    else:
+        delete_cascade(db, question_cascade(Question.question_id == question_id))
+
+
+def _parent_id(db: Session, parent_column, pk, id_value):
+    return db.execute(select(parent_column).where(pk == id_value).execution_options(include_deleted=True)).scalar()
+
+
+def delete_answer(db: Session, answer_id: int, question_id: Optional[int] = None):
+    """
+    답변과 하위 댓글을 삭제합니다. soft delete 모드에서는 표시만 하고 purger에 맡깁니다.
+    질문별 since 조회가 삭제를 알 수 있도록 tombstone 을 남깁니다 (시퀀스 잠금은 마지막에).
+    권한 확인 때 question_id 를 이미 읽었으면 넘겨서 조회를 한 번 줄입니다.
+    """
+    if question_id is None:
+        question_id = _parent_id(db, Answer.question_id, Answer.answer_id, answer_id)
+    if SOFT_DELETE_ENABLED:
+        mark_answers_deleted(db, Answer.answer_id == answer_id, datetime.utcnow())
+    else:
+        delete_cascade(db, answer_cascade(Answer.answer_id == answer_id))
+    if question_id is not None:
+        record_deletion(db, "answer", answer_id, question_id)
+
+
+def delete_answer_comment(db: Session, comment_id: int, answer_id: Optional[int] = None):
+    """댓글은 하위 row가 없으므로 항상 바로 삭제합니다. (답변별 since 조회용 tombstone 포함)"""
+    if answer_id is None:
+        answer_id = _parent_id(db, AnswerComment.answer_id, AnswerComment.answer_comment_id, comment_id)
+    delete_cascade(db, [CascadeStep(AnswerComment, AnswerComment.answer_comment_id == comment_id, AnswerComment.answer_comment_id)])
+    if answer_id is not None:
+        record_deletion(db, "comment", comment_id, answer_id)
+
+
+def purge_deleted_questions(db: Session, batch_size: int, max_batches: int) -> int:
+    return purge_cascade(db, question_cascade(Question.deleted_at.is_not(None)), batch_size, max_batches)
+
+
+def purge_deleted_answers(db: Session, batch_size: int, max_batches: int) -> int:
+    return purge_cascade(db, answer_cascade(Answer.deleted_at.is_not(None)), batch_size, max_batches)
@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+import tempfile
+from typing import Iterator, List
+from sqlalchemy import select
+from core.database import ReadSessionLocal
+from app.domain.question.model.question import Question
+from app.domain.company.model.company import Company
+
+# 업로드(create_questions_from_csv) 형식과 같은 컬럼 순서. tag는 업로드 시 무시된다.
+EXPORT_COLUMNS = ["company", "question", "category", "question_at", "tag"]
+
+# 서버 사이드 커서에서 한 번에 가져오는 row 수
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _export_statement(conditions: List):
+    return (
+        select(
+            Company.company_name,
+            Question.question,
+            Question.category,
+            Question.question_at,
+            Question.tag,
+        )
+        .join(Company, Question.company_id == Company.company_id)
+        .where(*conditions)
+        .order_by(Question.question_id)
+    )
+
+
+def _iter_chunks(conditions: List) -> Iterator[List[list]]:
+    """
+    조회 결과를 EXPORT_CHUNK_SIZE 단위로 돌려줍니다.
+    응답 스트리밍 도중에도 유지되어야 하므로 요청 세션(get_db)이 아닌 전용 읽기 세션을 씁니다.
+    """
+    db = ReadSessionLocal()
+    try:
+        result = db.execute(
+            _export_statement(conditions).execution_options(
+                stream_results=True, yield_per=EXPORT_CHUNK_SIZE
+            )
+        )
+        for partition in result.partitions():
+            yield [
+                [company_name, question, category, question_at.year, tag.value]
+                for company_name, question, category, question_at, tag in partition
+            ]
+    finally:
+        db.close()
+
+
+def stream_csv(conditions: List) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    # BOM 추가로 엑셀에서 한글 깨짐 방지 (sample-csv와 동일)
+    yield buffer.getvalue().encode("utf-8-sig")
+
+    for rows in _iter_chunks(conditions):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def stream_ndjson(conditions: List) -> Iterator[bytes]:
+    for rows in _iter_chunks(conditions):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+def stream_xlsx(conditions: List) -> Iterator[bytes]:
+    """
+    write-only 워크북은 row를 임시 파일에 바로 기록하므로 결과 크기와 관계없이 메모리가 일정합니다.
+    xlsx는 zip 포맷이라 저장이 끝난 뒤에야 전송할 수 있어, 임시 파일에 쓴 다음 나눠 보냅니다.
+    """
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("questions")
+    sheet.append(EXPORT_COLUMNS)
+    for rows in _iter_chunks(conditions):
+        for row in rows:
+            sheet.append(row)
+
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while chunk := file.read(64 * 1024):
+            yield chunk
+
+
+EXPORT_WRITERS = {
+    "csv": stream_csv,
+    "ndjson": stream_ndjson,
+    "xlsx": stream_xlsx,
+}
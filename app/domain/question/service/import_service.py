@@ -0,0 +1,255 @@
+"""
+질문 CSV/XLSX/ZIP 업로드.
+
+파일 파싱(인코딩 감지, XLSX 읽기, MinHash 시그니처 계산)은 CPU 작업이라 프로세스 풀에서 파일 단위로 병렬 처리하고,
+이벤트 루프가 있는 프로세스는 결과를 모아 회사 조회/생성, 중복 검사, bulk insert 만 한다.
+ZIP 은 안의 CSV/XLSX 를 모두 한 트랜잭션으로 넣는다 (한 파일이라도 잘못되면 전체를 거절).
+"""
+import asyncio
+import csv
+import io
+import multiprocessing
+import os
+import re
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+from core.sql import insert_many_returning_ids
+from app.domain.company.model.company import Company
+from app.domain.company.service import position_keyword_service
+from app.domain.question.model.question import Question, QuestionTag
+from app.domain.question.service import dedup_service, stat_service
+
+load_dotenv()
+
+# 파싱 워커 프로세스 수 (0 이면 CPU 수)
+IMPORT_WORKERS = int(os.getenv("IMPORT_WORKERS", "0")) or os.cpu_count() or 1
+# fork 는 부모의 스레드(캐시 버스, 로그 출력 등)가 잡고 있던 잠금까지 복사하므로 기본은 spawn
+IMPORT_START_METHOD = os.getenv("IMPORT_START_METHOD", "spawn")
+# ZIP 제한 (압축 폭탄 방지)
+IMPORT_MAX_FILES = int(os.getenv("IMPORT_MAX_FILES", "200"))
+IMPORT_MAX_UNCOMPRESSED_MB = int(os.getenv("IMPORT_MAX_UNCOMPRESSED_MB", "200"))
+
+REQUIRED_COLUMNS = ("company", "question", "category", "question_at")
+SUPPORTED_EXTENSIONS = (".csv", ".xlsx")
+# 회사명 IN 조회 한 번에 넣는 개수
+COMPANY_LOOKUP_CHUNK = 500
+
+
+class ParsedRow(NamedTuple):
+    company: str            # 정규화된 회사명
+    question: str
+    category: str
+    tag: QuestionTag
+    year: int
+    signature: Optional[bytes]
+
+
+class ParsedFile(NamedTuple):
+    name: str
+    rows: List[ParsedRow]
+    error: Optional[str] = None
+
+
+class ImportResult(NamedTuple):
+    question_ids: List[int]
+    company_ids: List[int]
+    signatures: List[Tuple[int, bytes]]
+    skipped: int
+    flagged: int
+    files: List[Dict]
+
+
+def normalize_company_name(company_name: str) -> str:
+    """회사명을 정규화합니다."""
+    # 공백 제거 및 소문자 변환
+    normalized = company_name.strip()
+
+    # 주식회사, (주), 회사 등 불필요한 접미사 제거
+    suffixes = ['주식회사', '(주)', '㈜', '회사', 'Inc', 'inc', 'Corp', 'corp', 'Co.', 'co.', 'Ltd', 'ltd', '(최종면접)', '(기술면접)', '(2차면접)', '(비대면면접)', 'ai 면접', '(컬쳐핏)', ]
+    for suffix in suffixes:
+        if normalized.endswith(suffix):
+            normalized = normalized[:-len(suffix)].strip()
+
+    # 특수문자 제거 (일부만)
+    normalized = re.sub(r'[^\w가-힣\s]', '', normalized)
+
+    return normalized.strip()
+
+
+def classify_tag(category: str) -> QuestionTag:
+    """tag 자동 분류 (기본값: tenacity)"""
+    return QuestionTag.TECHNOLOGY if "기술" in category or "개발" in category else QuestionTag.TENACITY
+
+
+def read_rows(name: str, content: bytes) -> List[Dict]:
+    """CSV/XLSX 를 헤더 기준 dict 목록으로 읽는다."""
+    if name.lower().endswith(".xlsx"):
+        import openpyxl
+        workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True)
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = next(rows, ())
+        return [dict(zip(headers, cells)) for cells in rows]
+
+    # CSV 파일 읽기 (한글 지원)
+    from charset_normalizer import from_bytes
+    encoding = from_bytes(content).best().encoding or "utf-8"
+    # sample-csv/export가 붙이는 BOM이 첫 컬럼명에 섞이지 않도록 제거
+    text = content.decode(encoding, errors="replace").lstrip("\ufeff")
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def parse_file(name: str, content: bytes) -> ParsedFile:
+    """워커 프로세스에서 실행된다. 잘못된 파일은 예외 대신 error 로 돌려준다."""
+    try:
+        rows = read_rows(name, content)
+    except Exception as e:
+        return ParsedFile(name, [], f"unreadable file: {e}")
+
+    parsed = []
+    for row_number, row in enumerate(rows, start=2):
+        if not all(key in row for key in REQUIRED_COLUMNS):
+            return ParsedFile(name, [], "CSV must contain: company, question, category, question_at")
+        if not row["question"]:
+            continue
+        try:
+            year = int(row["question_at"])
+        except (TypeError, ValueError):
+            return ParsedFile(name, [], f"row {row_number}: invalid question_at {row['question_at']!r}")
+        question, category = str(row["question"]), str(row["category"] or "")
+        parsed.append(ParsedRow(
+            company=normalize_company_name(str(row["company"] or "")),
+            question=question,
+            category=category,
+            tag=classify_tag(category),
+            year=year,
+            signature=dedup_service.minhash(question),
+        ))
+    return ParsedFile(name, parsed)
+
+
+def extract_archive(content: bytes) -> List[Tuple[str, bytes]]:
+    """ZIP 안의 CSV/XLSX (하위 폴더 포함, 숨김/macOS 메타 파일 제외)"""
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(content))
+    except zipfile.BadZipFile:
+        raise ValueError("Invalid ZIP archive")
+    members = [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and info.filename.lower().endswith(SUPPORTED_EXTENSIONS)
+        and not any(part.startswith((".", "__MACOSX")) for part in info.filename.split("/"))
+    ]
+    if not members:
+        raise ValueError("ZIP archive contains no CSV or XLSX files")
+    if len(members) > IMPORT_MAX_FILES:
+        raise ValueError(f"ZIP archive has too many files (max {IMPORT_MAX_FILES})")
+    if sum(info.file_size for info in members) > IMPORT_MAX_UNCOMPRESSED_MB * 1024 * 1024:
+        raise ValueError(f"ZIP archive is too large when extracted (max {IMPORT_MAX_UNCOMPRESSED_MB}MB)")
+    return [(info.filename, archive.read(info)) for info in sorted(members, key=lambda info: info.filename)]
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(IMPORT_WORKERS, mp_context=multiprocessing.get_context(IMPORT_START_METHOD))
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+async def parse_files(files: Sequence[Tuple[str, bytes]]) -> List[ParsedFile]:
+    """파일들을 프로세스 풀에서 병렬로 파싱한다 (입력 순서 유지)."""
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+    return list(await asyncio.gather(*(loop.run_in_executor(pool, parse_file, name, content) for name, content in files)))
+
+
+def resolve_companies(db: Session, names: Sequence[str]) -> Dict[str, int]:
+    """모든 파일의 회사명을 모아 IN 조회 몇 번과 bulk insert 한 번으로 id 를 정한다."""
+    names = sorted(set(names))
+    company_ids: Dict[str, int] = {}
+    for start in range(0, len(names), COMPANY_LOOKUP_CHUNK):
+        chunk = names[start:start + COMPANY_LOOKUP_CHUNK]
+        for company_id, company_name in db.execute(
+            select(Company.company_id, Company.company_name).where(Company.company_name.in_(chunk))
+            .order_by(Company.company_id)
+        ):
+            company_ids.setdefault(company_name, company_id)
+    missing = [name for name in names if name not in company_ids]
+    new_ids = insert_many_returning_ids(db, Company, Company.company_id, [{"company_name": name} for name in missing])
+    company_ids.update(zip(missing, new_ids))
+    return company_ids
+
+
+def load_questions(db: Session, registrant_id: int, files: Sequence[ParsedFile], on_duplicate: str) -> ImportResult:
+    """
+    파싱 결과를 한 트랜잭션으로 넣는다 (커밋은 호출한 쪽에서). 잘못된 파일이 있으면 아무것도 넣지 않고 ValueError.
+    중복 검사는 기존 질문과, 이번 업로드에서 먼저 나온 질문(모든 파일 통틀어) 모두를 대상으로 한다.
+    """
+    errors = [f"{parsed.name}: {parsed.error}" for parsed in files if parsed.error]
+    if errors:
+        raise ValueError("; ".join(errors))
+
+    company_ids = resolve_companies(db, [row.company for parsed in files for row in parsed.rows])
+
+    rows, signatures, summaries = [], [], []
+    pending = dedup_service.LSHIndex()  # 업로드 안의 중복 검사용 (row 순번을 음수 id 로 등록)
+    skipped = flagged = 0
+    for parsed in files:
+        file_skipped = file_flagged = inserted = 0
+        for row in parsed.rows:
+            if on_duplicate != "allow" and dedup_service.match_signature(db, row.signature, pending):
+                if on_duplicate == "skip":
+                    file_skipped += 1
+                    continue
+                file_flagged += 1
+            if row.signature:
+                pending.add(-(len(rows) + 1), row.signature)
+            rows.append({
+                "registrant_id": registrant_id,
+                "company_id": company_ids[row.company],
+                "question": row.question,
+                "category": row.category,
+                "tag": row.tag,
+                "question_at": date(row.year, 1, 1),  # 년도를 Date로 변환
+            })
+            signatures.append(row.signature)
+            inserted += 1
+        skipped += file_skipped
+        flagged += file_flagged
+        summaries.append({"file": parsed.name, "inserted": inserted, "skipped_duplicates": file_skipped, "flagged_duplicates": file_flagged})
+
+    question_ids = insert_many_returning_ids(db, Question, Question.question_id, rows)
+    question_signatures = [(question_id, signature) for question_id, signature in zip(question_ids, signatures) if signature]
+    dedup_service.save_signatures(db, question_signatures)
+    position_keyword_service.tag_questions(db, [
+        Question(question_id=question_id, question=row["question"], category=row["category"])
+        for question_id, row in zip(question_ids, rows)
+    ])
+    stat_service.create_stats(db, question_ids)
+    return ImportResult(
+        question_ids=question_ids,
+        company_ids=sorted({row["company_id"] for row in rows}),
+        signatures=question_signatures,
+        skipped=skipped,
+        flagged=flagged,
+        files=summaries,
+    )
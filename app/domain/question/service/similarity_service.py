@@ -0,0 +1,253 @@
+"""
+유사 질문 인덱스.
+
+질문 텍스트의 문자 2-gram/3-gram TF-IDF 벡터(L2 정규화)를 역색인(term → {question_id: weight})으로 메모리에 두고,
+코사인 유사도 top-k(다른 회사 질문만)를 question_similarity 테이블에 미리 계산해 둔다.
+API는 테이블만 읽고, 새 질문이 들어오면 해당 질문과 이웃들의 top-k만 증분 갱신한다.
+"""
+import heapq
+import math
+import os
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+from core.database import SessionLocal
+from app.domain.question.model.question import Question
+from app.domain.question.model.question_similarity import QuestionSimilarity
+from app.domain.question.service.text import char_shingles
+
+SIMILAR_TOP_K = int(os.getenv("SIMILAR_QUESTIONS_TOP_K", "10"))
+SIMILAR_MIN_SCORE = float(os.getenv("SIMILAR_QUESTIONS_MIN_SCORE", "0.2"))
+# 문서의 이 비율보다 흔한 n-gram은 ("해주세요" 등) 유사도 계산에서 뺀다
+MAX_DF_RATIO = float(os.getenv("SIMILAR_QUESTIONS_MAX_DF_RATIO", "0.05"))
+
+
+def _terms(text: str) -> Counter:
+    return Counter(char_shingles(text, 2) + char_shingles(text, 3))
+
+
+class SimilarityIndex:
+    def __init__(self):
+        self._vocabulary: Dict[str, int] = {}
+        self._df: Dict[int, int] = {}
+        self._postings: Dict[int, Dict[int, float]] = {}
+        self._docs: Dict[int, Tuple[int, Tuple[int, ...]]] = {}  # question_id → (company_id, term ids)
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _term_ids(self, counts: Counter) -> Dict[int, int]:
+        ids = {}
+        for term, count in counts.items():
+            term_id = self._vocabulary.get(term)
+            if term_id is None:
+                term_id = self._vocabulary[term] = len(self._vocabulary)
+            ids[term_id] = count
+        return ids
+
+    def _vector(self, term_counts: Dict[int, int]) -> Dict[int, float]:
+        total = len(self._docs) + 1
+        weights = {
+            term_id: (1 + math.log(count)) * (math.log(total / (self._df.get(term_id, 0) + 1)) + 1)
+            for term_id, count in term_counts.items()
+        }
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+        return {term_id: weight / norm for term_id, weight in weights.items()}
+
+    def build(self, documents: Iterable[Tuple[int, int, str]]):
+        """(question_id, company_id, text) 전체로 인덱스를 새로 만듭니다. df를 먼저 모두 센 뒤 가중치를 계산한다."""
+        with self._lock:
+            term_counts = {}
+            for question_id, company_id, text in documents:
+                counts = self._term_ids(_terms(text))
+                term_counts[question_id] = (company_id, counts)
+                for term_id in counts:
+                    self._df[term_id] = self._df.get(term_id, 0) + 1
+                self._docs[question_id] = (company_id, tuple(counts))
+            for question_id, (company_id, counts) in term_counts.items():
+                for term_id, weight in self._vector(counts).items():
+                    self._postings.setdefault(term_id, {})[question_id] = weight
+
+    def add(self, question_id: int, company_id: int, text: str):
+        with self._lock:
+            self.remove(question_id)
+            counts = self._term_ids(_terms(text))
+            for term_id in counts:
+                self._df[term_id] = self._df.get(term_id, 0) + 1
+            self._docs[question_id] = (company_id, tuple(counts))
+            for term_id, weight in self._vector(counts).items():
+                self._postings.setdefault(term_id, {})[question_id] = weight
+
+    def remove(self, question_id: int):
+        with self._lock:
+            doc = self._docs.pop(question_id, None)
+            if doc is None:
+                return
+            for term_id in doc[1]:
+                self._df[term_id] -= 1
+                self._postings.get(term_id, {}).pop(question_id, None)
+
+    def remove_company(self, company_id: int):
+        with self._lock:
+            for question_id in [qid for qid, doc in self._docs.items() if doc[0] == company_id]:
+                self.remove(question_id)
+
+    def question_ids(self) -> List[int]:
+        with self._lock:
+            return sorted(self._docs)
+
+    def neighbors(self, question_id: int, k: int = SIMILAR_TOP_K) -> List[Tuple[int, float]]:
+        """question_id와 다른 회사의 질문 중 코사인 유사도 상위 k개"""
+        with self._lock:
+            doc = self._docs.get(question_id)
+            if doc is None:
+                return []
+            company_id, term_ids = doc
+            max_df = max(int(len(self._docs) * MAX_DF_RATIO), 50)
+            scores: Dict[int, float] = {}
+            for term_id in term_ids:
+                postings = self._postings.get(term_id)
+                if not postings or len(postings) > max_df:
+                    continue
+                weight = postings.get(question_id, 0.0)
+                for other_id, other_weight in postings.items():
+                    scores[other_id] = scores.get(other_id, 0.0) + weight * other_weight
+            scores.pop(question_id, None)
+            candidates = (
+                (other_id, score) for other_id, score in scores.items()
+                if score >= SIMILAR_MIN_SCORE and self._docs[other_id][0] != company_id
+            )
+            return heapq.nlargest(k, candidates, key=lambda item: item[1])
+
+
+_index: Optional[SimilarityIndex] = None
+_index_lock = threading.Lock()
+
+
+def _load_documents(db: Session):
+    return db.execute(
+        select(Question.question_id, Question.company_id, Question.question)
+        .execution_options(yield_per=5000)
+    )
+
+
+def get_index(db: Session) -> SimilarityIndex:
+    global _index
+    if _index is not None:
+        return _index
+    with _index_lock:
+        if _index is None:
+            index = SimilarityIndex()
+            index.build(_load_documents(db))
+            _index = index
+    return _index
+
+
+def get_loaded_index() -> Optional[SimilarityIndex]:
+    return _index
+
+
+def rebuild_table(db: Session, chunk_size: int = 500) -> int:
+    """
+    전체 질문의 top-k를 다시 계산해 question_similarity를 채웁니다 (batch 작업).
+    질문 chunk_size개 단위로 교체/커밋하므로 작업 중에도 API는 기존 결과를 계속 읽을 수 있다.
+    """
+    global _index
+    index = SimilarityIndex()
+    index.build(_load_documents(db))
+    _index = index
+
+    question_ids = index.question_ids()
+    for start in range(0, len(question_ids), chunk_size):
+        chunk = question_ids[start:start + chunk_size]
+        rows = [
+            {"question_id": question_id, "similar_question_id": other_id, "score": score}
+            for question_id in chunk
+            for other_id, score in index.neighbors(question_id)
+        ]
+        db.execute(delete(QuestionSimilarity).where(QuestionSimilarity.question_id.in_(chunk)))
+        if rows:
+            db.execute(insert(QuestionSimilarity), rows)
+        db.commit()
+    return len(question_ids)
+
+
+def refresh_questions(question_ids: List[int]):
+    """
+    새로 추가/수정된 질문의 top-k를 계산하고, 이웃 질문들의 top-k에도 반영합니다.
+    요청 처리 뒤 BackgroundTasks에서 호출되므로 전용 세션을 씁니다.
+    """
+    if not question_ids:
+        return
+    db = SessionLocal()
+    try:
+        index = get_index(db)
+        documents = db.execute(
+            select(Question.question_id, Question.company_id, Question.question)
+            .where(Question.question_id.in_(question_ids))
+        ).all()
+        for question_id, company_id, text in documents:
+            index.add(question_id, company_id, text)
+
+        new_rows = {}
+        reverse: Dict[int, Dict[int, float]] = {}
+        for question_id, _, _ in documents:
+            neighbors = index.neighbors(question_id)
+            new_rows[question_id] = neighbors
+            for other_id, score in neighbors:
+                reverse.setdefault(other_id, {})[question_id] = score
+
+        # 이웃 질문들의 기존 top-k와 합쳐 다시 상위 k개만 남긴다
+        current: Dict[int, Dict[int, float]] = {}
+        for question_id, similar_id, score in db.execute(
+            select(QuestionSimilarity.question_id, QuestionSimilarity.similar_question_id, QuestionSimilarity.score)
+            .where(QuestionSimilarity.question_id.in_(list(reverse)))
+        ):
+            current.setdefault(question_id, {})[similar_id] = score
+        for other_id, additions in reverse.items():
+            merged = {**current.get(other_id, {}), **additions}
+            new_rows[other_id] = heapq.nlargest(SIMILAR_TOP_K, merged.items(), key=lambda item: item[1])
+
+        db.execute(delete(QuestionSimilarity).where(QuestionSimilarity.question_id.in_(list(new_rows))))
+        rows = [
+            {"question_id": question_id, "similar_question_id": other_id, "score": score}
+            for question_id, neighbors in new_rows.items()
+            for other_id, score in neighbors
+        ]
+        if rows:
+            db.execute(insert(QuestionSimilarity), rows)
+        db.commit()
+    finally:
+        db.close()
+
+
+def sync_questions(db: Session, question_ids: List[int]):
+    """다른 워커에서 바뀐 질문을 DB에서 다시 읽어 메모리 인덱스에 맞춘다 (인덱스가 없으면 다음 로드 때 반영)."""
+    if _index is None or not question_ids:
+        return
+    documents = db.execute(
+        select(Question.question_id, Question.company_id, Question.question)
+        .where(Question.question_id.in_(question_ids))
+    ).all()
+    for question_id in set(question_ids) - {row.question_id for row in documents}:
+        _index.remove(question_id)
+    for question_id, company_id, text in documents:
+        _index.add(question_id, company_id, text)
+
+
+def forget_question(question_id: int):
+    if _index is not None:
+        _index.remove(question_id)
+
+
+def invalidate_index():
+    global _index
+    _index = None
+
+
+def forget_company(company_id: int):
+    if _index is not None:
+        _index.remove_company(company_id)
@@ -0,0 +1,107 @@
+"""
+질문 조회수/답변 수 집계 (인기순 목록용).
+
+요청 처리 중에는 워커 메모리의 CounterBuffer 에 더하기만 하고, CounterFlusher 가 QUESTION_STAT_FLUSH_SECONDS 마다
+모인 증가분을 question_stat 에 upsert 한 번으로 반영한다. 워커마다 따로 모아 더하므로 워커 수와 상관없이 합이 맞고,
+워커가 비정상 종료하면 마지막 flush 이후의 증가분만 잃는다.
+"""
+import os
+from typing import List
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+from core.counter_buffer import CounterBuffer, CounterFlusher
+from core.database import SessionLocal
+from core.sql import upsert_increment
+from app.domain.question.model.answer import Answer
+from app.domain.question.model.question import Question
+from app.domain.question.model.question_stat import QuestionStat
+
+load_dotenv()
+
+QUESTION_STAT_FLUSH_SECONDS = float(os.getenv("QUESTION_STAT_FLUSH_SECONDS", "10"))
+# flush 사이에 모을 수 있는 서로 다른 질문 수 (넘으면 새 질문의 증가분은 버린다)
+QUESTION_STAT_MAX_PENDING = int(os.getenv("QUESTION_STAT_MAX_PENDING", "100000"))
+# 인기 점수에서 답변 하나가 조회 몇 번에 해당하는지
+POPULARITY_ANSWER_WEIGHT = int(os.getenv("POPULARITY_ANSWER_WEIGHT", "10"))
+
+VIEWS, ANSWERS = 0, 1
+
+_buffer = CounterBuffer(width=2, max_keys=QUESTION_STAT_MAX_PENDING)
+
+
+def record_view(question_id: int):
+    _buffer.add(question_id, VIEWS)
+
+
+def record_answer(question_id: int, delta: int = 1):
+    _buffer.add(question_id, ANSWERS, delta)
+
+
+def flush(session_factory=SessionLocal) -> int:
+    """모인 증가분을 한 트랜잭션으로 반영하고 반영한 질문 수를 돌려준다. 실패하면 증가분을 버퍼에 되돌린다."""
+    pending = _buffer.drain()
+    if not pending:
+        return 0
+    db = session_factory()
+    try:
+        # 그사이 purge 된 질문은 FK 위반이 나므로 빼고 넣는다 (soft delete 된 질문도 row 는 남아 있어 포함)
+        existing = set(db.execute(
+            select(Question.question_id).where(Question.question_id.in_(list(pending)))
+            .execution_options(include_deleted=True)
+        ).scalars())
+        rows = [
+            {
+                "question_id": question_id,
+                "view_count": views,
+                "answer_count": answers,
+                "score": views + POPULARITY_ANSWER_WEIGHT * answers,
+            }
+            for question_id, (views, answers) in sorted(pending.items())
+            if question_id in existing and (views or answers)
+        ]
+        upsert_increment(db.connection(), QuestionStat.__table__, ["question_id"], ["view_count", "answer_count", "score"], rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        _buffer.restore(pending)
+        raise
+    finally:
+        db.close()
+    return len(rows)
+
+
+flusher = CounterFlusher(flush, QUESTION_STAT_FLUSH_SECONDS)
+
+
+def snapshot() -> dict:
+    return {
+        "pending": len(_buffer),
+        "dropped": _buffer.dropped,
+        "flushes": flusher.flushes,
+        "failures": flusher.failures,
+    }
+
+
+def create_stats(db: Session, question_ids: List[int]):
+    """
+    질문의 question_stat row 를 0 으로 만든다 (이미 있으면 그대로, 커밋은 호출한 쪽에서).
+    인기순 목록은 question_stat 에 조인하므로 조회/답변이 없는 질문도 row 가 있어야 나온다.
+    """
+    upsert_increment(db.connection(), QuestionStat.__table__, ["question_id"], ["view_count", "answer_count", "score"], [
+        {"question_id": question_id, "view_count": 0, "answer_count": 0, "score": 0} for question_id in question_ids
+    ])
+
+
+def recount_answers(db: Session, question_ids: List[int]):
+    """question_stat 의 answer_count 를 실제 답변 수로 맞춘다 (backfill 용, 커밋은 호출한 쪽에서)."""
+    create_stats(db, question_ids)
+    answers = (
+        select(func.count(Answer.answer_id)).where(Answer.question_id == QuestionStat.question_id, Answer.visible_criteria())
+        .scalar_subquery()
+    )
+    db.execute(
+        update(QuestionStat).where(QuestionStat.question_id.in_(question_ids))
+        .values(answer_count=answers, score=QuestionStat.view_count + POPULARITY_ANSWER_WEIGHT * answers)
+        .execution_options(synchronize_session=False)
+    )
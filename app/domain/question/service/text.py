@@ -0,0 +1,25 @@
+import re
+import unicodedata
+from typing import List
+
+_NON_WORD = re.compile(r"[^\w가-힣]+")
+
+
+def normalize_question_text(text: str) -> str:
+    """
+    비교용으로 질문 텍스트를 정규화합니다.
+    유니코드 정규화(NFKC), 소문자화 후 문장부호/공백을 한 칸 공백으로 접는다.
+    """
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def char_shingles(text: str, size: int = 3) -> List[str]:
+    """
+    정규화된 텍스트의 문자 n-gram 목록. 한국어는 띄어쓰기가 흔들리므로 공백을 빼고 자른다.
+    텍스트가 size보다 짧으면 전체를 하나의 shingle로 쓴다.
+    """
+    compact = normalize_question_text(text).replace(" ", "")
+    if len(compact) <= size:
+        return [compact] if compact else []
+    return [compact[i:i + size] for i in range(len(compact) - size + 1)]
@@ -0,0 +1,114 @@
+"""
+목록 API 읽기 경로 벤치마크 (python manage.py bench-list-queries).
+같은 페이지를 ORM 인스턴스로 읽는 기존 경로와 컬럼 select() + slots 객체 경로로 읽어 응답 직렬화까지 비교한다.
+"""
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+from sqlalchemy.orm import Session, selectinload
+from api.schemas.answer import AnswerResponse
+from api.schemas.base import CursorPage
+from api.schemas.company import CompanyResponse, JobPostingResponse
+from api.schemas.question import QuestionResponse
+from core.pagination import paginate_cursor
+from app.domain.company.model.company import Company
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.repository.company_repository import (
+    CompanyRow, JobPostingRow, select_company_rows, select_job_posting_rows, with_tech_stacks,
+)
+from app.domain.question.model.answer import Answer
+from app.domain.question.model.question import Question
+from app.domain.question.repository.answer_repository import AnswerRow, select_answer_rows
+from app.domain.question.repository.question_repository import QuestionRow, select_question_rows
+
+
+def _busiest_question(db: Session) -> int:
+    from sqlalchemy import func, select
+    return db.execute(
+        select(Answer.question_id).group_by(Answer.question_id).order_by(func.count().desc()).limit(1)
+    ).scalar() or 0
+
+
+def _cases(question_id: int) -> Dict[str, Dict[str, Callable]]:
+    """이름 → {"orm": (db, cursor, size) → page, "core": ...}"""
+    def job_postings_core(db, cursor, size):
+        page = paginate_cursor(
+            select_job_posting_rows(), None, size, CompanyJobPosting.company_job_posting_id,
+            cursor=cursor, db=db, to_value=JobPostingRow.of,
+        )
+        with_tech_stacks(db, page.values)
+        return page
+
+    return {
+        "companies": {
+            "model": CompanyResponse,
+            "orm": lambda db, cursor, size: paginate_cursor(db.query(Company), None, size, Company.company_id, cursor=cursor),
+            "core": lambda db, cursor, size: paginate_cursor(select_company_rows(), None, size, Company.company_id, cursor=cursor, db=db, to_value=CompanyRow.of),
+        },
+        "job_postings": {
+            "model": JobPostingResponse,
+            "orm": lambda db, cursor, size: paginate_cursor(
+                db.query(CompanyJobPosting).options(selectinload(CompanyJobPosting.tech_stacks)),
+                None, size, CompanyJobPosting.company_job_posting_id, cursor=cursor,
+            ),
+            "core": job_postings_core,
+        },
+        "questions": {
+            "model": QuestionResponse,
+            "orm": lambda db, cursor, size: paginate_cursor(db.query(Question), None, size, Question.question_id, cursor=cursor),
+            "core": lambda db, cursor, size: paginate_cursor(select_question_rows(), None, size, Question.question_id, cursor=cursor, db=db, to_value=QuestionRow.of),
+        },
+        "question_answers": {
+            "model": AnswerResponse,
+            "orm": lambda db, cursor, size: paginate_cursor(
+                db.query(Answer).filter(Answer.question_id == question_id), None, size, Answer.answer_id, cursor=cursor,
+            ),
+            "core": lambda db, cursor, size: paginate_cursor(select_answer_rows(question_id), None, size, Answer.answer_id, cursor=cursor, db=db, to_value=AnswerRow.of),
+        },
+    }
+
+
+def _run(session_factory, fetch, model, pages: int, size: int) -> dict:
+    """요청마다 새 세션으로 pages 페이지를 읽고 JSON 으로 직렬화한다. 페이지별 할당 peak 를 잰다."""
+    response = CursorPage[model]
+    rows, peaks, cursor = 0, [], None
+    elapsed = 0.0
+    for _ in range(pages):
+        db = session_factory()
+        try:
+            tracemalloc.start()
+            started = time.perf_counter()
+            page = fetch(db, cursor, size)
+            response.model_validate(page, from_attributes=True).model_dump_json()
+            elapsed += time.perf_counter() - started
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        finally:
+            db.close()
+        rows += len(page.values)
+        cursor = page.next_cursor
+        if not cursor:
+            break
+    return {
+        "pages": len(peaks),
+        "rows": rows,
+        "rows_per_sec": round(rows / elapsed) if elapsed else 0,
+        "peak_kib_per_page": round(sum(peaks) / len(peaks) / 1024, 1) if peaks else 0.0,
+    }
+
+
+def run(session_factory, pages: int = 20, size: int = 100, repeat: int = 3) -> List[dict]:
+    """목록별 ORM/Core 결과. tracemalloc 오버헤드가 양쪽에 같이 들어가므로 절대값보다 비율을 본다."""
+    db = session_factory()
+    try:
+        question_id = _busiest_question(db)
+    finally:
+        db.close()
+
+    results = []
+    for name, case in _cases(question_id).items():
+        for path in ("orm", "core"):
+            runs = [_run(session_factory, case[path], case["model"], pages, size) for _ in range(repeat)]
+            best = max(runs, key=lambda result: result["rows_per_sec"])
+            results.append({"list": name, "path": path, **best})
+    return results
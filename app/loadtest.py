@@ -0,0 +1,253 @@
+"""
+부하 테스트용 시드 데이터, 기본 트래픽 믹스, Clerk 인증 스텁 (python manage.py load-test).
+"""
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine, make_url
+from core.database import Base, SessionLocal
+from core.load_harness import MixEntry
+from app.domain.user.model.user import User
+from app.domain.user.model.goal_company import GoalCompany
+from app.domain.user.model.user_position import UserPosition
+from app.domain.company.model.company import Company
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.model.keywords_by_position import KeywordsByPosition
+from app.domain.company.model.position import Position
+from app.domain.company.model.tech_stack import TechStack
+from app.domain.company.service import position_keyword_service, tech_stack_service
+from app.domain.question.model.question import Question, QuestionTag
+from app.domain.question.model.answer import Answer
+from app.domain.question.model.answer_comment import AnswerComment
+from app.domain.question.model.question_stat import QuestionStat
+from app.domain.question.service import dedup_service, stat_service
+# create_all 이 모든 테이블을 만들도록 나머지 모델도 등록
+import app.domain.company.model.company_analyze  # noqa: F401
+import app.domain.company.model.job_posting_position  # noqa: F401
+import app.domain.company.model.tech_stack_stat  # noqa: F401
+import app.domain.question.model.question_position  # noqa: F401
+import app.domain.question.model.question_signature  # noqa: F401
+import app.domain.question.model.question_similarity  # noqa: F401
+import core.cache_bus  # noqa: F401
+
+LOAD_TEST_EMAIL = "loadtest@interviewq.local"
+INSERT_CHUNK = 1000
+POOL_LIMIT = 10000
+
+# 실제 트래픽 비율을 흉내 낸 기본 믹스 (목록/상세 조회 위주, 쓰기는 소량)
+DEFAULT_MIX = [
+    MixEntry("GET /questions", 25, {"size": 20}),
+    MixEntry("GET /questions/{question_id}", 15),
+    MixEntry("GET /questions/{question_id}/answers", 10),
+    MixEntry("GET /questions/{question_id}/similar", 4),
+    MixEntry("GET /questions/my-position", 5),
+    MixEntry("GET /companies", 8, {"size": 20}),
+    MixEntry("GET /companies/{company_id}", 5),
+    MixEntry("GET /companies/{company_id}/overview", 8),
+    MixEntry("GET /companies/job-postings", 5),
+    MixEntry("GET /companies/tech-stacks", 3),
+    MixEntry("GET /answers/{answer_id}/comments", 4),
+    MixEntry("GET /users", 3),
+    MixEntry("POST /questions/single", 2, {"on_duplicate": "allow"}),
+    MixEntry("POST /questions/{question_id}/answers", 3),
+]
+
+POSITIONS = {
+    "백엔드": "백엔드, backend, server, spring, django, fastapi, api",
+    "프론트엔드": "프론트엔드, frontend, react, vue, typescript, 웹 성능",
+    "데이터": "데이터, data, spark, sql, 파이프라인, airflow",
+    "모바일": "모바일, ios, android, kotlin, swift, flutter",
+    "인프라": "인프라, devops, kubernetes, aws, terraform, 모니터링",
+}
+TECHS = ["Python", "Java", "Spring Boot", "Django", "FastAPI", "React", "Vue.js", "TypeScript",
+         "Kotlin", "Swift", "MySQL", "PostgreSQL", "Redis", "Kafka", "AWS", "Kubernetes", "Docker"]
+COMPANY_PREFIXES = ["한빛", "누리", "다온", "새별", "온길", "하늘", "바른", "미래", "가온", "푸른"]
+COMPANY_SUFFIXES = ["소프트", "테크", "랩스", "데이터", "페이", "모빌리티", "헬스케어", "커머스", "게임즈", "클라우드"]
+QUESTION_TEMPLATES = [
+    "{tech}를 사용하면서 겪은 가장 어려운 장애와 해결 과정을 설명해 주세요.",
+    "{tech}의 내부 동작 원리와 다른 선택지 대비 장단점은 무엇인가요?",
+    "{tech} 기반 서비스의 트래픽이 10배 늘어난다면 무엇부터 개선하겠습니까?",
+    "팀에서 {tech} 도입을 반대하는 동료를 어떻게 설득하시겠어요?",
+    "{tech} 코드 리뷰에서 가장 자주 지적하는 부분은 무엇인가요?",
+    "실패한 프로젝트에서 배운 점을 {tech} 경험과 함께 말씀해 주세요.",
+]
+CATEGORIES = ["기술면접", "인성면접", "1차면접", "최종면접", "코딩테스트"]
+
+
+@dataclass
+class SeedVolumes:
+    users: int = 50
+    companies: int = 300
+    questions_per_company: int = 30
+    answers_per_question: int = 2
+    comments_per_answer: int = 1
+    postings_per_company: int = 3
+    techs_per_posting: int = 4
+
+
+def is_local_database(url: str) -> bool:
+    """시드는 로컬 DB에만 넣는다 (운영 DB에 가짜 데이터가 들어가지 않도록)"""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" or parsed.host in (None, "localhost", "127.0.0.1", "::1")
+
+
+def _next_id(connection, column) -> int:
+    return (connection.execute(select(func.max(column))).scalar() or 0) + 1
+
+
+def _insert(connection, model, rows: List[dict]):
+    for start in range(0, len(rows), INSERT_CHUNK):
+        connection.execute(insert(model), rows[start:start + INSERT_CHUNK])
+
+
+def seed_database(engine: Engine, volumes: SeedVolumes, seed: int = 0) -> Dict[str, int]:
+    """
+    테이블을 만들고 volumes 만큼 그럴듯한 데이터를 추가합니다 (기존 데이터는 그대로 두고 id 뒤에 이어 붙인다).
+    bulk INSERT 는 ORM 이벤트를 거치지 않으므로 기술스택 카운터, 직무 태그, 중복 탐지 시그니처는 끝에서 다시 계산한다.
+    테이블별로 추가한 row 수를 반환.
+    """
+    rng = random.Random(seed)
+    Base.metadata.create_all(engine)
+    counts = {}
+    with engine.begin() as conn:
+        if not conn.execute(select(User.user_id).where(User.email == LOAD_TEST_EMAIL)).first():
+            conn.execute(insert(User).values(
+                user_id=_next_id(conn, User.user_id), nickname="loadtest", email=LOAD_TEST_EMAIL,
+                role="user", is_onboarding=False,
+            ))
+        existing = set(conn.execute(select(Position.position_name)).scalars())
+        position_id = _next_id(conn, Position.position_id)
+        keyword_id = _next_id(conn, KeywordsByPosition.keywords_by_position_id)
+        for name, keywords in POSITIONS.items():
+            if name in existing:
+                continue
+            conn.execute(insert(Position).values(position_id=position_id, position_name=name))
+            conn.execute(insert(KeywordsByPosition).values(
+                keywords_by_position_id=keyword_id, position_id=position_id, keywords=keywords,
+            ))
+            position_id, keyword_id = position_id + 1, keyword_id + 1
+        position_ids = list(conn.execute(select(Position.position_id)).scalars())
+
+        first_user = _next_id(conn, User.user_id)
+        users = [
+            {"user_id": first_user + i, "nickname": f"user{first_user + i}", "email": f"user{first_user + i}@loadtest.local",
+             "role": "user", "is_onboarding": False}
+            for i in range(volumes.users)
+        ]
+        user_ids = [row["user_id"] for row in users] or [first_user - 1]
+
+        first_company = _next_id(conn, Company.company_id)
+        companies = [
+            {"company_id": first_company + i,
+             "company_name": f"{rng.choice(COMPANY_PREFIXES)}{rng.choice(COMPANY_SUFFIXES)} {first_company + i}"}
+            for i in range(volumes.companies)
+        ]
+        company_ids = [row["company_id"] for row in companies]
+
+        postings, stacks = [], []
+        posting_id = _next_id(conn, CompanyJobPosting.company_job_posting_id)
+        stack_id = _next_id(conn, TechStack.tech_stack_id)
+        for company_id in company_ids:
+            for _ in range(volumes.postings_per_company):
+                position = rng.choice(list(POSITIONS))
+                techs = rng.sample(TECHS, min(max(volumes.techs_per_posting, 1), len(TECHS)))
+                postings.append({
+                    "company_job_posting_id": posting_id, "company_id": company_id, "job_id": str(posting_id),
+                    "overview": f"{position} 엔지니어 채용", "key_responsibilities": f"{', '.join(techs)} 기반 서비스 개발",
+                    "preferred_qualifications": f"{techs[0]} 운영 경험", "employment_type": "정규직",
+                    "application_deadline": date.today() + timedelta(days=rng.randint(1, 60)), "work_location": "서울",
+                })
+                for tech in techs:
+                    stacks.append({"tech_stack_id": stack_id, "company_job_position_id": posting_id, "tech_name": tech})
+                    stack_id += 1
+                posting_id += 1
+
+        questions, answers, comments = [], [], []
+        question_id = _next_id(conn, Question.question_id)
+        answer_id = _next_id(conn, Answer.answer_id)
+        comment_id = _next_id(conn, AnswerComment.answer_comment_id)
+        for company_id in company_ids:
+            for _ in range(volumes.questions_per_company):
+                tech = rng.choice(TECHS)
+                questions.append({
+                    "question_id": question_id, "company_id": company_id, "registrant_id": rng.choice(user_ids),
+                    "question": rng.choice(QUESTION_TEMPLATES).format(tech=tech), "category": rng.choice(CATEGORIES),
+                    "tag": rng.choice(list(QuestionTag)), "question_at": date.today() - timedelta(days=rng.randint(0, 1500)),
+                })
+                for _ in range(volumes.answers_per_question):
+                    answers.append({"answer_id": answer_id, "question_id": question_id, "user_id": rng.choice(user_ids),
+                                    "answer": f"{tech} 경험을 바탕으로 답변드리면, 측정 → 원인 분석 → 개선 순서로 접근했습니다."})
+                    for _ in range(volumes.comments_per_answer):
+                        comments.append({"answer_comment_id": comment_id, "answer_id": answer_id,
+                                         "user_id": rng.choice(user_ids), "comment": "구체적인 수치가 있으면 더 좋겠습니다."})
+                        comment_id += 1
+                    answer_id += 1
+                question_id += 1
+
+        for model, rows in (
+            (User, users), (Company, companies), (CompanyJobPosting, postings), (TechStack, stacks),
+            (Question, questions), (Answer, answers), (AnswerComment, comments),
+            (QuestionStat, [
+                {"question_id": row["question_id"], "view_count": 0, "answer_count": volumes.answers_per_question,
+                 "score": stat_service.POPULARITY_ANSWER_WEIGHT * volumes.answers_per_question}
+                for row in questions
+            ]),
+        ):
+            _insert(conn, model, rows)
+            counts[model.__tablename__] = len(rows)
+        load_user = conn.execute(select(User.user_id).where(User.email == LOAD_TEST_EMAIL)).scalar()
+        # my-position 목록이 비지 않도록 부하 테스트 사용자에게 직무/관심 회사를 붙인다
+        chosen = set(conn.execute(select(UserPosition.position_id).where(UserPosition.user_id == load_user)).scalars())
+        _insert(conn, UserPosition, [{"user_id": load_user, "position_id": p} for p in position_ids[:2] if p not in chosen])
+        _insert(conn, GoalCompany, [{"user_id": load_user, "company_id": c} for c in company_ids[:5]])
+
+    db = SessionLocal(bind=engine)
+    try:
+        position_keyword_service.invalidate_keywords()
+        position_keyword_service.retag_all(db)
+        tech_stack_service.rebuild(db)
+        db.commit()
+        dedup_service.rebuild_signatures(db)
+    finally:
+        db.close()
+    return counts
+
+
+def load_pools(engine: Engine) -> Dict[str, List[int]]:
+    """경로 파라미터/바디 id 로 쓸 기존 id 목록 (이름은 OpenAPI 파라미터 이름)"""
+    sources = {
+        "question_id": Question.question_id,
+        "company_id": Company.company_id,
+        "answer_id": Answer.answer_id,
+        "comment_id": AnswerComment.answer_comment_id,
+        "user_id": User.user_id,
+        "position_id": Position.position_id,
+        "job_posting_id": CompanyJobPosting.company_job_posting_id,
+    }
+    with engine.connect() as conn:
+        return {
+            name: list(conn.execute(select(column).order_by(column.desc()).limit(POOL_LIMIT)).scalars())
+            for name, column in sources.items()
+        }
+
+
+def install_auth_stub(app, email: str = LOAD_TEST_EMAIL):
+    """Clerk 토큰 검증 대신 부하 테스트 사용자로 인증되게 한다 (app.dependency_overrides)."""
+    from core.auth import get_current_user
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == email).first()
+        if user is None:
+            raise RuntimeError(f"load test user {email} not found; run with --seed first")
+        db.expunge(user)
+    finally:
+        db.close()
+
+    async def current_user():
+        return user
+
+    app.dependency_overrides[get_current_user] = current_user
+    return user
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 대기열이 이 비율 이상 차면 /ready 가 overloaded 를 보고해 LB가 다른 워커로 보내게 한다
+READY_QUEUE_THRESHOLD = float(os.getenv("ADMISSION_READY_QUEUE_THRESHOLD", "0.8"))
+RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+
+
+@dataclass
+class RouteGroup:
+    """
+    같은 동시성 한도를 공유하는 라우트 묶음.
+    methods가 None이면 모든 메서드, max_concurrency가 None이면 제한하지 않는다.
+    """
+    name: str
+    pattern: str
+    methods: Optional[Tuple[str, ...]] = None
+    max_concurrency: Optional[int] = None
+    max_queue: int = 0
+    queue_timeout: float = 1.0
+
+    def __post_init__(self):
+        self._regex = re.compile(self.pattern)
+
+    def matches(self, method: str, path: str) -> bool:
+        return (self.methods is None or method in self.methods) and self._regex.fullmatch(path) is not None
+
+
+# 위에서부터 처음 일치하는 그룹이 적용된다
+DEFAULT_ROUTE_GROUPS = [
+    RouteGroup("probe", r"/(health|ready)?"),
+    # 오래 열려 있는 push 연결은 동시성 한도 대신 PUSH_MAX_CONNECTIONS 로 제한한다
+    RouteGroup("events", r"/events/.*"),
+    RouteGroup("import", r"/questions/?", methods=("POST",), max_concurrency=2, max_queue=4, queue_timeout=2.0),
+    RouteGroup("export", r"/questions/export", methods=("GET",), max_concurrency=2, max_queue=2, queue_timeout=0.5),
+    RouteGroup("question_list", r"/questions/?", methods=("GET",), max_concurrency=8, max_queue=32, queue_timeout=1.0),
+    RouteGroup("default", r".*", max_concurrency=32, max_queue=128, queue_timeout=1.0),
+]
+
+
+def _apply_env_overrides(groups: List[RouteGroup]) -> List[RouteGroup]:
+    """ADMISSION_LIMITS='{"question_list": {"max_concurrency": 4, "max_queue": 16}}' 형식으로 한도를 덮어쓴다."""
+    overrides = json.loads(os.getenv("ADMISSION_LIMITS", "{}"))
+    for group in groups:
+        for key, value in overrides.get(group.name, {}).items():
+            setattr(group, key, value)
+    return groups
+
+
+class Limiter:
+    def __init__(self, group: RouteGroup):
+        self.group = group
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(group.max_concurrency)
+
+    async def acquire(self) -> bool:
+        if not self._semaphore.locked():
+            # 여유가 있으면 Semaphore.acquire()는 양보 없이 바로 돌아온다
+            await self._semaphore.acquire()
+            self.active += 1
+            return True
+        if self.waiting >= self.group.max_queue:
+            self.rejected += 1
+            return False
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.group.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        return True
+
+    def release(self):
+        self.active -= 1
+        self._semaphore.release()
+
+    @property
+    def queue_pressure(self) -> float:
+        if not self.group.max_queue:
+            return 1.0 if self._semaphore.locked() else 0.0
+        return self.waiting / self.group.max_queue
+
+    def snapshot(self) -> dict:
+        return {
+            "active": self.active,
+            "max_concurrency": self.group.max_concurrency,
+            "waiting": self.waiting,
+            "max_queue": self.group.max_queue,
+            "rejected": self.rejected,
+        }
+
+
+class AdmissionControl:
+    def __init__(self, groups: List[RouteGroup]):
+        self.groups = groups
+        self.limiters: Dict[str, Limiter] = {
+            group.name: Limiter(group) for group in groups if group.max_concurrency is not None
+        }
+
+    def limiter_for(self, method: str, path: str) -> Optional[Limiter]:
+        for group in self.groups:
+            if group.matches(method, path):
+                return self.limiters.get(group.name)
+        return None
+
+    def overloaded(self) -> bool:
+        return any(limiter.queue_pressure >= READY_QUEUE_THRESHOLD for limiter in self.limiters.values())
+
+    def snapshot(self) -> dict:
+        return {name: limiter.snapshot() for name, limiter in self.limiters.items()}
+
+
+admission = AdmissionControl(_apply_env_overrides(DEFAULT_ROUTE_GROUPS))
+
+
+def pool_status(engine) -> dict:
+    pool = engine.pool
+    status = {"checked_out": pool.checkedout()} if hasattr(pool, "checkedout") else {}
+    if hasattr(pool, "size"):
+        status["capacity"] = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    return status
+
+
+def pool_saturated(engine) -> bool:
+    status = pool_status(engine)
+    return "capacity" in status and status["checked_out"] >= status["capacity"]
+
+
+class AdmissionMiddleware:
+    """
+    라우트 그룹별 동시 실행 수를 제한합니다.
+    한도를 넘으면 대기열에서 기다리고, 대기열이 가득 찼거나 대기 시간이 지나면 즉시 503을 돌려줍니다.
+    """
+
+    def __init__(self, app, control: AdmissionControl = admission):
+        self.app = app
+        self.control = control
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.control.limiter_for(scope["method"], scope["path"])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            await self._reject(send, limiter.group.name)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def _reject(self, send, group_name: str):
+        body = json.dumps({"detail": f"Server is busy ({group_name}), retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(RETRY_AFTER_SECONDS).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
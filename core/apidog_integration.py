@@ -1,11 +1,84 @@
 """
 Apidog MCP Integration
 이 모듈은 Apidog MCP를 통해 API 스펙과 FastAPI 라우터를 동기화합니다.
+
+부하 테스트(core/load_harness.py)가 쓰는 요청 템플릿도 여기서 OpenAPI 스펙으로부터 만든다.
 """
 
-from typing import Dict, Any, List
+import random
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Any, List, Optional, Sequence
 import json
 
+# 요청 바디에서 이 이름의 필드는 시드된 id 풀에서 값을 고른다 (경로 파라미터는 이름 그대로 풀을 찾는다)
+ID_FIELDS = ("company_id", "question_id", "answer_id", "position_id", "user_id", "job_posting_id")
+
+
+@dataclass
+class RequestTemplate:
+    """OpenAPI operation 하나에 대한 요청 틀. build 할 때 id 풀에서 경로 파라미터를 채운다."""
+    method: str
+    path: str
+    path_params: List[str] = field(default_factory=list)
+    query: Dict[str, Any] = field(default_factory=dict)
+    body_schema: Optional[dict] = None
+    multipart: bool = False
+
+    @property
+    def route(self) -> str:
+        return f"{self.method} {self.path}"
+
+    def missing_pools(self, pools: Dict[str, Sequence[int]]) -> List[str]:
+        return [name for name in self.path_params if not pools.get(name)]
+
+    def build(self, rng: random.Random, pools: Dict[str, Sequence[int]], components: dict, query: Optional[dict] = None):
+        """(method, url, query params, json body)"""
+        url = self.path
+        for name in self.path_params:
+            url = url.replace("{" + name + "}", str(rng.choice(pools[name])))
+        params = {**self.query, **(query or {})}
+        body = sample_value(self.body_schema, components, rng, pools) if self.body_schema else None
+        return self.method, url, params, body
+
+
+def _resolve(schema: dict, components: dict) -> dict:
+    while "$ref" in schema:
+        schema = components["schemas"][schema["$ref"].rsplit("/", 1)[-1]]
+    return schema
+
+
+def sample_value(schema: dict, components: dict, rng: random.Random, pools: Dict[str, Sequence[int]], name: str = ""):
+    """JSON 스키마에 맞는 그럴듯한 값 (id 필드는 시드 데이터에서 고른다)"""
+    schema = _resolve(schema, components)
+    if "anyOf" in schema:
+        options = [option for option in schema["anyOf"] if option.get("type") != "null"]
+        return sample_value(options[0], components, rng, pools, name) if options else None
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    kind = schema.get("type")
+    if kind == "object":
+        properties = schema.get("properties", {})
+        return {
+            key: sample_value(value, components, rng, pools, key)
+            for key, value in properties.items()
+            if key in schema.get("required", properties)
+        }
+    if kind == "array":
+        return [sample_value(schema.get("items", {}), components, rng, pools, name)]
+    if kind == "integer":
+        if name in ID_FIELDS and pools.get(name):
+            return rng.choice(pools[name])
+        return rng.randint(1, 10)
+    if kind == "number":
+        return round(rng.random(), 3)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if schema.get("format") == "date":
+        return date.today().isoformat()
+    return f"부하 테스트 {name} {rng.randrange(10 ** 6)}"
+
+
 def sync_with_apidog_spec():
     """
     Apidog MCP에서 정의된 API 스펙을 가져와서
@@ -15,18 +88,52 @@ def sync_with_apidog_spec():
     """
     pass
 
-def validate_api_endpoints():
+def validate_api_endpoints(
+    templates: Dict[str, RequestTemplate],
+    routes: Sequence[str],
+    pools: Dict[str, Sequence[int]],
+) -> List[str]:
     """
-    현재 구현된 API 엔드포인트가 Apidog 스펙과 일치하는지 검증합니다.
-
-    TODO: 실제 검증 로직 구현
+    트래픽 믹스의 라우트가 스펙에 있고, 경로 파라미터를 채울 시드 데이터가 있는지 검증합니다.
+    문제 목록을 돌려줍니다 (비어 있으면 통과).
     """
-    pass
+    problems = []
+    for route in routes:
+        template = templates.get(route)
+        if template is None:
+            problems.append(f"{route}: not in OpenAPI spec")
+            continue
+        if template.multipart:
+            problems.append(f"{route}: multipart upload is not supported")
+        for name in template.missing_pools(pools):
+            problems.append(f"{route}: no seeded ids for {{{name}}}")
+    return problems
 
-def generate_test_cases():
+def generate_test_cases(spec: Dict[str, Any]) -> Dict[str, RequestTemplate]:
     """
-    Apidog 스펙을 기반으로 자동 테스트 케이스를 생성합니다.
-
-    TODO: 테스트 케이스 자동 생성 로직 구현
+    OpenAPI 스펙(app.openapi())의 operation 마다 요청 템플릿을 만듭니다. 키는 "METHOD /path".
+    필수 쿼리 파라미터는 예시 값으로 채우고, 선택 파라미터는 트래픽 믹스에서 지정합니다.
     """
-    pass
\ No newline at end of file
+    components = spec.get("components", {})
+    templates = {}
+    for path, operations in spec.get("paths", {}).items():
+        for method, operation in operations.items():
+            path_params, query = [], {}
+            for parameter in operation.get("parameters", []):
+                if parameter["in"] == "path":
+                    path_params.append(parameter["name"])
+                elif parameter["in"] == "query" and parameter.get("required"):
+                    query[parameter["name"]] = sample_value(
+                        parameter.get("schema", {}), components, random.Random(0), {}, parameter["name"]
+                    )
+            content = operation.get("requestBody", {}).get("content", {})
+            template = RequestTemplate(
+                method=method.upper(),
+                path=path,
+                path_params=path_params,
+                query=query,
+                body_schema=content.get("application/json", {}).get("schema"),
+                multipart="multipart/form-data" in content,
+            )
+            templates[template.route] = template
+    return templates
@@ -1,33 +1,48 @@
 import jwt
-from clerk_backend_api import Clerk
+import logging
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jwt import PyJWKClient
 from sqlalchemy.orm import Session
 from core.database import get_db
 from app.domain.user.model.user import User
+from functools import lru_cache
 from typing import Optional
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer()
 
 CLERK_SECRET_KEY = os.getenv("CLERK_SECRET_KEY")
 
-if not CLERK_SECRET_KEY:
-    raise ValueError("CLERK_SECRET_KEY environment variable is required")
-
-clerk = Clerk(bearer_auth=CLERK_SECRET_KEY)
-
 app_id = os.getenv("APP_ID")
 CLERK_ISSUER = f"https://{app_id}.clerk.accounts.dev"
 JWKS_URL = f"{CLERK_ISSUER}/.well-known/jwks.json"
-_jwks = PyJWKClient(JWKS_URL)
+# 모르는 kid가 오면 PyJWKClient가 즉시 다시 받아오므로 캐시를 길게 잡아도 키 교체에 안전하다
+JWKS_CACHE_SECONDS = int(os.getenv("JWKS_CACHE_SECONDS", "3600"))
+
+@lru_cache(maxsize=None)
+def get_clerk():
+    """Clerk 클라이언트는 import 비용이 커서 처음 사용할 때 (또는 warm-up 에서) 만든다."""
+    if not CLERK_SECRET_KEY:
+        raise ValueError("CLERK_SECRET_KEY environment variable is required")
+    from clerk_backend_api import Clerk
+    return Clerk(bearer_auth=CLERK_SECRET_KEY)
+
+@lru_cache(maxsize=None)
+def get_jwks_client() -> PyJWKClient:
+    return PyJWKClient(JWKS_URL, lifespan=JWKS_CACHE_SECONDS)
+
+def prefetch_jwks():
+    """JWKS를 미리 받아 캐시해 첫 요청에서 네트워크 왕복이 생기지 않게 합니다."""
+    get_jwks_client().get_signing_keys()
 
 def decode_clerk_token(token: str) -> dict:
-    signing_key = _jwks.get_signing_key_from_jwt(token).key
+    signing_key = get_jwks_client().get_signing_key_from_jwt(token).key
     return jwt.decode(
         token,
         signing_key,
@@ -39,17 +54,18 @@ def decode_clerk_token(token: str) -> dict:
 
 async def verify_clerk_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = credentials.credentials
-    print(token)
     try:
         # 1) 로컬에서 토큰 검증
         claims = decode_clerk_token(token)
 
         # 2) user_id(sub)로 Clerk API에서 유저 조회
-        user_info = clerk.users.get(user_id=claims["sub"])
+        user_info = get_clerk().users.get(user_id=claims["sub"])
+        # 요청마다 남는 로그라 샘플링한다 (LOG_SAMPLE_RATES). 토큰 자체는 남기지 않는다.
+        logger.info("token verified", extra={"event": "auth.verified", "clerk_user_id": claims["sub"]})
         return user_info
 
     except Exception as e:
-        print(str(e))
+        logger.warning("token verification failed: %s", e, extra={"event": "auth.failed", "error_type": type(e).__name__})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Token verification failed: {str(e)}"
@@ -86,7 +102,6 @@ async def get_current_user(
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
 
     return user
 
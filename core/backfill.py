@@ -0,0 +1,219 @@
+"""
+온라인 데이터 backfill.
+
+alembic 마이그레이션은 스키마만 바꾸고 (새 컬럼은 nullable 로 추가), 기존 row 를 채우는 작업은
+여기 등록한 backfill 로 API 가 떠 있는 상태에서 돌린다 (python manage.py backfill <name>).
+다 채운 뒤 NOT NULL 제약 등은 다음 마이그레이션에서 건다.
+
+- pk 순서(keyset)로 chunk 씩 처리하고 chunk 마다 커밋한다. 한 번에 잡는 잠금은 chunk 하나 분량뿐이다.
+- chunk 작업과 checkpoint(마지막 pk, 처리 수) 갱신이 같은 트랜잭션이라, 중단 후 다시 실행하면 이어서 처리한다.
+- checkpoint row 를 chunk 마다 FOR UPDATE 로 잡으므로 같은 backfill 을 두 프로세스에서 돌려도 겹치지 않는다.
+- chunk 처리 시간이 target_seconds 근처가 되도록 chunk 크기를 조절하고, chunk 사이에 쉬어서 DB 부하를 제한한다.
+"""
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text, func, insert, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from core.database import Base
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_SIZE = int(os.getenv("BACKFILL_CHUNK_SIZE", "500"))
+BACKFILL_MAX_CHUNK_SIZE = int(os.getenv("BACKFILL_MAX_CHUNK_SIZE", "5000"))
+# chunk 하나의 목표 처리 시간. 이보다 오래 걸리면 chunk 를 줄이고, 훨씬 빠르면 늘린다.
+BACKFILL_TARGET_SECONDS = float(os.getenv("BACKFILL_TARGET_SECONDS", "0.5"))
+# chunk 사이 휴식 = 직전 chunk 처리 시간 x 이 비율 (1.0 이면 DB 를 최대 절반 시간만 쓴다)
+BACKFILL_PAUSE_RATIO = float(os.getenv("BACKFILL_PAUSE_RATIO", "1.0"))
+
+RUNNING, DONE, FAILED = "running", "done", "failed"
+
+
+class BackfillCheckpoint(Base):
+    __tablename__ = "backfill_checkpoint"
+
+    name = Column(String(100), primary_key=True)
+    status = Column(String(20), nullable=False, default=RUNNING)
+    last_key = Column(BigInteger, nullable=True)
+    processed = Column(BigInteger, nullable=False, default=0)
+    chunks = Column(Integer, nullable=False, default=0)
+    total_estimate = Column(BigInteger, nullable=True)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+
+@dataclass
+class Backfill:
+    """
+    source 는 처리 대상 row 의 key 컬럼 하나를 고르는 select (필터 포함). 러너가 key 범위/정렬/limit 을 붙인다.
+    process(db, keys) 는 그 key 들의 row 를 채운다 (커밋하지 않는다).
+    after_chunk(keys) 는 커밋 후 호출된다 (다른 워커 캐시 갱신 이벤트 발행 등).
+    """
+    name: str
+    description: str
+    key: object
+    source: Select
+    process: Callable[[Session, List[int]], None]
+    after_chunk: Optional[Callable[[List[int]], None]] = None
+
+
+BACKFILLS: Dict[str, Backfill] = {}
+
+
+def register(backfill: Backfill) -> Backfill:
+    if backfill.name in BACKFILLS:
+        raise ValueError(f"Backfill already registered: {backfill.name}")
+    BACKFILLS[backfill.name] = backfill
+    return backfill
+
+
+@dataclass
+class Progress:
+    name: str
+    processed: int
+    total_estimate: Optional[int]
+    chunks: int
+    chunk_size: int
+    rows_per_sec: float
+    done: bool
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        if self.done or not self.total_estimate or not self.rows_per_sec:
+            return None
+        return max(self.total_estimate - self.processed, 0) / self.rows_per_sec
+
+
+def _checkpoint(db: Session, name: str, lock: bool = False) -> Optional[BackfillCheckpoint]:
+    stmt = select(BackfillCheckpoint).where(BackfillCheckpoint.name == name)
+    if lock:
+        stmt = stmt.with_for_update()
+    return db.execute(stmt.execution_options(populate_existing=True)).scalar_one_or_none()
+
+
+def _set_status(session_factory, name: str, **values):
+    db = session_factory()
+    try:
+        db.execute(update(BackfillCheckpoint).where(BackfillCheckpoint.name == name).values(updated_at=datetime.utcnow(), **values))
+        db.commit()
+    finally:
+        db.close()
+
+
+def checkpoints(db: Session) -> List[BackfillCheckpoint]:
+    return db.execute(select(BackfillCheckpoint).order_by(BackfillCheckpoint.name)).scalars().all()
+
+
+def run_backfill(
+    session_factory,
+    backfill: Backfill,
+    chunk_size: int = BACKFILL_CHUNK_SIZE,
+    max_chunk_size: int = BACKFILL_MAX_CHUNK_SIZE,
+    target_seconds: float = BACKFILL_TARGET_SECONDS,
+    pause_ratio: float = BACKFILL_PAUSE_RATIO,
+    max_chunks: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+    restart: bool = False,
+    on_progress: Optional[Callable[[Progress], None]] = None,
+) -> Progress:
+    """
+    backfill 을 checkpoint 부터 이어서 끝까지 (또는 max_chunks/max_seconds 까지) 실행한다.
+    restart 면 checkpoint 를 지우고 처음부터. 예외가 나면 checkpoint 에 failed 와 오류를 남기고 다시 던진다.
+    """
+    db = session_factory()
+    try:
+        checkpoint = _checkpoint(db, backfill.name)
+        if checkpoint is None:
+            db.execute(insert(BackfillCheckpoint).values(name=backfill.name, status=RUNNING, processed=0, chunks=0))
+        elif restart or checkpoint.status != DONE:
+            values = {"status": RUNNING, "error": None, "finished_at": None}
+            if restart:
+                values.update(last_key=None, processed=0, chunks=0)
+            db.execute(update(BackfillCheckpoint).where(BackfillCheckpoint.name == backfill.name).values(**values))
+        checkpoint = _checkpoint(db, backfill.name)
+        if checkpoint.status == DONE:
+            db.rollback()
+            return Progress(backfill.name, checkpoint.processed, checkpoint.total_estimate, checkpoint.chunks, 0, 0.0, True)
+
+        # 진행률 표시용 남은 row 추정 (한 번만 센다)
+        remaining = backfill.source
+        if checkpoint.last_key is not None:
+            remaining = remaining.where(backfill.key > checkpoint.last_key)
+        total_estimate = checkpoint.processed + db.execute(select(func.count()).select_from(remaining.subquery())).scalar()
+        db.execute(update(BackfillCheckpoint).where(BackfillCheckpoint.name == backfill.name).values(total_estimate=total_estimate))
+        db.commit()
+    finally:
+        db.close()
+
+    started = time.monotonic()
+    run_rows, chunks_this_run = 0, 0
+    size = chunk_size
+    progress = None
+    while True:
+        db = session_factory()
+        chunk_started = time.monotonic()
+        try:
+            checkpoint = _checkpoint(db, backfill.name, lock=True)
+            stmt = backfill.source
+            if checkpoint.last_key is not None:
+                stmt = stmt.where(backfill.key > checkpoint.last_key)
+            keys = db.execute(stmt.order_by(backfill.key).limit(size)).scalars().all()
+            now = datetime.utcnow()
+            if not keys:
+                db.execute(update(BackfillCheckpoint).where(BackfillCheckpoint.name == backfill.name)
+                           .values(status=DONE, updated_at=now, finished_at=now))
+                db.commit()
+                done = True
+            else:
+                backfill.process(db, keys)
+                db.execute(update(BackfillCheckpoint).where(BackfillCheckpoint.name == backfill.name).values(
+                    last_key=keys[-1],
+                    processed=BackfillCheckpoint.processed + len(keys),
+                    chunks=BackfillCheckpoint.chunks + 1,
+                    updated_at=now,
+                ))
+                db.commit()
+                done = False
+            checkpoint = _checkpoint(db, backfill.name)
+            processed, chunks, total_estimate = checkpoint.processed, checkpoint.chunks, checkpoint.total_estimate
+        except Exception as e:
+            db.rollback()
+            db.close()
+            _set_status(session_factory, backfill.name, status=FAILED, error=f"{type(e).__name__}: {e}")
+            logger.exception("backfill %s failed", backfill.name, extra={"event": "backfill.failed"})
+            raise
+        db.close()
+
+        if keys and backfill.after_chunk:
+            backfill.after_chunk(keys)
+        elapsed = time.monotonic() - chunk_started
+        run_rows += len(keys)
+        chunks_this_run += 1 if keys else 0
+        rate = run_rows / (time.monotonic() - started) if run_rows else 0.0
+        progress = Progress(backfill.name, processed, total_estimate, chunks, size, rate, done)
+        if on_progress:
+            on_progress(progress)
+        if done:
+            logger.info("backfill %s done: %d rows", backfill.name, processed, extra={"event": "backfill.done"})
+            return progress
+        if max_chunks is not None and chunks_this_run >= max_chunks:
+            return progress
+        if max_seconds is not None and time.monotonic() - started >= max_seconds:
+            return progress
+
+        # chunk 크기 조절 (잠금 시간을 target_seconds 근처로) 과 휴식
+        if elapsed > target_seconds * 1.5:
+            size = max(size // 2, 1)
+        elif elapsed < target_seconds / 2:
+            size = min(size * 2, max_chunk_size)
+        if pause_ratio > 0:
+            time.sleep(elapsed * pause_ratio)
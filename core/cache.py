@@ -0,0 +1,79 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    프로세스 내 LRU + TTL 캐시. 여러 스레드(threadpool 핸들러)에서 함께 써도 안전하다.
+
+    get_or_load 로 읽는 중인 키는 세대(generation)를 가진다. 로드 도중 invalidate/clear 가
+    오면 세대가 올라가고, 로드를 시작할 때의 세대와 다르면 set 이 그 값을 버린다
+    (무효화 전에 읽은 옛 값이 무효화 뒤에 다시 들어오지 않도록).
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 로드 중인 키만 기록한다 (키 → 진행 중인 로드 수, 키 → 세대)
+        self._loading: Dict[Hashable, int] = {}
+        self._generations: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, generation: Optional[int] = None):
+        with self._lock:
+            if generation is not None and self._generations.get(key, 0) != generation:
+                return
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            generation = self._generations.get(key, 0)
+            self._loading[key] = self._loading.get(key, 0) + 1
+        try:
+            value = loader()
+            self.set(key, value, generation=generation)
+        finally:
+            with self._lock:
+                self._loading[key] -= 1
+                if not self._loading[key]:
+                    del self._loading[key]
+                    self._generations.pop(key, None)
+        return value
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+            if key in self._loading:
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            for key in self._loading:
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def __len__(self):
+        return len(self._data)
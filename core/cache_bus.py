@@ -0,0 +1,241 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import BigInteger, Column, DateTime, String, Text, delete, func, insert, select
+from core.database import Base
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+# local: 같은 프로세스 안에서만 전달 / database: cache_event 테이블 폴링 / redis: Redis pub/sub
+# 워커가 하나여도 manage.py backfill 같은 다른 프로세스의 이벤트를 받아야 하므로 기본은 database.
+# local 은 다른 프로세스에서 오는 이벤트를 받지 않는다 (테스트/로컬 개발용).
+CACHE_BUS_BACKEND = os.getenv("CACHE_BUS_BACKEND", "database")
+CACHE_BUS_URL = os.getenv("CACHE_BUS_URL", "")
+CACHE_BUS_POLL_SECONDS = float(os.getenv("CACHE_BUS_POLL_SECONDS", "1"))
+CACHE_BUS_RETENTION_SECONDS = int(os.getenv("CACHE_BUS_RETENTION_SECONDS", "600"))
+REDIS_CHANNEL = "interviewq:cache-events"
+# 동시에 INSERT 된 이벤트는 id 순서와 커밋 순서가 다를 수 있어서, 마지막 id 이전 구간도 다시 읽는다
+POLL_OVERLAP = 50
+
+Handler = Callable[[dict], None]
+
+
+class CacheEvent(Base):
+    """database 백엔드가 쓰는 이벤트 로그. 워커들이 event_id 순으로 폴링한다."""
+    __tablename__ = "cache_event"
+
+    event_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    topic = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)
+    origin = Column(String(32), nullable=False)
+    # send 가 UTC 로 채운다 (보존 기간 비교를 같은 시계로 하도록, DB 세션 타임존과 무관하게)
+    created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+
+
+class CacheBus:
+    """
+    캐시 무효화 이벤트 버스. publish 하면 이 프로세스의 핸들러를 바로 실행하고,
+    백엔드를 통해 다른 워커에도 보낸다. 다른 워커에서 온 이벤트는 백엔드 스레드에서 핸들러를 실행한다.
+
+    remote_only 핸들러는 다른 워커의 이벤트에만 반응한다
+    (publish 한 워커는 이미 메모리 인덱스 등을 직접 갱신한 경우).
+    """
+
+    def __init__(self, backend: Optional["BusBackend"] = None):
+        self.origin = uuid.uuid4().hex
+        self.backend = backend or LocalBackend()
+        self._handlers: Dict[str, List[tuple]] = defaultdict(list)
+
+    def subscribe(self, topic: str, handler: Handler, remote_only: bool = False):
+        self._handlers[topic].append((handler, remote_only))
+
+    def publish(self, topic: str, **payload):
+        self._dispatch(topic, payload, remote=False)
+        try:
+            self.backend.send(self.origin, topic, payload)
+        except Exception:
+            # 전파에 실패해도 요청은 성공시킨다 (다른 워커 캐시는 TTL 만료로 따라온다)
+            logger.exception("cache bus publish failed: %s", topic)
+
+    def receive(self, origin: str, topic: str, payload: dict):
+        if origin != self.origin:
+            self._dispatch(topic, payload, remote=True)
+
+    def _dispatch(self, topic: str, payload: dict, remote: bool):
+        for handler, remote_only in self._handlers.get(topic, ()):
+            if remote_only and not remote:
+                continue
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("cache bus handler failed: %s", topic)
+
+    def start(self):
+        self.backend.start(self)
+
+    def stop(self):
+        self.backend.stop()
+
+
+class BusBackend:
+    def start(self, bus: CacheBus):
+        pass
+
+    def stop(self):
+        pass
+
+    def send(self, origin: str, topic: str, payload: dict):
+        raise NotImplementedError
+
+
+class LocalBackend(BusBackend):
+    """단일 워커용: 다른 프로세스로 보내지 않는다."""
+
+    def send(self, origin: str, topic: str, payload: dict):
+        pass
+
+
+class MemoryBroker:
+    """여러 CacheBus 를 한 프로세스 안에 두고 워커 간 전파를 흉내 낼 때 쓰는 가짜 브로커."""
+
+    def __init__(self):
+        self.buses: List[CacheBus] = []
+        self.sent: List[tuple] = []
+
+    def backend(self) -> "MemoryBackend":
+        return MemoryBackend(self)
+
+
+class MemoryBackend(BusBackend):
+    def __init__(self, broker: MemoryBroker):
+        self.broker = broker
+
+    def start(self, bus: CacheBus):
+        self.broker.buses.append(bus)
+
+    def stop(self):
+        self.broker.buses = [bus for bus in self.broker.buses if bus.backend is not self]
+
+    def send(self, origin: str, topic: str, payload: dict):
+        self.broker.sent.append((origin, topic, payload))
+        for bus in list(self.broker.buses):
+            bus.receive(origin, topic, json.loads(json.dumps(payload)))
+
+
+class DatabaseBackend(BusBackend):
+    """
+    추가 인프라 없이 쓰는 기본 멀티 워커 백엔드. 이벤트를 cache_event 에 INSERT 하고,
+    각 워커는 CACHE_BUS_POLL_SECONDS 마다 마지막으로 본 event_id 이후를 읽는다.
+    """
+
+    def __init__(self, engine=None):
+        if engine is None:
+            from core.database import engine
+        self.engine = engine
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_id = 0
+        self._seen = set()
+
+    def start(self, bus: CacheBus):
+        with self.engine.connect() as conn:
+            self._last_id = conn.execute(select(func.max(CacheEvent.event_id))).scalar() or 0
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, args=(bus,), name="cache-bus-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def send(self, origin: str, topic: str, payload: dict):
+        with self.engine.begin() as conn:
+            conn.execute(insert(CacheEvent).values(
+                topic=topic, payload=json.dumps(payload, ensure_ascii=False), origin=origin,
+                created_at=datetime.utcnow(),
+            ))
+
+    def _poll(self, bus: CacheBus):
+        last_prune = time.monotonic()
+        while not self._stop.wait(CACHE_BUS_POLL_SECONDS):
+            try:
+                self._poll_once(bus)
+                if time.monotonic() - last_prune > CACHE_BUS_RETENTION_SECONDS / 2:
+                    last_prune = time.monotonic()
+                    self._prune()
+            except Exception:
+                logger.exception("cache bus poll failed")
+
+    def _poll_once(self, bus: CacheBus):
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(CacheEvent.event_id, CacheEvent.topic, CacheEvent.payload, CacheEvent.origin)
+                .where(CacheEvent.event_id > self._last_id - POLL_OVERLAP)
+                .order_by(CacheEvent.event_id)
+                .limit(500)
+            ).all()
+        for event_id, topic, payload, origin in rows:
+            if event_id in self._seen or event_id <= self._last_id - POLL_OVERLAP:
+                continue
+            self._seen.add(event_id)
+            self._last_id = max(self._last_id, event_id)
+            bus.receive(origin, topic, json.loads(payload))
+        self._seen = {event_id for event_id in self._seen if event_id > self._last_id - POLL_OVERLAP}
+
+    def _prune(self):
+        cutoff = datetime.utcnow() - timedelta(seconds=CACHE_BUS_RETENTION_SECONDS)
+        with self.engine.begin() as conn:
+            conn.execute(delete(CacheEvent).where(CacheEvent.created_at < cutoff))
+
+
+class RedisBackend(BusBackend):
+    """Redis pub/sub 백엔드 (redis 패키지가 설치된 경우에만 사용 가능)."""
+
+    def __init__(self, url: str = CACHE_BUS_URL):
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self._pubsub = None
+        self._thread = None
+
+    def start(self, bus: CacheBus):
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+
+        def on_message(message):
+            event = json.loads(message["data"])
+            bus.receive(event["origin"], event["topic"], event["payload"])
+
+        self._pubsub.subscribe(**{REDIS_CHANNEL: on_message})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+    def stop(self):
+        if self._thread is not None:
+            self._thread.stop()
+        if self._pubsub is not None:
+            self._pubsub.close()
+
+    def send(self, origin: str, topic: str, payload: dict):
+        self.client.publish(REDIS_CHANNEL, json.dumps({"origin": origin, "topic": topic, "payload": payload}))
+
+
+def create_backend(name: str = CACHE_BUS_BACKEND) -> BusBackend:
+    if name == "database":
+        return DatabaseBackend()
+    if name == "redis":
+        return RedisBackend()
+    if name == "local":
+        return LocalBackend()
+    raise ValueError(f"Unknown CACHE_BUS_BACKEND: {name}")
+
+
+cache_bus = CacheBus(create_backend())
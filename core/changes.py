@@ -0,0 +1,248 @@
+import base64
+import json
+import os
+from datetime import datetime, timedelta
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Tuple
+from fastapi import HTTPException
+from sqlalchemy import BigInteger, Column, DateTime, String, delete, event, func, insert, select, tuple_, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from core.database import Base
+from core.sql import DML_OPTIONS
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 삭제 기록은 이 기간만 보관한다. 더 오래된 since 토큰은 reset=True 로 전체 재조회를 요구한다.
+CHANGE_TOMBSTONE_RETENTION_DAYS = int(os.getenv("CHANGE_TOMBSTONE_RETENTION_DAYS", "30"))
+
+
+class ChangeSequence(Base):
+    """
+    변경 버전 발급용 카운터. since 조회는 목록(부모) 단위라 버전 순서는 목록 안에서만 커밋 순서와 같으면 된다.
+    그래서 목록마다 row 하나 ("answer:<question_id>", "comment:<answer_id>") 를 두고, 값을 올린 row 의 잠금이
+    커밋까지 유지되는 것으로 순서를 맞춘다. 같은 목록에 동시에 쓰는 트랜잭션끼리만 기다리고 다른 목록의 쓰기는 서로 막지 않는다.
+    horizon 은 그 목록에서 정리된 마지막 tombstone 버전이다.
+    """
+    __tablename__ = "change_sequence"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+    horizon = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+class ChangeTombstone(Base):
+    """삭제된 row 기록. parent_id 는 목록 단위(답변이면 question_id, 댓글이면 answer_id), 버전은 목록 안에서 유일하다."""
+    __tablename__ = "change_tombstone"
+
+    entity = Column(String(30), primary_key=True)
+    parent_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, primary_key=True, autoincrement=False)
+    entity_id = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+
+
+class VersionedMixin:
+    """
+    추가/수정될 때마다 새 변경 버전을 받는 모델. (부모 id, version) 인덱스는 모델에서 건다.
+    __version_entity__ / __version_parent__ 로 시퀀스를 나눌 목록(엔티티 이름, 부모 id 컬럼 이름)을 정한다.
+    """
+    __version_entity__: str
+    __version_parent__: str
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+def sequence_name(entity: str, parent_id: int) -> str:
+    return f"{entity}:{parent_id}"
+
+
+def next_versions(connection: Connection, entity: str, parent_id: int, count: int = 1) -> range:
+    """
+    목록 하나에서 count 개의 연속된 새 버전. 잠금이 커밋까지 유지되므로 트랜잭션의 마지막 쓰기 직전에 부른다.
+    upsert 한 문장으로 없으면 만들고 있으면 올린다: RETURNING 을 지원하면 … RETURNING,
+    MySQL 은 LAST_INSERT_ID(expr) 로 새 값을 OK 패킷에 실어 받는다.
+    """
+    name = sequence_name(entity, parent_id)
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as upsert
+        stmt = upsert(ChangeSequence).values(name=name, value=func.last_insert_id(count), horizon=0)
+        stmt = stmt.on_duplicate_key_update(value=func.last_insert_id(ChangeSequence.value + count))
+        last = connection.execute(stmt).lastrowid
+    elif dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        stmt = upsert(ChangeSequence).values(name=name, value=count, horizon=0)
+        stmt = stmt.on_conflict_do_update(index_elements=["name"], set_={"value": ChangeSequence.value + count})
+        last = connection.execute(stmt.returning(ChangeSequence.value)).scalar()
+    else:
+        result = connection.execute(
+            update(ChangeSequence).where(ChangeSequence.name == name).values(value=ChangeSequence.value + count)
+        )
+        if result.rowcount:
+            last = connection.execute(select(ChangeSequence.value).where(ChangeSequence.name == name)).scalar()
+        else:
+            connection.execute(insert(ChangeSequence).values(name=name, value=count, horizon=0))
+            last = count
+    return range(last - count + 1, last + 1)
+
+
+def stamp_version(db: Session, model, pk, row_id: int, parent_id: int) -> int:
+    """
+    방금 추가/수정한 row 에 새 버전을 매긴다. 조건부 쓰기(권한/존재 확인)가 성공한 뒤 커밋 직전에 불러서
+    시퀀스 잠금을 잡는 시간을 줄이고, 404/403 으로 끝나는 요청은 잠금을 잡지 않게 한다.
+    """
+    connection = db.connection()
+    version = next_versions(connection, model.__version_entity__, parent_id).start
+    db.execute(update(model).where(pk == row_id).values(version=version).execution_options(**DML_OPTIONS))
+    return version
+
+
+def _sequence_state(connection: Connection, entity: str, parent_id: int) -> Tuple[int, int]:
+    """(목록의 현재 버전, 목록의 tombstone horizon). 아직 쓰기가 없던 목록이면 (0, 0)."""
+    row = connection.execute(
+        select(ChangeSequence.value, ChangeSequence.horizon)
+        .where(ChangeSequence.name == sequence_name(entity, parent_id))
+    ).first()
+    return (row.value, row.horizon) if row else (0, 0)
+
+
+def current_version(db: Session, entity: str, parent_id: int) -> int:
+    return _sequence_state(db.connection(), entity, parent_id)[0]
+
+
+def record_deletion(db: Session, entity: str, entity_id: int, parent_id: int):
+    """삭제를 since 조회에 노출하기 위한 tombstone. 삭제 문장 뒤, 같은 트랜잭션의 마지막에 호출한다."""
+    connection = db.connection()
+    version = next_versions(connection, entity, parent_id).start
+    connection.execute(insert(ChangeTombstone).values(
+        entity=entity, parent_id=parent_id, version=version, entity_id=entity_id,
+        # prune_tombstones 의 cutoff 와 같은 시계 (UTC)
+        created_at=datetime.utcnow(),
+    ))
+
+
+@event.listens_for(Session, "before_flush")
+def _assign_versions(session, flush_context, instances):
+    """ORM 으로 추가/수정한 row 의 버전 (리포지토리의 조건부 쓰기는 stamp_version 을 쓴다)"""
+    changed: Dict[Tuple[str, int], List] = defaultdict(list)
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, VersionedMixin) and (obj in session.new or session.is_modified(obj, include_collections=False)):
+            changed[(obj.__version_entity__, getattr(obj, obj.__version_parent__))].append(obj)
+    if not changed:
+        return
+    connection = session.connection()
+    # 여러 목록을 한 트랜잭션에서 쓸 때 교착을 피하도록 항상 같은 순서로 잠근다
+    for (entity, parent_id), objs in sorted(changed.items()):
+        for obj, version in zip(objs, next_versions(connection, entity, parent_id, len(objs))):
+            obj.version = version
+
+
+def encode_sync_token(version: int) -> str:
+    raw = json.dumps({"sv": version}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_sync_token(token: str) -> int:
+    try:
+        version = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))["sv"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid since token")
+    if not isinstance(version, int) or version < 0:
+        raise HTTPException(status_code=400, detail="Invalid since token")
+    return version
+
+
+class Changes(NamedTuple):
+    values: List
+    deleted: List[int]
+    since: str
+    has_more: bool
+    reset: bool
+
+
+def changes_since(
+    db: Session,
+    model,
+    parent_column,
+    parent_id: int,
+    entity: str,
+    since: str,
+    size: int,
+) -> Changes:
+    """
+    since 토큰 이후 parent_id 목록에서 추가/수정된 row 와 삭제된 id 를 버전 순으로 size 개까지.
+    (parent, version) 인덱스 두 개를 범위 스캔해 병합한다. has_more 면 돌려준 since 로 이어서 조회한다.
+    """
+    version = decode_sync_token(since)
+    connection = db.connection()
+    current, horizon = _sequence_state(connection, entity, parent_id)
+    if version < horizon:
+        return Changes([], [], encode_sync_token(current), False, True)
+
+    rows = (
+        db.query(model)
+        .filter(parent_column == parent_id, model.version > version)
+        .order_by(model.version)
+        .limit(size + 1)
+        .all()
+    )
+    tombstones = connection.execute(
+        select(ChangeTombstone.version, ChangeTombstone.entity_id)
+        .where(ChangeTombstone.entity == entity, ChangeTombstone.parent_id == parent_id, ChangeTombstone.version > version)
+        .order_by(ChangeTombstone.version)
+        .limit(size + 1)
+    ).all()
+
+    merged = sorted(
+        [(row.version, row, None) for row in rows] + [(v, None, entity_id) for v, entity_id in tombstones],
+        key=lambda item: item[0],
+    )
+    page = merged[:size]
+    last = page[-1][0] if page else version
+    return Changes(
+        values=[row for _, row, _ in page if row is not None],
+        deleted=[entity_id for _, _, entity_id in page if entity_id is not None],
+        since=encode_sync_token(last),
+        has_more=len(merged) > size,
+        reset=False,
+    )
+
+
+def prune_tombstones(db: Session, batch_size: int, max_batches: int) -> int:
+    """
+    보관 기간이 지난 tombstone 을 지우고 목록별 horizon 을 올린다 (Purger 작업).
+    horizon 이전 버전의 since 토큰은 삭제를 놓칠 수 있으므로 reset 응답을 받는다.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=CHANGE_TOMBSTONE_RETENTION_DAYS)
+    batches = 0
+    while batches < max_batches:
+        keys = db.execute(
+            select(ChangeTombstone.entity, ChangeTombstone.parent_id, ChangeTombstone.version)
+            .where(ChangeTombstone.created_at < cutoff)
+            .order_by(ChangeTombstone.created_at).limit(batch_size)
+        ).all()
+        if not keys:
+            break
+        horizons: Dict[str, int] = {}
+        for entity, parent_id, version in keys:
+            name = sequence_name(entity, parent_id)
+            horizons[name] = max(horizons.get(name, 0), version)
+        connection = db.connection()
+        # tombstone 을 남길 때 그 목록의 시퀀스 row 가 만들어지므로 항상 있다
+        for name, horizon in sorted(horizons.items()):
+            connection.execute(
+                update(ChangeSequence).where(ChangeSequence.name == name, ChangeSequence.horizon < horizon)
+                .values(horizon=horizon)
+            )
+        connection.execute(delete(ChangeTombstone).where(
+            tuple_(ChangeTombstone.entity, ChangeTombstone.parent_id, ChangeTombstone.version).in_(
+                [tuple(key) for key in keys]
+            )
+        ))
+        db.commit()
+        batches += 1
+    return batches
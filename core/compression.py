@@ -0,0 +1,240 @@
+import gzip
+import os
+import threading
+import time
+import zlib
+from typing import Callable, Dict, Optional
+from fastapi import Request, Response
+from core.cache import TTLCache
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 협상한다
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+# 요청마다 압축하는 응답은 빠른 품질, 미리 압축해 캐시하는 응답은 최대 품질을 쓴다
+BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+PRECOMPRESSED_BROTLI_QUALITY = 11
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+# 이벤트를 즉시 흘려보내야 하는 스트림은 압축하지 않는다
+UNCOMPRESSIBLE_TYPES = ("text/event-stream",)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str, brotli_quality: int = BROTLI_QUALITY) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self.process, self.finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.process, self.finish = compressor.compress, compressor.flush
+
+
+class CompressionStats:
+    """라우트별 압축 전/후 바이트와 압축에 쓴 CPU 시간."""
+
+    def __init__(self):
+        self._routes: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float):
+        with self._lock:
+            stat = self._routes.setdefault(route, {
+                "responses": 0, "bytes_in": 0, "bytes_out": 0, "cpu_ms": 0.0, "encodings": {},
+            })
+            stat["responses"] += 1
+            stat["bytes_in"] += bytes_in
+            stat["bytes_out"] += bytes_out
+            stat["cpu_ms"] += cpu_seconds * 1000
+            stat["encodings"][encoding] = stat["encodings"].get(encoding, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            result = {}
+            for route, stat in self._routes.items():
+                saved = stat["bytes_in"] - stat["bytes_out"]
+                result[route] = {
+                    **stat,
+                    "encodings": dict(stat["encodings"]),
+                    "bytes_saved": saved,
+                    "ratio": round(stat["bytes_out"] / stat["bytes_in"], 3) if stat["bytes_in"] else None,
+                    "cpu_ms_per_mb_saved": round(stat["cpu_ms"] / (saved / 1_000_000), 2) if saved > 0 else None,
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+
+compression_stats = CompressionStats()
+
+
+def _route_name(scope) -> str:
+    route = scope.get("route")
+    return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding에 따라 br/gzip으로 응답을 압축합니다.
+    COMPRESSION_MIN_SIZE 미만 응답, 이미 인코딩된 응답, 텍스트가 아닌 응답은 그대로 보냅니다.
+    스트리밍 응답은 청크 단위로 압축해 메모리 사용량을 일정하게 유지합니다.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        encoding = choose_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor = None
+        passthrough = False
+        bytes_in = bytes_out = 0
+        cpu_seconds = 0.0
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough, bytes_in, bytes_out, cpu_seconds
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                response_headers = {k.lower(): v for k, v in message.get("headers", [])}
+                content_type = response_headers.get(b"content-type", b"").decode("latin-1")
+                passthrough = (
+                    b"content-encoding" in response_headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or content_type.startswith(UNCOMPRESSIBLE_TYPES)
+                )
+                if passthrough:
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body:
+                    # 한 번에 끝나는 응답
+                    if len(body) < self.minimum_size:
+                        passthrough = True
+                        await send(start_message)
+                        await send(message)
+                        return
+                    started = time.thread_time()
+                    compressed = compress(body, encoding)
+                    cpu_seconds = time.thread_time() - started
+                    compression_stats.record(_route_name(scope), encoding, len(body), len(compressed), cpu_seconds)
+                    await send(self._encoded_start(start_message, encoding, len(compressed)))
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                compressor = _StreamCompressor(encoding)
+                await send(self._encoded_start(start_message, encoding, None))
+
+            started = time.thread_time()
+            chunk = compressor.process(body)
+            if not more_body:
+                chunk += compressor.finish()
+            cpu_seconds += time.thread_time() - started
+            bytes_in += len(body)
+            bytes_out += len(chunk)
+            if not more_body:
+                compression_stats.record(_route_name(scope), encoding, bytes_in, bytes_out, cpu_seconds)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _encoded_start(message, encoding: str, content_length: Optional[int]):
+        headers = [
+            (k, v) for k, v in message.get("headers", [])
+            if k.lower() not in (b"content-length", b"vary")
+        ]
+        headers.append((b"content-encoding", encoding.encode()))
+        headers.append((b"vary", b"Accept-Encoding"))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode()))
+        return {**message, "headers": headers}
+
+
+# 분석 결과처럼 한 번 생성되면 바뀌지 않는 응답의 압축본 캐시
+_precompressed = TTLCache(ttl=int(os.getenv("PRECOMPRESSED_CACHE_SECONDS", "86400")), maxsize=512)
+
+
+def precompressed_response(request: Request, key, build_body: Callable[[], bytes], media_type: str = "application/json") -> Response:
+    """
+    불변 응답 본문을 인코딩별로 한 번만 (최대 품질로) 압축해 캐시하고, 협상된 인코딩으로 돌려줍니다.
+    """
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    body = _precompressed.get((key, None))
+    if body is None:
+        body = build_body()
+        _precompressed.set((key, None), body)
+
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding is None or len(body) < COMPRESSION_MIN_SIZE:
+        return Response(content=body, media_type=media_type, headers=headers)
+
+    cpu_seconds = 0.0
+    compressed = _precompressed.get((key, encoding))
+    if compressed is None:
+        started = time.thread_time()
+        compressed = compress(body, encoding, brotli_quality=PRECOMPRESSED_BROTLI_QUALITY)
+        cpu_seconds = time.thread_time() - started
+        _precompressed.set((key, encoding), compressed)
+    # 캐시 적중 시에는 CPU 비용 없이 절감된 바이트만 기록된다
+    compression_stats.record(_route_name(request.scope), encoding, len(body), len(compressed), cpu_seconds)
+
+    headers["Content-Encoding"] = encoding
+    return Response(content=compressed, media_type=media_type, headers=headers)
+
+
+def clear_precompressed():
+    """캐시된 본문의 원본이 삭제될 때 (예: 회사 삭제로 분석 결과가 지워질 때) 호출합니다."""
+    _precompressed.clear()
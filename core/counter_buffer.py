@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import threading
+from typing import Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CounterBuffer:
+    """
+    key 별 카운터 묶음(width 개)을 메모리에 모아 두는 버퍼. 요청 처리 중에는 dict 갱신만 하고,
+    CounterFlusher 가 주기적으로 drain 해서 DB 에 한 번에 반영한다.
+    서로 다른 key 가 max_keys 개를 넘으면 새 key 의 증가분은 버리고 개수만 센다 (메모리 상한).
+    """
+
+    def __init__(self, width: int, max_keys: int):
+        self.width = width
+        self.max_keys = max_keys
+        self._counters: Dict[Hashable, List[int]] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def add(self, key: Hashable, index: int, delta: int = 1):
+        with self._lock:
+            counters = self._counters.get(key)
+            if counters is None:
+                if len(self._counters) >= self.max_keys:
+                    self.dropped += 1
+                    return
+                counters = self._counters[key] = [0] * self.width
+            counters[index] += delta
+
+    def drain(self) -> Dict[Hashable, List[int]]:
+        with self._lock:
+            counters, self._counters = self._counters, {}
+        return counters
+
+    def restore(self, counters: Dict[Hashable, List[int]]):
+        """반영에 실패한 증가분을 다시 더한다 (다음 flush 에서 재시도)."""
+        with self._lock:
+            for key, values in counters.items():
+                current = self._counters.get(key)
+                if current is None:
+                    if len(self._counters) >= self.max_keys:
+                        self.dropped += 1
+                        continue
+                    current = self._counters[key] = [0] * self.width
+                for i, value in enumerate(values):
+                    current[i] += value
+
+    def __len__(self):
+        return len(self._counters)
+
+
+class CounterFlusher:
+    """
+    flush 함수를 interval 초마다 스레드에서 실행하는 백그라운드 작업 (Purger 와 같은 방식).
+    종료 시 남은 증가분을 마지막으로 한 번 더 반영한다.
+    """
+
+    def __init__(self, flush: Callable[[], int], interval: float):
+        self.flush = flush
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.flushes = 0
+        self.failures = 0
+
+    def run_once(self) -> int:
+        try:
+            flushed = self.flush()
+            self.flushes += 1
+            return flushed
+        except Exception:
+            self.failures += 1
+            logger.exception("counter flush failed")
+            return 0
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await asyncio.to_thread(self.run_once)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.run_once)
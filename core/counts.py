@@ -0,0 +1,105 @@
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Hashable, NamedTuple, Sequence, Union
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.orm import Query, Session
+from core.cache import TTLCache
+from dotenv import load_dotenv
+
+load_dotenv()
+
+COUNT_CACHE_SECONDS = int(os.getenv("COUNT_CACHE_SECONDS", "60"))
+# 테이블 통계상 row 수가 이보다 많으면 (exact 요청이 아닐 때) 필터 결과 수를 추정한다
+EXACT_COUNT_MAX_ROWS = int(os.getenv("EXACT_COUNT_MAX_ROWS", "50000"))
+# 추정 시 최근 PK 구간에서 필터 일치 비율을 재는 표본 크기
+COUNT_SAMPLE_ROWS = int(os.getenv("COUNT_SAMPLE_ROWS", "2000"))
+
+_counts = TTLCache(ttl=COUNT_CACHE_SECONDS, maxsize=4096)
+
+# 테이블별 세대 번호. 쓰기 시 올리면 그 테이블의 기존 캐시 키는 더 이상 맞지 않게 된다.
+_generations: Dict[str, int] = defaultdict(int)
+_generation_lock = threading.Lock()
+
+
+class Total(NamedTuple):
+    count: int
+    exact: bool
+
+
+def invalidate_counts(*tables: str):
+    with _generation_lock:
+        for table in tables:
+            _generations[table] += 1
+
+
+def table_row_estimate(db: Session, table: str) -> int:
+    """DB 통계에서 읽은 테이블 row 수 (통계를 지원하지 않는 DB는 정확한 COUNT)"""
+    def load():
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            value = db.execute(text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+            ), {"table": table}).scalar()
+        elif dialect == "postgresql":
+            value = db.execute(text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"), {"table": table}).scalar()
+        else:
+            value = db.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar()
+        return max(int(value or 0), 0)
+    return _counts.get_or_load(("rows", table), load)
+
+
+def _exact(db: Session, query: Union[Query, Select]) -> int:
+    if isinstance(query, Select):
+        return db.execute(select(func.count()).select_from(query.order_by(None).subquery())).scalar()
+    return query.order_by(None).count()
+
+
+def _estimate(db: Session, query: Union[Query, Select], table: str, pk_column, table_rows: int) -> int:
+    """
+    최근 PK 구간(약 COUNT_SAMPLE_ROWS 건)에서의 필터 일치 비율 × 테이블 row 수.
+    구간 조회는 PK 인덱스 범위 스캔이라 전체 ilike 스캔보다 훨씬 싸다.
+    """
+    max_pk = db.query(func.max(pk_column)).scalar()
+    if max_pk is None:
+        return 0
+    window = pk_column > max_pk - COUNT_SAMPLE_ROWS
+    sample_rows = db.query(func.count()).select_from(pk_column.class_).filter(window).scalar() or 0
+    if not sample_rows:
+        return 0
+    matched = _exact(db, query.where(window) if isinstance(query, Select) else query.filter(window))
+    return round(matched / sample_rows * table_rows)
+
+
+def count_total(
+    db: Session,
+    query: Union[Query, Select],
+    table: str,
+    pk_column,
+    signature: Sequence[Hashable] = (),
+    exact: bool = False,
+    filtered: bool = True,
+) -> Total:
+    """
+    목록 쿼리(ORM Query 또는 select())의 전체 개수. (테이블, 필터 값) 조합별로 COUNT_CACHE_SECONDS 동안 캐시한다.
+
+    - exact: 항상 정확한 COUNT (캐시는 사용)
+    - filtered: 필터가 없으면 테이블 통계 값을 그대로 쓴다
+    큰 테이블에 필터가 걸린 경우 exact 가 아니면 표본 비율로 추정하고 Total.exact=False 로 알린다.
+    """
+    key = ("total", table, _generations[table], tuple(signature), exact)
+    cached = _counts.get(key)
+    if cached is not None:
+        return cached
+
+    table_rows = None if exact else table_row_estimate(db, table)
+    if table_rows is None or table_rows <= EXACT_COUNT_MAX_ROWS:
+        total = Total(_exact(db, query), True)
+    elif not filtered:
+        total = Total(table_rows, False)
+    else:
+        total = Total(_estimate(db, query, table, pk_column, table_rows), False)
+
+    _counts.set(key, total)
+    return total
@@ -0,0 +1,91 @@
+import unicodedata
+from collections import deque
+from typing import Dict, Hashable, Iterator, List, Set, Tuple
+
+
+def normalize_keyword_text(text: str) -> str:
+    """키워드와 본문을 같은 기준으로 맞춘다 (NFKC, 소문자, 공백 하나로)"""
+    return " ".join(unicodedata.normalize("NFKC", text).lower().split())
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick 다중 패턴 매칭기.
+    키워드를 모두 add 한 뒤 build 하면, 본문 길이에 비례하는 시간으로 모든 키워드 등장을 찾는다.
+
+    영문/숫자로 시작하거나 끝나는 키워드는 단어 경계에서만 매칭한다 ("go"가 "google"에 걸리지 않도록).
+    한글은 조사가 붙으므로 ("자바를") 부분 문자열로 매칭한다.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, Hashable]]] = [[]]
+        self._size = 0
+        self._built = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, keyword: str, payload: Hashable):
+        keyword = normalize_keyword_text(keyword)
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((keyword, payload))
+        self._size += 1
+        self._built = False
+
+    def build(self) -> "KeywordAutomaton":
+        """BFS로 실패 링크를 만들고, 실패 링크를 따라가며 출력 목록을 합친다."""
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+                queue.append(next_state)
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, Hashable]]:
+        """(시작 위치, 키워드, payload)를 정규화된 본문 기준으로 돌려준다."""
+        if not self._built:
+            self.build()
+        text = normalize_keyword_text(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword, payload in out[state]:
+                start = end - len(keyword) + 1
+                if _is_word_char(keyword[0]) and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if _is_word_char(keyword[-1]) and end + 1 < len(text) and _is_word_char(text[end + 1]):
+                    continue
+                yield start, keyword, payload
+
+    def match(self, *texts: str) -> Set[Hashable]:
+        """본문들에 등장한 키워드의 payload 집합"""
+        return {payload for text in texts if text for _, _, payload in self.iter_matches(text)}
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+import httpx
+from core.apidog_integration import RequestTemplate, generate_test_cases, validate_api_endpoints
+
+OVERALL = "ALL"
+METRICS = ("p50", "p95", "p99", "max", "error_rate", "rps")
+_SLO_PATTERN = re.compile(r"^(?:(?P<route>.+):)?(?P<metric>\w+)\s*(?P<op>[<>])\s*(?P<value>[\d.]+)$")
+
+
+@dataclass
+class MixEntry:
+    """트래픽 믹스의 한 줄. weight 비율로 route 를 고르고, query 는 템플릿 쿼리에 덮어쓴다."""
+    route: str
+    weight: float
+    query: Dict = field(default_factory=dict)
+
+
+def load_mix(path: str) -> List[MixEntry]:
+    """[{"route": "GET /questions", "weight": 10, "query": {...}}, ...] 형식의 JSON 파일"""
+    with open(path, encoding="utf-8") as f:
+        return [MixEntry(item["route"], float(item["weight"]), item.get("query", {})) for item in json.load(f)]
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+@dataclass
+class RouteStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+
+    def record(self, latency_ms: float, status: Optional[int]):
+        self.latencies_ms.append(latency_ms)
+        self.statuses[status if status is not None else "exception"] += 1
+        if status is None or status >= 400:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> dict:
+        values = sorted(self.latencies_ms)
+        count = len(values)
+        return {
+            "requests": count,
+            "rps": round(count / elapsed, 2) if elapsed else 0.0,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "p50": round(percentile(values, 50), 2),
+            "p95": round(percentile(values, 95), 2),
+            "p99": round(percentile(values, 99), 2),
+            "max": round(values[-1], 2) if values else 0.0,
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items(), key=str)},
+        }
+
+
+@dataclass
+class LoadReport:
+    elapsed: float
+    routes: Dict[str, RouteStats]
+
+    def summary(self) -> Dict[str, dict]:
+        overall = RouteStats()
+        for stats in self.routes.values():
+            overall.latencies_ms.extend(stats.latencies_ms)
+            overall.statuses.update(stats.statuses)
+            overall.errors += stats.errors
+        result = {route: stats.summary(self.elapsed) for route, stats in sorted(self.routes.items())}
+        result[OVERALL] = overall.summary(self.elapsed)
+        return result
+
+    def format(self) -> str:
+        summary = self.summary()
+        width = max(len(route) for route in summary)
+        lines = [f"{'route':<{width}} {'reqs':>7} {'rps':>8} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  statuses"]
+        for route, row in summary.items():
+            statuses = " ".join(f"{status}:{n}" for status, n in row["statuses"].items())
+            lines.append(
+                f"{route:<{width}} {row['requests']:>7} {row['rps']:>8.1f} {row['error_rate'] * 100:>6.2f} "
+                f"{row['p50']:>8.1f} {row['p95']:>8.1f} {row['p99']:>8.1f} {row['max']:>8.1f}  {statuses}"
+            )
+        lines.append(f"elapsed: {self.elapsed:.2f}s (latencies in ms)")
+        return "\n".join(lines)
+
+
+@dataclass
+class SLO:
+    """"GET /questions:p95<200" 처럼 route 별, "p99<500" 처럼 전체(ALL)에 거는 기준"""
+    route: str
+    metric: str
+    op: str
+    value: float
+
+    @classmethod
+    def parse(cls, text: str) -> "SLO":
+        match = _SLO_PATTERN.match(text.strip())
+        if not match or match["metric"] not in METRICS:
+            raise ValueError(f"Invalid SLO '{text}' (expected [ROUTE:]{'|'.join(METRICS)}<VALUE)")
+        return cls(match["route"] or OVERALL, match["metric"], match["op"], float(match["value"]))
+
+    def __str__(self):
+        return f"{self.route}:{self.metric}{self.op}{self.value:g}"
+
+
+def check_slos(summary: Dict[str, dict], slos: Sequence[SLO]) -> List[str]:
+    """위반한 SLO 설명 목록 (트래픽이 없던 route 의 SLO 도 위반으로 본다)"""
+    violations = []
+    for slo in slos:
+        row = summary.get(slo.route)
+        if not row or not row["requests"]:
+            violations.append(f"{slo}: no requests recorded")
+            continue
+        actual = row[slo.metric]
+        ok = actual < slo.value if slo.op == "<" else actual > slo.value
+        if not ok:
+            violations.append(f"{slo}: actual {actual}")
+    return violations
+
+
+class LoadRunner:
+    """
+    OpenAPI 스펙에서 만든 요청 템플릿으로 가중치 트래픽 믹스를 재생한다.
+    concurrency 개의 가상 사용자가 requests 건(또는 duration 초)이 찰 때까지 요청을 보낸다.
+    """
+
+    def __init__(self, spec: dict, mix: Sequence[MixEntry], pools: Dict[str, Sequence[int]], seed: int = 0):
+        self.templates = generate_test_cases(spec)
+        self.components = spec.get("components", {})
+        self.mix = [entry for entry in mix if entry.weight > 0]
+        self.pools = pools
+        self.rng = random.Random(seed)
+
+    def validate(self) -> List[str]:
+        return validate_api_endpoints(self.templates, [entry.route for entry in self.mix], self.pools)
+
+    async def run(
+        self,
+        client: httpx.AsyncClient,
+        concurrency: int = 16,
+        requests: Optional[int] = 1000,
+        duration: Optional[float] = None,
+        headers: Optional[dict] = None,
+    ) -> LoadReport:
+        routes: Dict[str, RouteStats] = defaultdict(RouteStats)
+        weights = [entry.weight for entry in self.mix]
+        issued = 0
+        started = time.perf_counter()
+        deadline = started + duration if duration else None
+
+        def next_entry() -> Optional[MixEntry]:
+            nonlocal issued
+            if requests is not None and issued >= requests:
+                return None
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
+            issued += 1
+            return self.rng.choices(self.mix, weights)[0]
+
+        async def user():
+            while (entry := next_entry()) is not None:
+                template: RequestTemplate = self.templates[entry.route]
+                method, url, params, body = template.build(self.rng, self.pools, self.components, entry.query)
+                request_started = time.perf_counter()
+                try:
+                    response = await client.request(method, url, params=params, json=body, headers=headers)
+                    status = response.status_code
+                except httpx.HTTPError:
+                    status = None
+                routes[entry.route].record((time.perf_counter() - request_started) * 1000, status)
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        return LoadReport(time.perf_counter() - started, dict(routes))
+
+
+def in_process_client(app) -> httpx.AsyncClient:
+    """ASGI 앱을 네트워크 없이 같은 이벤트 루프에서 호출하는 클라이언트 (lifespan 은 실행하지 않는다)"""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=60)
+
+
+class LocalServer:
+    """부하 테스트용으로 같은 프로세스의 별도 스레드에서 uvicorn 을 띄운다 (dependency_overrides 가 그대로 적용된다)."""
+
+    def __init__(self, app, host: str = "127.0.0.1", port: int = 8765, **options):
+        import uvicorn
+        from core.log import UVICORN_LOG_CONFIG
+        config = uvicorn.Config(
+            app, host=host, port=port, lifespan="off", log_level="warning", log_config=UVICORN_LOG_CONFIG, **options,
+        )
+        self.server = uvicorn.Server(config)
+        self.url = f"http://{host}:{port}"
+        self._thread = threading.Thread(target=self.server.run, name="loadtest-uvicorn", daemon=True)
+
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("uvicorn did not start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self._thread.join(timeout=10)
@@ -0,0 +1,284 @@
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Dict, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# json: 한 줄에 JSON 하나 (수집기용), text: 사람이 읽는 한 줄 형식 (로컬 개발용)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+# 요청 처리 스레드/이벤트 루프는 큐에 넣기만 하고 출력은 별도 스레드가 한다. 큐가 차면 버리고 개수만 센다.
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# 이벤트 이름별 기록 비율 (예: "auth.verified=0.01,cache.hit=0.001"). WARNING 이상은 항상 남긴다.
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "auth.verified=0.01")
+# 요청마다 레코드를 남기는 라이브러리 로거의 최소 레벨 (Clerk SDK 가 인증마다 httpx 요청 로그를 남긴다)
+LOG_LIBRARY_LEVELS = os.getenv("LOG_LIBRARY_LEVELS", "httpx=WARNING,httpcore=WARNING")
+
+REQUEST_ID_HEADER = b"x-request-id"
+# 클라이언트/LB 가 준 요청 id 는 이 형식일 때만 이어 쓴다 (로그 주입 방지)
+_REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._-]{8,64}")
+
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+
+REDACTED = "[REDACTED]"
+# extra 필드 이름이 이 패턴이면 값을 통째로 가린다
+_SECRET_KEYS = re.compile(r"token|authorization|password|secret|cookie|api_key|credential", re.IGNORECASE)
+# 메시지 안에 섞여 들어온 자격 증명 (Bearer 헤더 값, JWT)
+_SECRET_VALUES = [
+    re.compile(r"(?i)(bearer\s+)[A-Za-z0-9._~+/=-]+"),
+    re.compile(r"eyJ[A-Za-z0-9_-]+\.eyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*"),
+    re.compile(r"\bsk_(?:live|test)_[A-Za-z0-9]+"),
+]
+
+# LogRecord 기본 속성. 이 외의 속성은 logger.info(..., extra={...}) 로 붙인 구조화 필드다.
+# color_message 는 uvicorn 이 붙이는 터미널 색상용 메시지라 뺀다
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime", "request_id", "event", "sample_rate", "color_message",
+}
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    rates = {}
+    for item in value.split(","):
+        name, _, rate = item.strip().partition("=")
+        if name and rate:
+            rates[name] = min(max(float(rate), 0.0), 1.0)
+    return rates
+
+
+def parse_levels(value: str) -> Dict[str, str]:
+    levels = {}
+    for item in value.split(","):
+        name, _, level = item.strip().partition("=")
+        if name and level:
+            levels[name] = level.strip().upper()
+    return levels
+
+
+# uvicorn.run(log_config=...) 용. uvicorn 기본 설정은 access/error 로거에 stdout/stderr 핸들러를 직접 달아
+# 이벤트 루프에서 동기로 쓰므로, 핸들러를 비우고 루트(큐 핸들러)로 전파시킨다.
+UVICORN_LOG_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "loggers": {
+        "uvicorn": {"handlers": [], "propagate": True},
+        "uvicorn.error": {"handlers": [], "propagate": True},
+        "uvicorn.access": {"handlers": [], "propagate": True},
+    },
+}
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+def redact_text(text: str) -> str:
+    for pattern in _SECRET_VALUES:
+        text = pattern.sub(lambda m: (m.group(1) if m.re.groups else "") + REDACTED, text)
+    return text
+
+
+def redact_value(key: str, value):
+    if _SECRET_KEYS.search(key):
+        return REDACTED
+    if isinstance(value, str):
+        return redact_text(value)
+    if isinstance(value, dict):
+        return {k: redact_value(str(k), v) for k, v in value.items()}
+    return value
+
+
+class ContextFilter(logging.Filter):
+    """
+    호출한 쪽(요청 처리 중인 스레드/태스크)에서 실행되는 필터. 요청 id 를 레코드에 붙이고 샘플링한다.
+    샘플링에서 빠진 레코드는 큐에 들어가지도 않는다.
+    """
+
+    def __init__(self, sample_rates: Dict[str, float]):
+        super().__init__()
+        self.sample_rates = sample_rates
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        event = getattr(record, "event", None)
+        rate = self.sample_rates.get(event, 1.0) if event else 1.0
+        if rate < 1.0 and record.levelno < logging.WARNING:
+            if random.random() >= rate:
+                self.sampled_out += 1
+                return False
+            # 수집기에서 1/rate 배로 환산할 수 있게 비율을 남긴다
+            record.sample_rate = rate
+        record.request_id = current_request_id.get()
+        return True
+
+
+class RedactingFilter(logging.Filter):
+    """출력 스레드에서 실행된다. 메시지와 구조화 필드의 자격 증명을 가린다."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = redact_text(record.getMessage())
+        record.args = None
+        if record.exc_text:
+            record.exc_text = redact_text(record.exc_text)
+        for key in list(vars(record)):
+            if key not in _RECORD_FIELDS:
+                setattr(record, key, redact_value(key, getattr(record, key)))
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key in ("request_id", "event", "sample_rate"):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "request_id"):
+            record.request_id = "-"
+        return super().format(record)
+
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버린다 (로그 때문에 요청이 막히지 않도록)."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 traceback 을 메시지에 이어 붙이므로, 구조화 출력용으로 exc 를 따로 둔다
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """루트 로거 → (ContextFilter) → 큐 → 출력 스레드 (RedactingFilter → 포맷 → stderr)"""
+
+    def __init__(self):
+        self.handler: Optional[DroppingQueueHandler] = None
+        self.context: Optional[ContextFilter] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self._lock = threading.Lock()
+
+    def setup(self, level: str = LOG_LEVEL, fmt: str = LOG_FORMAT, stream=None):
+        """여러 번 불러도 한 번만 설치한다 (워커 프로세스마다 import 시 호출)."""
+        with self._lock:
+            if self.listener is not None:
+                return
+            output = logging.StreamHandler(stream or sys.stderr)
+            output.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+            output.addFilter(RedactingFilter())
+
+            self.context = ContextFilter(parse_sample_rates(LOG_SAMPLE_RATES))
+            self.handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+            self.handler.addFilter(self.context)
+
+            root = logging.getLogger()
+            root.setLevel(level)
+            root.addHandler(self.handler)
+            for name, library_level in parse_levels(LOG_LIBRARY_LEVELS).items():
+                logging.getLogger(name).setLevel(library_level)
+            self.listener = logging.handlers.QueueListener(self.handler.queue, output, respect_handler_level=True)
+            self.listener.start()
+
+    def shutdown(self):
+        """남은 로그를 모두 출력하고 출력 스레드를 멈춘다."""
+        with self._lock:
+            if self.listener is None:
+                return
+            self.listener.stop()
+            logging.getLogger().removeHandler(self.handler)
+            self.listener = None
+
+    def snapshot(self) -> dict:
+        if self.handler is None:
+            return {"installed": False}
+        return {
+            "installed": True,
+            "queued": self.handler.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "sampled_out": self.context.sampled_out,
+        }
+
+
+log_pipeline = LogPipeline()
+
+
+class RequestIdMiddleware:
+    """
+    요청마다 correlation id 를 정한다. 들어온 X-Request-ID 가 올바르면 이어 쓰고 아니면 새로 만든다.
+    이 요청에서 남긴 로그에 request_id 로 붙고, 응답 헤더로도 돌려준다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", []):
+            if name == REQUEST_ID_HEADER:
+                candidate = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.fullmatch(candidate):
+                    request_id = candidate
+                break
+        request_id = request_id or new_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(REQUEST_ID_HEADER, request_id.encode("latin-1"))]
+            await send(message)
+
+        token = current_request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_id.reset(token)
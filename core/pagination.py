@@ -1,22 +1,160 @@
-from sqlalchemy.orm import Query
-from typing import List, Optional, TypeVar, Generic
+import base64
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.orm import Query, Session
 from api.schemas.base import CursorPage
 
 T = TypeVar('T')
 
-def paginate_cursor(
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "100"))
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    keyset 정렬 키. 마지막 키는 유일해야 하고(보통 PK), 모든 키는 NULL이 아니어야 한다.
+    name 은 커서에 기록되는 이름이자, 결과 row에서 값을 꺼낼 속성 이름이다.
+    """
+    column: Any
+    descending: bool = False
+    name: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return self.name or self.column.key
+
+
+def clamp_size(size: Optional[int]) -> int:
+    """서버 쪽 페이지 크기 상한 (1 ~ MAX_PAGE_SIZE)"""
+    if size is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(keys: Sequence[SortKey], values: Sequence, backward: bool = False) -> str:
+    payload = {"k": [key.key for key in keys], "v": [_encode_value(v) for v in values], "b": backward}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> Tuple[List, bool]:
+    """(정렬 키 값 목록, 뒤로 가기 여부). 다른 정렬로 만든 커서나 깨진 커서는 400"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [_decode_value(v) for v in payload["v"]]
+        backward = bool(payload.get("b", False))
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if payload.get("k") != [key.key for key in keys] or len(values) != len(keys):
+        raise HTTPException(status_code=400, detail="Cursor does not match this list")
+    return values, backward
+
+
+def seek_condition(keys: Sequence[SortKey], values: Sequence, backward: bool = False):
+    """
+    (k1, k2, ...) 가 커서 값 다음(backward 이면 이전)에 오는 row 조건.
+    k1 > v1 OR (k1 = v1 AND k2 > v2) ... 형태라 선두 키 인덱스로 seek 할 수 있다.
+    """
+    clauses = []
+    for i, key in enumerate(keys):
+        after = key.descending == backward  # 오름차순 정방향이면 >
+        bound = key.column > values[i] if after else key.column < values[i]
+        clauses.append(and_(*[keys[j].column == values[j] for j in range(i)], bound))
+    return or_(*clauses)
+
+
+def paginate_keyset(
     query: Query,
-    cursor_id: Optional[int] = None,
-    size: int = 20,
-    id_column = None
+    keys: Sequence[SortKey],
+    cursor: Optional[str] = None,
+    size: Optional[int] = DEFAULT_PAGE_SIZE,
+    key_of: Optional[Callable[[Any], Sequence]] = None,
+    to_value: Optional[Callable[[Any], Any]] = None,
+    db: Optional[Session] = None,
 ) -> CursorPage[T]:
-    if cursor_id:
-        query = query.filter(id_column > cursor_id)
+    """
+    여러 컬럼 정렬 키에 대한 keyset(seek) 페이지네이션.
+    정렬은 이 함수가 keys 로 다시 건다. 응답의 next_cursor/prev_cursor 를 그대로 cursor 로 넘기면 된다.
+
+    query 는 ORM Query 또는 (db 와 함께) 컬럼 select() 문이다. select() 는 ORM 인스턴스 대신 Row 를 돌려준다.
+
+    - key_of: row 에서 정렬 키 값을 꺼내는 함수 (기본: SortKey.key 속성)
+    - to_value: 응답에 담을 값으로 바꾸는 함수 (예: (Question, priority) row → Question)
+    - has_prev 는 추가 쿼리 없이 "커서로 들어왔는지"로 판단한다 (커서 row가 지워졌다면 빈 이전 페이지일 수 있다)
+    """
+    size = clamp_size(size)
+    key_of = key_of or (lambda row: [getattr(row, key.key) for key in keys])
+
+    backward = False
+    if cursor:
+        values, backward = decode_cursor(keys, cursor)
+        condition = seek_condition(keys, values, backward)
+        query = query.where(condition) if isinstance(query, Select) else query.filter(condition)
 
-    items = query.limit(size + 1).all()
+    order = [
+        key.column.asc() if key.descending == backward else key.column.desc()
+        for key in keys
+    ]
+    statement = query.order_by(None).order_by(*order).limit(size + 1)
+    rows = db.execute(statement).all() if isinstance(query, Select) else statement.all()
 
-    has_next = len(items) > size
-    if has_next:
-        items = items[:-1]
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if backward:
+        rows.reverse()
+        has_next, has_prev = bool(cursor), has_more
+    else:
+        has_next, has_prev = has_more, bool(cursor)
 
-    return CursorPage(values=items, has_next=has_next)
\ No newline at end of file
+    next_cursor = encode_cursor(keys, key_of(rows[-1])) if rows and has_next else None
+    prev_cursor = encode_cursor(keys, key_of(rows[0]), backward=True) if rows and has_prev else None
+    values = [to_value(row) for row in rows] if to_value else rows
+    return CursorPage(
+        values=values,
+        has_next=has_next,
+        has_prev=has_prev,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
+
+
+def paginate_cursor(
+    query: Query,
+    cursor_id: Optional[int] = None,
+    size: int = 20,
+    id_column = None,
+    cursor: Optional[str] = None,
+    db: Optional[Session] = None,
+    to_value: Optional[Callable[[Any], Any]] = None,
+) -> CursorPage[T]:
+    """
+    id 오름차순 목록용. cursor(불투명 커서)가 있으면 그것을, 없으면 예전 방식의 cursor_id(마지막 id)를 쓴다.
+    """
+    keys = [SortKey(id_column)]
+    if not cursor and cursor_id is not None:
+        cursor = encode_cursor(keys, [cursor_id])
+    return paginate_keyset(query, keys, cursor, size, to_value=to_value, db=db)
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# X-Profile 헤더 값이 이 비밀값과 같으면 그 요청을 프로파일링한다 (비어 있으면 헤더 모드 비활성)
+PROFILE_SECRET = os.getenv("PROFILE_SECRET", "")
+# 0~1, 전체 트래픽 중 무작위로 프로파일링할 비율
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "2"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join("/tmp", "interviewq-profiles"))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))
+
+PROFILE_HEADER = b"x-profile"
+
+# 다른 스레드의 스택 중 이 함수에서 멈춰 있는 것은 유휴 상태로 보고 버린다
+_IDLE_FUNCTIONS = {"wait", "select", "poll", "epoll", "_worker", "get", "sleep", "accept"}
+
+
+def new_profile_id() -> str:
+    # 시간순 정렬되는 파일명 (링 버퍼에서 오래된 것부터 지운다)
+    return f"{int(time.time() * 1000):x}-{uuid.uuid4().hex[:8]}"
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _stack(frame) -> List[str]:
+    stack = []
+    while frame is not None:
+        stack.append(_frame_label(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+class SamplingProfiler:
+    """
+    별도 스레드에서 일정 간격으로 sys._current_frames()를 읽어 스택을 센다.
+    이 앱의 라우트는 async 함수 안에서 동기 DB 호출을 하므로 대부분의 시간이 이벤트 루프 스레드에 잡힌다.
+    cProfile은 코루틴 전환과 스레드풀 작업을 한 프로파일로 묶지 못해서 샘플링 방식을 쓴다.
+    같은 시간대의 다른 요청도 함께 샘플링될 수 있다.
+    """
+
+    def __init__(self, target_thread: int, interval: float = PROFILE_INTERVAL_MS / 1000):
+        self.target_thread = target_thread
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            self.sample_count += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                if thread_id != self.target_thread and frame.f_code.co_name in _IDLE_FUNCTIONS:
+                    continue
+                if thread_id not in names:
+                    names[thread_id] = next(
+                        (t.name for t in threading.enumerate() if t.ident == thread_id), str(thread_id)
+                    )
+                label = "event-loop" if thread_id == self.target_thread else names[thread_id]
+                self.samples[";".join([f"[{label}]"] + _stack(frame))] += 1
+
+    def folded(self) -> str:
+        """flamegraph.pl / speedscope 에서 읽을 수 있는 collapsed stack 형식"""
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common())
+
+    def top_functions(self, limit: int = 30) -> List[dict]:
+        """함수별 자기 시간(스택 맨 위)과 누적 시간(스택 어딘가) 샘플 수"""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.samples.items():
+            frames = stack.split(";")[1:]
+            if not frames:
+                continue
+            self_counts[frames[-1]] += count
+            for frame in set(frames):
+                total_counts[frame] += count
+        # 핫스팟이 위로 오도록 자기 시간 순으로 정렬
+        return [
+            {"function": function, "self_samples": count, "total_samples": total_counts[function]}
+            for function, count in self_counts.most_common(limit)
+        ]
+
+
+class ProfileStore:
+    """PROFILE_DIR 에 최근 PROFILE_MAX_FILES 개만 남기는 디스크 링 버퍼"""
+
+    def __init__(self, directory: str = PROFILE_DIR, max_files: int = PROFILE_MAX_FILES):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def _path(self, profile_id: str) -> str:
+        # id는 save 가 만든 16진수 문자열만 허용 (경로 조작 방지)
+        if not profile_id or not all(c in "0123456789abcdef-" for c in profile_id):
+            raise KeyError(profile_id)
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def save(self, meta: dict, profiler: SamplingProfiler, profile_id: Optional[str] = None) -> str:
+        profile_id = profile_id or new_profile_id()
+        record = {
+            "id": profile_id,
+            **meta,
+            "interval_ms": profiler.interval * 1000,
+            "samples": profiler.sample_count,
+            "top": profiler.top_functions(),
+            "folded": profiler.folded(),
+        }
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self._path(profile_id) + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(profile_id))
+            for old in self._files()[:-self.max_files]:
+                self._remove(old)
+        return profile_id
+
+    def _remove(self, name: str):
+        # 워커 여러 개가 같은 디렉터리를 정리하므로 (잠금은 프로세스 안에서만 유효) 이미 지워졌을 수 있다
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+    def _files(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(".json"))
+
+    def load(self, profile_id: str) -> Optional[dict]:
+        try:
+            with open(self._path(profile_id), encoding="utf-8") as f:
+                return json.load(f)
+        except (KeyError, FileNotFoundError):
+            return None
+
+    def list(self) -> List[dict]:
+        """최신순 메타 정보 (스택 본문 제외)"""
+        entries = []
+        for name in reversed(self._files()):
+            record = self.load(name[:-len(".json")])
+            if record:
+                record.pop("folded", None)
+                record.pop("top", None)
+                entries.append(record)
+        return entries
+
+    def clear(self):
+        with self._lock:
+            for name in self._files():
+                self._remove(name)
+
+
+profile_store = ProfileStore()
+
+
+class ProfilingMiddleware:
+    """
+    X-Profile: <PROFILE_SECRET> 헤더가 있거나 PROFILE_SAMPLE_RATE 확률에 걸린 요청을 샘플링 프로파일링한다.
+    결과는 profile_store 에 저장되고, 응답 헤더 X-Profile-Id 로 id를 돌려준다 (조회는 /admin/profiles).
+    """
+
+    def __init__(self, app, store: ProfileStore = profile_store):
+        self.app = app
+        self.store = store
+
+    def _should_profile(self, scope) -> bool:
+        if PROFILE_SECRET:
+            headers: Dict[bytes, bytes] = dict(scope.get("headers") or [])
+            if headers.get(PROFILE_HEADER) == PROFILE_SECRET.encode():
+                return True
+        return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = SamplingProfiler(threading.get_ident())
+        profile_id = new_profile_id()
+        status = {"code": 0}
+        started_at, started = time.time(), time.perf_counter()
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", profile_id.encode())
+                ]
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            meta = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "status": status["code"],
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "started_at": started_at,
+            }
+            # 샘플러 스레드 join 과 JSON 직렬화/파일 쓰기/정리는 이벤트 루프 밖에서
+            await asyncio.to_thread(self._finish, profiler, meta, profile_id)
+
+    def _finish(self, profiler: SamplingProfiler, meta: dict, profile_id: str):
+        profiler.stop()
+        try:
+            self.store.save(meta, profiler, profile_id)
+        except OSError:
+            logger.exception("profile save failed: %s", profile_id)
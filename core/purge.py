@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Callable, List
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.orm import Session
+from core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = float(os.getenv("PURGE_INTERVAL_SECONDS", "30"))
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "500"))
+PURGE_MAX_BATCHES = int(os.getenv("PURGE_MAX_BATCHES", "20"))
+
+# 삭제/purge 문장은 soft delete 필터와 세션 동기화를 모두 건너뛴다
+SET_BASED = {"include_deleted": True, "synchronize_session": False}
+
+
+@dataclass
+class CascadeStep:
+    """
+    cascade 삭제의 한 단계. table의 row 중 where 조건에 해당하는 것을 지운다.
+    pk는 배치를 나눌 키 컬럼이며, 복합키 조인 테이블은 컬럼 튜플로 준다.
+    """
+    table: object
+    where: object
+    pk: object
+
+    def key_condition(self, rows):
+        """select(*self.keys) 로 읽은 row 들만 고르는 조건"""
+        if len(self.keys) == 1:
+            return self.keys[0].in_([row[0] for row in rows])
+        return tuple_(*self.keys).in_([tuple(row) for row in rows])
+
+    @property
+    def keys(self) -> tuple:
+        return self.pk if isinstance(self.pk, tuple) else (self.pk,)
+
+
+def delete_cascade(db: Session, steps: List[CascadeStep]):
+    """하위 테이블부터 순서대로 set-based DELETE를 실행합니다. (트랜잭션은 호출자가 관리)"""
+    for step in steps:
+        db.execute(delete(step.table).where(step.where).execution_options(**SET_BASED))
+
+
+def purge_cascade(db: Session, steps: List[CascadeStep], batch_size: int, max_batches: int) -> int:
+    """
+    steps를 순서대로 batch_size 단위로 지우고 배치마다 커밋합니다.
+    max_batches를 모두 쓰면 중단하며, 다음 호출에서 남은 단계부터 이어서 처리합니다.
+    처리한 배치 수를 반환합니다.
+    """
+    batches = 0
+    for step in steps:
+        while batches < max_batches:
+            rows = db.execute(
+                select(*step.keys).where(step.where).limit(batch_size)
+                .execution_options(include_deleted=True)
+            ).all()
+            if not rows:
+                break
+            db.execute(delete(step.table).where(step.key_condition(rows)).execution_options(**SET_BASED))
+            db.commit()
+            batches += 1
+
+        if batches >= max_batches:
+            break
+    return batches
+
+
+class Purger:
+    """
+    soft delete 된 row를 주기적으로 정리하는 백그라운드 작업.
+    tasks는 (db, batch_size, max_batches) -> 처리한 배치 수 형태의 함수 목록이다.
+    """
+
+    def __init__(self, tasks: List[Callable[[Session, int, int], int]], interval: float = PURGE_INTERVAL_SECONDS):
+        self.tasks = tasks
+        self.interval = interval
+        self._task = None
+
+    def run_once(self) -> int:
+        batches = 0
+        db = SessionLocal()
+        try:
+            for task in self.tasks:
+                remaining = PURGE_MAX_BATCHES - batches
+                if remaining <= 0:
+                    break
+                batches += task(db, PURGE_BATCH_SIZE, remaining)
+        except Exception:
+            db.rollback()
+            logger.exception("purge failed")
+        finally:
+            db.close()
+        return batches
+
+    async def _loop(self):
+        while True:
+            batches = await asyncio.to_thread(self.run_once)
+            # 배치 한도를 다 썼으면 남은 작업이 있으므로 바로 이어서 처리한다
+            if batches < PURGE_MAX_BATCHES:
+                await asyncio.sleep(self.interval)
+            else:
+                await asyncio.sleep(0)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
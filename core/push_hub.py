@@ -0,0 +1,135 @@
+import asyncio
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 연결별 이벤트 버퍼. 넘치면 쌓인 이벤트를 버리고 resync 이벤트 하나로 바꾼다 (클라이언트는 since 로 따라잡는다).
+PUSH_QUEUE_SIZE = int(os.getenv("PUSH_QUEUE_SIZE", "64"))
+PUSH_MAX_CONNECTIONS = int(os.getenv("PUSH_MAX_CONNECTIONS", "10000"))
+PUSH_MAX_CHANNELS = int(os.getenv("PUSH_MAX_CHANNELS", "50"))
+PUSH_HEARTBEAT_SECONDS = float(os.getenv("PUSH_HEARTBEAT_SECONDS", "25"))
+
+CHANNEL_PATTERN = re.compile(r"(question|answer):\d+")
+
+# 큐에 넣는 항목: (이벤트 이름, 직렬화된 JSON). None 은 서버 종료 신호.
+Message = Optional[Tuple[str, str]]
+RESYNC: Tuple[str, str] = ("resync", json.dumps({"type": "resync"}))
+
+
+class HubFull(Exception):
+    pass
+
+
+class Subscription:
+    """연결 하나. 이벤트는 이벤트 루프 스레드에서만 넣고 뺀다."""
+    __slots__ = ("channels", "queue", "dropped")
+
+    def __init__(self, maxsize: int = PUSH_QUEUE_SIZE):
+        self.channels: Set[str] = set()
+        self.queue: "asyncio.Queue[Message]" = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def offer(self, message: Message):
+        if self.queue.full():
+            # 느린 클라이언트 때문에 메모리가 늘지 않도록 버퍼를 비우고 다시 동기화하라고 알린다
+            self.dropped += self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+        self.queue.put_nowait(message)
+
+    async def next(self, timeout: float = PUSH_HEARTBEAT_SECONDS) -> Optional[Message]:
+        """다음 이벤트. timeout 동안 없으면 ("ping", "") — 하트비트로 쓴다."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return ("ping", "")
+
+
+class PushHub:
+    """
+    채널(question:<id>, answer:<id>) 단위 fan-out. 연결마다 코루틴 하나와 작은 큐만 쓰므로
+    한 워커가 수천 개의 유휴 구독자를 들고 있을 수 있다. publish 는 어느 스레드에서 불러도 된다
+    (cache bus 폴링 스레드 → 이벤트 루프로 넘긴다).
+    """
+
+    def __init__(self, max_connections: int = PUSH_MAX_CONNECTIONS, max_channels: int = PUSH_MAX_CHANNELS):
+        self.max_connections = max_connections
+        self.max_channels = max_channels
+        self._channels: Dict[str, Set[Subscription]] = {}
+        self._subscriptions: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self.published = 0
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+
+    def connect(self) -> Subscription:
+        if len(self._subscriptions) >= self.max_connections:
+            raise HubFull()
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.bind(loop)
+        subscription = Subscription()
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def subscribe(self, subscription: Subscription, channels: Iterable[str]):
+        for channel in channels:
+            if not CHANNEL_PATTERN.fullmatch(channel):
+                raise ValueError(f"Invalid channel: {channel}")
+            if channel not in subscription.channels and len(subscription.channels) >= self.max_channels:
+                raise ValueError(f"Too many channels (max {self.max_channels})")
+            subscription.channels.add(channel)
+            self._channels.setdefault(channel, set()).add(subscription)
+
+    def unsubscribe(self, subscription: Subscription, channels: Iterable[str]):
+        for channel in channels:
+            subscription.channels.discard(channel)
+            subscribers = self._channels.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[channel]
+
+    def disconnect(self, subscription: Subscription):
+        self.unsubscribe(subscription, list(subscription.channels))
+        self._subscriptions.discard(subscription)
+
+    def publish(self, channel: str, event: dict):
+        if self._loop is None or channel not in self._channels:
+            return
+        # 구독자 수와 상관없이 한 번만 직렬화한다
+        message = (event.get("type", "message"), json.dumps({"channel": channel, **event}, ensure_ascii=False))
+        if threading.get_ident() == self._loop_thread:
+            self._fanout(channel, message)
+        else:
+            self._loop.call_soon_threadsafe(self._fanout, channel, message)
+
+    def _fanout(self, channel: str, message: Tuple[str, str]):
+        self.published += 1
+        for subscription in list(self._channels.get(channel, ())):
+            subscription.offer(message)
+
+    def close(self):
+        """서버 종료 시 열린 스트림이 끝나도록 모든 연결에 종료 신호를 보낸다."""
+        for subscription in list(self._subscriptions):
+            subscription.offer(None)
+
+    def snapshot(self) -> dict:
+        return {
+            "connections": len(self._subscriptions),
+            "channels": len(self._channels),
+            "published": self.published,
+            "dropped": sum(subscription.dropped for subscription in self._subscriptions),
+        }
+
+
+push_hub = PushHub()
@@ -0,0 +1,159 @@
+import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from core.cache import TTLCache
+from core.log import current_request_id
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", "200"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() in ("1", "true", "yes")
+# 같은 정규화 SQL의 EXPLAIN은 이 시간 동안 다시 뜨지 않는다
+EXPLAIN_CACHE_SECONDS = int(os.getenv("SLOW_QUERY_EXPLAIN_CACHE_SECONDS", "600"))
+EXPLAIN_CACHE_SIZE = int(os.getenv("SLOW_QUERY_EXPLAIN_CACHE_SIZE", "256"))
+
+# 쿼리를 실행한 요청 (QueryRouteMiddleware 가 설정, 스레드풀로도 컨텍스트가 복사된다)
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """리터럴과 IN (...) 자리표시자 개수를 지워 같은 모양의 쿼리를 하나로 묶는다."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def parameter_shape(parameters, executemany: bool):
+    """값 대신 타입(문자열은 길이까지)만 남긴다. 개인정보가 로그에 남지 않도록."""
+    def shape(value):
+        if isinstance(value, str):
+            return f"str({len(value)})"
+        return type(value).__name__
+
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "first": parameter_shape(rows[0], False) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [shape(value) for value in parameters]
+    return None
+
+
+class SlowQueryLog:
+    """최근 느린 쿼리 목록. EXPLAIN 은 별도 스레드에서 채워 넣는다."""
+
+    def __init__(self, maxlen: int = SLOW_QUERY_LOG_SIZE):
+        self.entries = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._plans = TTLCache(ttl=EXPLAIN_CACHE_SECONDS, maxsize=EXPLAIN_CACHE_SIZE)  # (dialect, 정규화 SQL) → plan
+        self._explain_queue: "queue.Queue" = queue.Queue(maxsize=32)
+        self._worker: Optional[threading.Thread] = None
+        self._local = threading.local()
+
+    def install(self, engine: Engine):
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slow_query_started = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started", None)
+        if started is None or getattr(self._local, "explaining", False):
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms < SLOW_QUERY_MS:
+            return
+        entry = {
+            "at": time.time(),
+            "duration_ms": round(elapsed_ms, 2),
+            "route": current_route.get(),
+            "request_id": current_request_id.get(),
+            "sql": normalize_sql(statement),
+            "params": parameter_shape(parameters, executemany),
+            "rowcount": cursor.rowcount,
+            "explain": None,
+        }
+        with self._lock:
+            self.entries.append(entry)
+        if SLOW_QUERY_EXPLAIN and not executemany and statement.lstrip()[:6].upper() == "SELECT":
+            self._queue_explain(conn.engine, statement, parameters, entry)
+
+    def _queue_explain(self, engine: Engine, statement, parameters, entry):
+        key = (engine.dialect.name, entry["sql"])
+        cached = self._plans.get(key)
+        if cached is not None:
+            entry["explain"] = cached
+            return
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._explain_loop, name="slow-query-explain", daemon=True)
+            self._worker.start()
+        try:
+            self._explain_queue.put_nowait((engine, statement, parameters, entry, key))
+        except queue.Full:
+            entry["explain"] = "skipped: explain queue full"
+
+    def _explain_loop(self):
+        self._local.explaining = True
+        while True:
+            engine, statement, parameters, entry, key = self._explain_queue.get()
+            # 큐에 같은 쿼리가 여러 번 들어왔으면 앞에서 뜬 plan 을 (만료 전이면) 그대로 쓴다
+            entry["explain"] = self._plans.get_or_load(key, lambda: self._explain(engine, statement, parameters))
+
+    def _explain(self, engine: Engine, statement, parameters):
+        prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+        try:
+            with engine.connect() as conn:
+                result = conn.exec_driver_sql(prefix + statement, parameters)
+                columns = list(result.keys())
+                return [dict(zip(columns, row)) for row in result.fetchall()]
+        except Exception as e:
+            return f"explain failed: {e}"
+
+    def snapshot(self, limit: int = 100) -> List[dict]:
+        with self._lock:
+            entries = list(self.entries)[-limit:]
+        return [dict(entry) for entry in reversed(entries)]
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+        self._plans.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+class QueryRouteMiddleware:
+    """느린 쿼리가 어느 요청에서 나왔는지 기록하도록 현재 요청을 컨텍스트에 둔다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = current_route.set(f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_route.reset(token)
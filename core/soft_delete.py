@@ -0,0 +1,44 @@
+from sqlalchemy import Column, DateTime, event
+from sqlalchemy.orm import Session, with_loader_criteria
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# true 이면 삭제 API가 row를 즉시 지우지 않고 deleted_at만 기록한다.
+# 실제 삭제(하위 row 포함)는 백그라운드 purger가 배치 단위로 처리한다.
+SOFT_DELETE_ENABLED = os.getenv("SOFT_DELETE", "false").lower() in ("1", "true", "yes")
+
+
+class SoftDeleteMixin:
+    deleted_at = Column(DateTime, nullable=True, index=True)
+
+    @classmethod
+    def visible_criteria(cls):
+        """
+        조회 시 노출 가능한 row 조건. 부모를 soft delete 할 때 하위 row 에도 같은 deleted_at 을 기록하므로
+        부모 테이블을 보는 서브쿼리 없이 row 자신의 (인덱스가 있는) deleted_at 만 본다.
+        """
+        return cls.deleted_at.is_(None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _filter_soft_deleted(orm_execute_state):
+    """
+    모든 ORM SELECT에 삭제 대기(deleted_at) row 제외 조건을 붙인다.
+    purger처럼 삭제된 row를 직접 다뤄야 하는 경우 include_deleted=True 옵션으로 우회한다.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.execution_options.get("include_deleted", False)
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.visible_criteria(),
+                include_aliases=True,
+                track_closure_variables=False,
+            )
+        )
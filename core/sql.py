@@ -0,0 +1,107 @@
+from dataclasses import make_dataclass
+from typing import Dict, List, Optional, Sequence, Union
+from sqlalchemy import Table, insert, select
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.orm import Session
+
+
+def upsert_increment(
+    connection: Connection,
+    table: Table,
+    key_columns: Sequence[str],
+    counter_column: Union[str, Sequence[str]],
+    rows: List[Dict],
+    replace_columns: Sequence[str] = (),
+):
+    """
+    키가 없으면 INSERT, 있으면 counter_column += 새 값 으로 한 번에 반영한다 (음수로 감소도 가능).
+    counter_column 에 컬럼 이름 목록을 주면 모두 같은 방식으로 더한다.
+    replace_columns 는 충돌 시 새 값으로 덮어쓸 컬럼이다.
+    MySQL은 ON DUPLICATE KEY UPDATE, PostgreSQL/SQLite는 ON CONFLICT DO UPDATE를 쓴다.
+    """
+    if not rows:
+        return
+    counters = [counter_column] if isinstance(counter_column, str) else list(counter_column)
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(table)
+        new = stmt.inserted
+        values = {column: table.c[column] + new[column] for column in counters}
+        values.update({column: new[column] for column in replace_columns})
+        stmt = stmt.on_duplicate_key_update(values)
+    elif dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table)
+        new = stmt.excluded
+        values = {column: table.c[column] + new[column] for column in counters}
+        values.update({column: new[column] for column in replace_columns})
+        stmt = stmt.on_conflict_do_update(index_elements=list(key_columns), set_=values)
+    else:
+        raise NotImplementedError(f"upsert is not supported for dialect {dialect}")
+    connection.execute(stmt, rows)
+
+
+def row_class(name: str, columns: Sequence, extra: Sequence[str] = ()) -> type:
+    """
+    select(*columns) 결과 Row 를 담는 __slots__ dataclass.
+    Row 는 속성 접근이 느려서 응답 직렬화(from_attributes)가 ORM 인스턴스보다 오래 걸리므로,
+    위치로 바로 채우는 작은 객체로 옮겨 담는다. 뒤쪽 추가 컬럼(정렬용 점수 등)은 버린다.
+    extra 는 Row 에 없는 필드(나중에 채우는 하위 목록 등)로 기본값 None.
+    """
+    size = len(columns)
+    fields = [column.key for column in columns] + [(field, object, None) for field in extra]
+
+    def of(cls, row):
+        return cls(*row[:size])
+
+    return make_dataclass(name, fields, slots=True, namespace={"of": classmethod(of)})
+
+
+# 세션을 거치는 set-based DML. ORM 객체 동기화 없이 실행하되 읽기 라우팅용 쓰기 표시(do_orm_execute)는 받는다.
+DML_OPTIONS = {"synchronize_session": False}
+
+
+def insert_returning_id(db: Session, stmt, pk) -> Optional[int]:
+    """
+    INSERT (… SELECT) 한 문장으로 새 pk 를 얻는다. SELECT 조건에 걸려 들어간 row 가 없으면 None.
+    RETURNING 을 지원하면 그대로 받고, 아니면(MySQL) lastrowid 를 쓴다.
+    """
+    if db.get_bind().dialect.insert_returning:
+        return db.execute(stmt.returning(pk).execution_options(**DML_OPTIONS)).scalar()
+    result = db.execute(stmt.execution_options(**DML_OPTIONS))
+    return result.lastrowid if result.rowcount else None
+
+
+def insert_many_returning_ids(db: Session, model, pk, rows: List[Dict]) -> List[int]:
+    """
+    여러 row 를 넣고 입력 순서대로 새 pk 를 돌려준다. executemany RETURNING 을 지원하면 배치로,
+    아니면(MySQL) row 마다 lastrowid 를 받는다 (innodb_autoinc_lock_mode=2 에서는 연속 id 가 보장되지 않음).
+    """
+    if not rows:
+        return []
+    if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        stmt = insert(model).returning(pk, sort_by_parameter_order=True)
+        return list(db.execute(stmt.execution_options(**DML_OPTIONS), rows).scalars())
+    stmt = insert(model).execution_options(**DML_OPTIONS)
+    return [db.execute(stmt.values(row)).lastrowid for row in rows]
+
+
+def update_returning(db: Session, stmt, *columns) -> Optional[Row]:
+    """
+    UPDATE … WHERE 한 문장으로 존재/권한 확인과 수정을 같이 한다. 바뀐 row 가 없으면 None.
+    RETURNING 이 없는 DB(MySQL)는 같은 WHERE 로 columns 를 한 번 더 읽는다 (잠긴 row 의 pk 조회).
+    """
+    if db.get_bind().dialect.update_returning:
+        return db.execute(stmt.returning(*columns).execution_options(**DML_OPTIONS)).first()
+    if not db.execute(stmt.execution_options(**DML_OPTIONS)).rowcount:
+        return None
+    return db.execute(select(*columns).where(stmt.whereclause)).first()
+
+
+def row_exists(db: Session, pk, value) -> bool:
+    """조건부 쓰기가 실패했을 때 404 와 403 을 가르기 위한 확인 (실패 경로에서만 부른다)"""
+    return db.execute(select(pk).where(pk == value)).first() is not None
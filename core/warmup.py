@@ -0,0 +1,49 @@
+import asyncio
+import logging
+import os
+from typing import Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+WARMUP_RETRY_SECONDS = float(os.getenv("WARMUP_RETRY_SECONDS", "5"))
+
+_ready = False
+
+
+def is_ready() -> bool:
+    return _ready
+
+
+def warm_pool(engine, connections: int = None):
+    """풀 크기만큼 커넥션을 미리 열었다가 반납해 첫 요청의 connect 비용을 없앱니다."""
+    if connections is None:
+        connections = engine.pool.size()
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+
+
+async def run_warmup(steps: List[Tuple[str, Callable[[], None]]]):
+    """
+    warm-up 단계를 순서대로 실행하고, 모두 성공하면 readiness를 켭니다.
+    실패한 단계는 WARMUP_RETRY_SECONDS 간격으로 성공할 때까지 다시 시도합니다.
+    """
+    global _ready
+    pending = list(steps)
+    while pending:
+        failed = []
+        for name, step in pending:
+            try:
+                await asyncio.to_thread(step)
+                logger.info("warm-up step %s done", name)
+            except Exception:
+                logger.exception("warm-up step %s failed", name)
+                failed.append((name, step))
+        pending = failed
+        if pending:
+            await asyncio.sleep(WARMUP_RETRY_SECONDS)
+    _ready = True
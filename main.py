@@ -1,10 +1,94 @@
+import asyncio
+import os
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.routers import users, questions, answers, companies
+from api.routers import users, questions, answers, companies, admin, events
+from fastapi.responses import JSONResponse
+from core.admission import AdmissionMiddleware, admission, pool_saturated, pool_status
+from core.auth import get_clerk, prefetch_jwks
+from core.cache_bus import WEB_CONCURRENCY, cache_bus
+from core.changes import prune_tombstones
+from core.compression import CompressionMiddleware
+from core.log import UVICORN_LOG_CONFIG, RequestIdMiddleware, log_pipeline
+from core.profiling import ProfilingMiddleware
+from core.push_hub import push_hub
+from core.slow_query import QueryRouteMiddleware, slow_query_log
+from core.database import ReadYourWritesMiddleware, ReadSessionLocal, engine, replica_engine
+from core.purge import Purger
+from core.warmup import is_ready, run_warmup, warm_pool
+from app import cache_events
+from app.domain.company.service import catalog_service
+from app.domain.company.service.delete_service import purge_deleted_companies
+from app.domain.question.service import import_service, similarity_service, stat_service
+from app.domain.question.service.delete_service import purge_deleted_questions, purge_deleted_answers
 
-app = FastAPI(title="면기연 API", description="면접 기업 연구 플랫폼 API", version="1.0.0")
+# 로그는 큐에 넣기만 하고 별도 스레드가 출력한다 (요청 처리 중 stdout/stderr 잠금을 기다리지 않음)
+log_pipeline.setup()
 
+def warm_similarity_index():
+    db = ReadSessionLocal()
+    try:
+        similarity_service.get_index(db)
+    finally:
+        db.close()
+
+def warm_catalog():
+    catalog_service.get_companies_by_id()
+    catalog_service.get_positions()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 첫 요청이 느리지 않도록 커넥션 풀, Clerk 클라이언트, JWKS, 카탈로그 캐시를 미리 준비 (/ready 에 반영)
+    warm_up_steps = [
+        ("clerk", get_clerk),
+        ("jwks", prefetch_jwks),
+        ("primary_pool", lambda: warm_pool(engine)),
+        ("catalog", warm_catalog),
+        ("similarity_index", warm_similarity_index),
+    ]
+    if replica_engine is not engine:
+        warm_up_steps.append(("replica_pool", lambda: warm_pool(replica_engine)))
+    warmup = asyncio.create_task(run_warmup(warm_up_steps))
+
+    # soft delete 된 row를 배치 단위로 정리 (상위 엔티티부터 처리해 하위 row를 한 번에 정리)
+    # 보관 기간이 지난 since 동기화용 tombstone 도 함께 정리
+    purger = Purger([purge_deleted_companies, purge_deleted_questions, purge_deleted_answers, prune_tombstones])
+    purger.start()
+    # 다른 워커의 쓰기로 인한 캐시 무효화 이벤트 수신
+    cache_bus.start()
+    push_hub.bind(asyncio.get_running_loop())
+    # 조회수/답변 수 증가분을 주기적으로 question_stat 에 반영 (종료 시 남은 증가분도 반영)
+    stat_service.flusher.start()
+    yield
+    # 열린 SSE/WebSocket 스트림을 끝내야 종료가 기다리지 않는다
+    push_hub.close()
+    cache_bus.stop()
+    await purger.stop()
+    await stat_service.flusher.stop()
+    warmup.cancel()
+    import_service.shutdown_pool()
+    log_pipeline.shutdown()
+
+cache_events.register(cache_bus)
+
+# 임계값(SLOW_QUERY_MS)을 넘는 쿼리를 EXPLAIN과 함께 기록 (/admin/slow-queries)
+slow_query_log.install(engine)
+if replica_engine is not engine:
+    slow_query_log.install(replica_engine)
+
+app = FastAPI(title="면기연 API", description="면접 기업 연구 플랫폼 API", version="1.0.0", lifespan=lifespan)
+
+# 나중에 추가한 미들웨어가 바깥쪽에서 실행된다 (503 응답에도 CORS 헤더가 붙도록 CORS를 가장 바깥에 둔다)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(QueryRouteMiddleware)
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(CompressionMiddleware)
+# 프로파일링은 압축/대기열 대기 시간까지 포함하도록 그 바깥에 둔다
+app.add_middleware(ProfilingMiddleware)
+# 요청 id 는 다른 미들웨어가 남기는 로그에도 붙도록 CORS 바로 안쪽에 둔다
+app.add_middleware(RequestIdMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -16,6 +100,8 @@ app.include_router(users.router)
 app.include_router(questions.router)
 app.include_router(answers.router)
 app.include_router(companies.router)
+app.include_router(admin.router)
+app.include_router(events.router)
 
 @app.get("/")
 async def root():
@@ -25,5 +111,44 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    """warm-up이 끝나지 않았거나 DB 풀/대기열이 포화 상태면 503을 돌려 LB가 다른 워커로 보내게 합니다."""
+    content = {
+        "pool": pool_status(engine),
+        "admission": admission.snapshot(),
+    }
+    if not is_ready():
+        return JSONResponse(status_code=503, content={"status": "warming_up", **content})
+    if pool_saturated(engine) or admission.overloaded():
+        return JSONResponse(status_code=503, content={"status": "overloaded", **content})
+    return {"status": "ready", **content}
+
+def _run_options() -> dict:
+    """uvloop/httptools가 있으면 쓰고, 없는 환경(Windows 등)에서는 uvicorn 기본값으로 둔다."""
+    options = {"loop": "auto", "http": "auto"}
+    try:
+        import uvloop  # noqa: F401
+        options["loop"] = "uvloop"
+    except ImportError:
+        pass
+    try:
+        import httptools  # noqa: F401
+        options["http"] = "httptools"
+    except ImportError:
+        pass
+    return options
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # WEB_CONCURRENCY > 1 이면 워커 프로세스를 여러 개 띄운다 (이 경우 앱을 import 문자열로 넘겨야 한다).
+    # 워커 간 (그리고 manage.py 같은 다른 프로세스에서 온) 캐시 무효화는 CACHE_BUS_BACKEND(기본 database) 로 전파된다.
+    uvicorn.run(
+        "main:app" if WEB_CONCURRENCY > 1 else app,
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        workers=WEB_CONCURRENCY,
+        # uvicorn 접근/오류 로그도 큐를 거쳐 출력 스레드가 쓴다
+        log_config=UVICORN_LOG_CONFIG,
+        **_run_options(),
+    )
\ No newline at end of file
@@ -0,0 +1,346 @@
+"""
+운영용 커맨드 모음.
+
+    python manage.py <command> [options]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# 서버 import 시점에 로드되면 안 되는 (첫 사용 시 lazy import 하는) 무거운 모듈
+LAZY_MODULES = ("clerk_backend_api", "openpyxl", "charset_normalizer")
+
+
+def profile_imports(args):
+    """
+    `python -X importtime` 으로 서버 모듈 import 비용을 측정합니다.
+    누적 시간이 큰 모듈을 출력하고, 예산 초과 또는 lazy 모듈이 로드되면 실패합니다.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {args.module}"],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_part, cumulative_us, name = line.split("|", 2)
+        timings.append((int(cumulative_us), int(self_part.split(":")[1]), name.rstrip()))
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        return result.returncode
+
+    total_us = next((c for c, _, name in timings if name.strip() == args.module), 0)
+    print(f"{'cumulative(ms)':>15} {'self(ms)':>10}  module")
+    for cumulative_us, self_us, name in sorted(timings, reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:15.1f} {self_us / 1000:10.1f}  {name}")
+    print(f"\ntotal import time of {args.module}: {total_us / 1000:.1f} ms")
+
+    failed = False
+    loaded = {name.strip() for _, _, name in timings}
+    for module in LAZY_MODULES:
+        if module in loaded:
+            print(f"FAIL: {module} is imported at startup, it must be imported lazily")
+            failed = True
+    if args.budget_ms and total_us / 1000 > args.budget_ms:
+        print(f"FAIL: import time exceeds budget of {args.budget_ms} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+def rebuild_question_signatures(args):
+    """시그니처가 없는 기존 질문의 중복 탐지용 MinHash 시그니처를 계산해 저장합니다."""
+    from core.database import SessionLocal
+    from app.domain.question.service import dedup_service
+
+    db = SessionLocal()
+    try:
+        total = dedup_service.rebuild_signatures(db, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+    print(f"signatures computed: {total}")
+    return 0
+
+
+def duplicate_report(args):
+    """기존 질문 전체의 near-duplicate 묶음을 출력합니다."""
+    from core.database import SessionLocal
+    from app.domain.question.service import dedup_service
+
+    db = SessionLocal()
+    try:
+        groups = dedup_service.duplicate_report(db, threshold=args.threshold, limit=args.limit)
+    finally:
+        db.close()
+    for group in groups:
+        print(f"[{len(group['question_ids'])}] {group['question_ids']}")
+        for text in group["questions"]:
+            print(f"    - {text}")
+    print(f"duplicate groups: {len(groups)}")
+    return 0
+
+
+def rebuild_similar_questions(args):
+    """전체 질문의 유사 질문 top-k를 다시 계산해 question_similarity 테이블을 채웁니다."""
+    from core.database import SessionLocal
+    from app.domain.question.service import similarity_service
+
+    db = SessionLocal()
+    try:
+        total = similarity_service.rebuild_table(db, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+    print(f"questions processed: {total}")
+    return 0
+
+
+def tag_positions(args):
+    """직무 키워드를 바꾼 뒤 전체 질문/채용공고의 직무 태그를 다시 매깁니다."""
+    from core.database import SessionLocal
+    from app.domain.company.service import position_keyword_service
+
+    db = SessionLocal()
+    try:
+        counts = position_keyword_service.retag_all(db, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+    for table, total in counts.items():
+        print(f"{table}: {total}")
+    return 0
+
+
+def rebuild_tech_stack_stats(args):
+    """기술스택 카운터 테이블을 현재 tech_stack 전체로 다시 채웁니다."""
+    from core.database import SessionLocal
+    from app.domain.company.service import tech_stack_service
+
+    db = SessionLocal()
+    try:
+        total = tech_stack_service.rebuild(db)
+        db.commit()
+    finally:
+        db.close()
+    print(f"tech stacks counted: {total}")
+    return 0
+
+
+def backfill(args):
+    """
+    등록된 데이터 backfill 을 API 가 떠 있는 상태에서 chunk 단위로 실행합니다 (중단 후 다시 실행하면 이어서 처리).
+    이름 없이 실행하면 등록된 backfill 과 checkpoint 상태를 출력합니다.
+    """
+    from core.backfill import BACKFILLS, checkpoints, run_backfill
+    from core.database import SessionLocal
+    from app import backfills  # noqa: F401  (register)
+
+    if not args.name:
+        db = SessionLocal()
+        try:
+            states = {checkpoint.name: checkpoint for checkpoint in checkpoints(db)}
+        finally:
+            db.close()
+        print(f"{'name':<24} {'status':<8} {'processed':>10} {'total':>10}  description")
+        for name, registered in BACKFILLS.items():
+            state = states.get(name)
+            status = state.status if state else "-"
+            processed = state.processed if state else 0
+            total = state.total_estimate if state and state.total_estimate is not None else "-"
+            print(f"{name:<24} {status:<8} {processed:>10} {total:>10}  {registered.description}")
+            if state and state.error:
+                print(f"{'':<24} error: {state.error}")
+        return 0
+
+    if args.name not in BACKFILLS:
+        print(f"unknown backfill: {args.name} (available: {', '.join(BACKFILLS)})", file=sys.stderr)
+        return 2
+
+    def report(progress):
+        total = f"/{progress.total_estimate}" if progress.total_estimate is not None else ""
+        eta = f", eta {progress.eta_seconds:.0f}s" if progress.eta_seconds is not None else ""
+        print(f"{progress.name}: {progress.processed}{total} rows, chunk {progress.chunks} "
+              f"(size {progress.chunk_size}), {progress.rows_per_sec:.0f} rows/s{eta}", flush=True)
+
+    try:
+        # 지정하지 않은 옵션은 BACKFILL_* 환경변수 기본값을 쓴다
+        tuning = {
+            key: getattr(args, key)
+            for key in ("chunk_size", "max_chunk_size", "target_seconds", "pause_ratio")
+            if getattr(args, key) is not None
+        }
+        progress = run_backfill(
+            SessionLocal, BACKFILLS[args.name],
+            max_chunks=args.max_chunks, max_seconds=args.max_seconds,
+            restart=args.restart, on_progress=report, **tuning,
+        )
+    except KeyboardInterrupt:
+        print(f"{args.name}: interrupted, run again to resume from the last committed chunk")
+        return 130
+    print(f"{args.name}: {'done' if progress.done else 'paused'}, {progress.processed} rows processed")
+    return 0
+
+
+def bench_list_queries(args):
+    """목록 API 읽기 경로를 ORM 인스턴스 방식과 컬럼 select() Row 방식으로 비교합니다."""
+    from core.database import ReadSessionLocal
+    from app import list_benchmark
+
+    results = list_benchmark.run(ReadSessionLocal, pages=args.pages, size=args.size, repeat=args.repeat)
+    print(f"{'list':<18} {'path':<5} {'pages':>6} {'rows':>7} {'rows/s':>9} {'peak KiB/page':>14}")
+    for row in results:
+        print(f"{row['list']:<18} {row['path']:<5} {row['pages']:>6} {row['rows']:>7} {row['rows_per_sec']:>9} {row['peak_kib_per_page']:>14}")
+    return 0
+
+
+def load_test(args):
+    """
+    OpenAPI 스펙에서 만든 요청으로 가중치 트래픽 믹스를 재생하고 route 별 처리량과 p50/p95/p99 를 출력합니다.
+    --slo 기준을 하나라도 어기면 종료 코드 1 로 실패합니다.
+    """
+    import asyncio
+    import json
+    if args.database_url:
+        # core.database 가 import 시점에 엔진을 만들므로 앱 import 전에 설정
+        os.environ["DATABASE_URL"] = args.database_url
+    from core.database import DATABASE_URL, engine
+    from core.load_harness import SLO, LoadRunner, LocalServer, check_slos, in_process_client, load_mix
+    import httpx
+    from main import app
+    from app import loadtest
+
+    try:
+        slos = [SLO.parse(text) for text in args.slo]
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    if args.seed:
+        if not loadtest.is_local_database(DATABASE_URL) and not args.allow_remote_seed:
+            print("refusing to seed a non-local database (use --allow-remote-seed)", file=sys.stderr)
+            return 2
+        volumes = loadtest.SeedVolumes(
+            users=args.users,
+            companies=args.companies,
+            questions_per_company=args.questions_per_company,
+            answers_per_question=args.answers_per_question,
+            postings_per_company=args.postings_per_company,
+        )
+        counts = loadtest.seed_database(engine, volumes, seed=args.random_seed)
+        print("seeded: " + ", ".join(f"{table}={n}" for table, n in counts.items()))
+
+    mix = load_mix(args.mix) if args.mix else loadtest.DEFAULT_MIX
+    runner = LoadRunner(app.openapi(), mix, loadtest.load_pools(engine), seed=args.random_seed)
+    problems = runner.validate()
+    if problems:
+        for problem in problems:
+            print(f"invalid mix: {problem}", file=sys.stderr)
+        return 2
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else None
+    if not args.url:
+        loadtest.install_auth_stub(app)
+
+    async def replay(client):
+        async with client:
+            return await runner.run(client, concurrency=args.concurrency, requests=args.requests,
+                                    duration=args.duration, headers=headers)
+
+    if args.url:
+        report = asyncio.run(replay(httpx.AsyncClient(base_url=args.url, timeout=60)))
+    elif args.mode == "uvicorn":
+        with LocalServer(app, port=args.port) as server:
+            report = asyncio.run(replay(httpx.AsyncClient(base_url=server.url, timeout=60)))
+    else:
+        report = asyncio.run(replay(in_process_client(app)))
+
+    print(report.format())
+    summary = report.summary()
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    violations = check_slos(summary, slos)
+    for violation in violations:
+        print(f"FAIL: SLO {violation}")
+    return 1 if violations else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="면기연 API 운영 커맨드")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_imports = subparsers.add_parser("profile-imports", help="서버 import 시간 측정")
+    parser_imports.add_argument("--module", default="main")
+    parser_imports.add_argument("--top", type=int, default=25)
+    parser_imports.add_argument("--budget-ms", type=float, default=None)
+    parser_imports.set_defaults(handler=profile_imports)
+
+    parser_signatures = subparsers.add_parser("rebuild-question-signatures", help="질문 중복 탐지 시그니처 backfill")
+    parser_signatures.add_argument("--chunk-size", type=int, default=1000)
+    parser_signatures.set_defaults(handler=rebuild_question_signatures)
+
+    parser_duplicates = subparsers.add_parser("duplicate-report", help="중복 질문 리포트")
+    parser_duplicates.add_argument("--threshold", type=float, default=0.8)
+    parser_duplicates.add_argument("--limit", type=int, default=100)
+    parser_duplicates.set_defaults(handler=duplicate_report)
+
+    parser_similar = subparsers.add_parser("rebuild-similar-questions", help="유사 질문 top-k 전체 재계산")
+    parser_similar.add_argument("--chunk-size", type=int, default=500)
+    parser_similar.set_defaults(handler=rebuild_similar_questions)
+
+    parser_positions = subparsers.add_parser("tag-positions", help="질문/채용공고 직무 태그 전체 재계산")
+    parser_positions.add_argument("--chunk-size", type=int, default=500)
+    parser_positions.set_defaults(handler=tag_positions)
+
+    parser_tech = subparsers.add_parser("rebuild-tech-stack-stats", help="기술스택 카운터 전체 재계산")
+    parser_tech.set_defaults(handler=rebuild_tech_stack_stats)
+
+    parser_backfill = subparsers.add_parser("backfill", help="온라인 데이터 backfill 실행/상태 조회")
+    parser_backfill.add_argument("name", nargs="?", default=None, help="생략하면 등록된 backfill 과 상태 출력")
+    parser_backfill.add_argument("--chunk-size", type=int, default=None, help="시작 chunk 크기 (기본값: BACKFILL_CHUNK_SIZE)")
+    parser_backfill.add_argument("--max-chunk-size", type=int, default=None)
+    parser_backfill.add_argument("--target-seconds", type=float, default=None, help="chunk 하나의 목표 처리 시간")
+    parser_backfill.add_argument("--pause-ratio", type=float, default=None, help="chunk 사이 휴식 = 처리 시간 x 비율")
+    parser_backfill.add_argument("--max-chunks", type=int, default=None, help="이만큼 처리하고 멈춘다 (다음 실행에서 이어서)")
+    parser_backfill.add_argument("--max-seconds", type=float, default=None)
+    parser_backfill.add_argument("--restart", action="store_true", help="checkpoint 를 지우고 처음부터")
+    parser_backfill.set_defaults(handler=backfill)
+
+    parser_bench = subparsers.add_parser("bench-list-queries", help="목록 조회 ORM vs Core select 벤치마크")
+    parser_bench.add_argument("--pages", type=int, default=20)
+    parser_bench.add_argument("--size", type=int, default=100)
+    parser_bench.add_argument("--repeat", type=int, default=3)
+    parser_bench.set_defaults(handler=bench_list_queries)
+
+    parser_load = subparsers.add_parser("load-test", help="OpenAPI 기반 트래픽 재생 부하 테스트")
+    parser_load.add_argument("--database-url", default=None, help="기본값: DATABASE_URL 환경변수")
+    parser_load.add_argument("--seed", action="store_true", help="재생 전에 시드 데이터 추가 (로컬 DB만)")
+    parser_load.add_argument("--allow-remote-seed", action="store_true")
+    parser_load.add_argument("--users", type=int, default=50)
+    parser_load.add_argument("--companies", type=int, default=300)
+    parser_load.add_argument("--questions-per-company", type=int, default=30)
+    parser_load.add_argument("--answers-per-question", type=int, default=2)
+    parser_load.add_argument("--postings-per-company", type=int, default=3)
+    parser_load.add_argument("--mode", choices=["inprocess", "uvicorn"], default="inprocess")
+    parser_load.add_argument("--port", type=int, default=8765)
+    parser_load.add_argument("--url", default=None, help="이미 떠 있는 서버로 보낼 때 (인증 스텁 대신 --token 사용)")
+    parser_load.add_argument("--token", default=None)
+    parser_load.add_argument("--mix", default=None, help="트래픽 믹스 JSON 파일")
+    parser_load.add_argument("--concurrency", type=int, default=16)
+    parser_load.add_argument("--requests", type=int, default=2000)
+    parser_load.add_argument("--duration", type=float, default=None, help="초 단위, 지정하면 --requests 대신 시간으로 끝낸다")
+    parser_load.add_argument("--random-seed", type=int, default=0)
+    parser_load.add_argument("--slo", action="append", default=[], help='예: "p99<500", "GET /questions:p95<200", "error_rate<0.01"')
+    parser_load.add_argument("--report", default=None, help="route 별 요약 JSON 저장 경로")
+    parser_load.set_defaults(handler=load_test)
+
+    args = parser.parse_args()
+    if getattr(args, "duration", None):
+        args.requests = None
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+테스트는 로컬 SQLite 두 개(primary, replica)로 앱 전체를 띄운다.
+core.database 가 import 시점에 엔진을 만들므로 환경변수를 앱 import 전에 설정한다.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+_DB_DIR = tempfile.mkdtemp(prefix="interviewq-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/primary.db"
+os.environ["DATABASE_REPLICA_URL"] = f"sqlite:///{_DB_DIR}/replica.db"
+os.environ.setdefault("CLERK_SECRET_KEY", "sk_test_dummy")
+os.environ.setdefault("CACHE_BUS_BACKEND", "local")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import pytest
+from sqlalchemy import BigInteger, event
+from sqlalchemy.ext.compiler import compiles
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite 는 INTEGER PRIMARY KEY 만 rowid 자동 증가가 된다
+    return "INTEGER"
+
+
+import main  # noqa: E402
+from core.auth import get_current_user  # noqa: E402
+from core.database import Base, SessionLocal, engine, replica_engine  # noqa: E402
+import core.backfill  # noqa: E402,F401  (backfill_checkpoint)
+import app.domain.company.model.company_analyze  # noqa: E402,F401
+import app.domain.company.model.company_job_posting  # noqa: E402,F401
+import app.domain.company.model.keywords_by_position  # noqa: E402,F401
+import app.domain.company.model.tech_stack  # noqa: E402,F401
+import app.domain.user.model.goal_company  # noqa: E402,F401
+import app.domain.user.model.user_position  # noqa: E402,F401
+from app.domain.user.model.user import User  # noqa: E402
+
+ADMIN = User(user_id=1, nickname="admin", email="admin@example.com", role="admin", is_onboarding=False)
+
+
+@pytest.fixture(scope="session")
+def app():
+    for bound in {engine, replica_engine}:
+        Base.metadata.create_all(bound)
+    db = SessionLocal()
+    db.merge(User(user_id=1, nickname="admin", email="admin@example.com", role="admin", is_onboarding=False))
+    db.commit()
+    db.close()
+    # 인증은 DB 조회 없이 고정 사용자로 (문장 수 측정에 섞이지 않도록)
+    main.app.dependency_overrides[get_current_user] = lambda: ADMIN
+    yield main.app
+    main.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(app):
+    from fastapi.testclient import TestClient
+    return TestClient(app)
+
+
+@pytest.fixture
+def statements():
+    """primary 엔진에서 실행된 SQL 을 모은다. with statements.capture(): … 구간만 기록."""
+    class Recorder:
+        def __init__(self):
+            self.sql = []
+            self._on = False
+
+        def _listen(self, conn, cursor, statement, parameters, context, executemany):
+            if self._on:
+                self.sql.append(statement)
+
+        @contextmanager
+        def capture(self):
+            self.sql = []
+            self._on = True
+            try:
+                yield self
+            finally:
+                self._on = False
+
+    recorder = Recorder()
+    event.listen(engine, "before_cursor_execute", recorder._listen)
+    yield recorder
+    event.remove(engine, "before_cursor_execute", recorder._listen)
@@ -0,0 +1,44 @@
+"""라우트 그룹별 동시성 제한 (user-030). question_list 가 가득 차면 대기열 밖의 요청은 바로 503 을 받는다."""
+import asyncio
+from dataclasses import replace
+import httpx
+from core.admission import DEFAULT_ROUTE_GROUPS, RETRY_AFTER_SECONDS, AdmissionControl, AdmissionMiddleware
+
+
+def test_saturated_question_list_rejects_with_retry_after():
+    groups = [
+        replace(group, max_concurrency=1, max_queue=1, queue_timeout=5.0) if group.name == "question_list" else group
+        for group in DEFAULT_ROUTE_GROUPS
+    ]
+    control = AdmissionControl(groups)
+    limiter = control.limiters["question_list"]
+
+    async def run():
+        gate = asyncio.Event()
+
+        async def slow_app(scope, receive, send):
+            await gate.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"{}"})
+
+        transport = httpx.ASGITransport(app=AdmissionMiddleware(slow_app, control))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            running = asyncio.create_task(client.get("/questions"))
+            queued = asyncio.create_task(client.get("/questions"))
+            while limiter.active < 1 or limiter.waiting < 1:
+                await asyncio.sleep(0.01)
+
+            rejected = await client.get("/questions")
+            snapshot = limiter.snapshot()
+            gate.set()
+            return rejected, snapshot, await running, await queued
+
+    rejected, snapshot, running, queued = asyncio.run(run())
+
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == str(RETRY_AFTER_SECONDS)
+    assert "question_list" in rejected.json()["detail"]
+    assert snapshot == {"active": 1, "max_concurrency": 1, "waiting": 1, "max_queue": 1, "rejected": 1}
+    # 자리를 잡은 요청과 대기열의 요청은 모두 처리된다
+    assert running.status_code == 200 and queued.status_code == 200
+    assert limiter.snapshot()["active"] == 0
@@ -0,0 +1,103 @@
+"""워커 간 캐시 무효화 전파 (user-041). MemoryBroker 하나를 공유하는 CacheBus 두 개를 워커 두 개로 본다."""
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, insert, select
+from core import cache_bus
+from core.cache_bus import CacheBus, CacheEvent, DatabaseBackend, MemoryBroker
+
+
+def _worker(broker: MemoryBroker):
+    bus = CacheBus(broker.backend())
+    calls = {"all": [], "remote_only": []}
+    bus.subscribe("questions", calls["all"].append)
+    bus.subscribe("questions", calls["remote_only"].append, remote_only=True)
+    bus.start()
+    return bus, calls
+
+
+def test_publish_reaches_other_worker():
+    broker = MemoryBroker()
+    first, first_calls = _worker(broker)
+    second, second_calls = _worker(broker)
+
+    first.publish("questions", question_ids=[1, 2])
+
+    # 보낸 워커: 일반 핸들러만 한 번 (자기 이벤트가 브로커를 돌아와도 다시 실행하지 않는다)
+    assert first_calls == {"all": [{"question_ids": [1, 2]}], "remote_only": []}
+    # 다른 워커: remote_only 핸들러까지 실행
+    assert second_calls == {"all": [{"question_ids": [1, 2]}], "remote_only": [{"question_ids": [1, 2]}]}
+    assert broker.sent == [(first.origin, "questions", {"question_ids": [1, 2]})]
+
+
+def test_stopped_worker_misses_events():
+    broker = MemoryBroker()
+    first, _ = _worker(broker)
+    second, second_calls = _worker(broker)
+
+    first.publish("questions", question_ids=[1])
+    assert second_calls["all"] == [{"question_ids": [1]}]
+
+    second.stop()
+    first.publish("questions", question_ids=[3])
+    assert len(second_calls["all"]) == 1
+
+
+def test_failing_handler_does_not_block_others():
+    broker = MemoryBroker()
+    first, _ = _worker(broker)
+    second = CacheBus(broker.backend())
+    received = []
+
+    def broken(payload):
+        raise RuntimeError("handler failed")
+
+    second.subscribe("questions", broken)
+    second.subscribe("questions", received.append)
+    second.start()
+
+    first.publish("questions", question_ids=[4])
+    assert received == [{"question_ids": [4]}]
+
+
+def _database_worker(engine):
+    backend = DatabaseBackend(engine)
+    bus = CacheBus(backend)
+    received = []
+    bus.subscribe("questions", received.append, remote_only=True)
+    return bus, backend, received
+
+
+def test_database_backend_between_two_workers(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/bus.db")
+    CacheEvent.__table__.create(engine)
+    first, first_backend, first_received = _database_worker(engine)
+    second, second_backend, second_received = _database_worker(engine)
+
+    first.publish("questions", question_ids=[1])
+    with engine.begin() as conn:
+        # 나중에 커밋된 이벤트가 더 작은 id 를 받는 경우를 흉내 낸다 (2 를 비워 두고 3 부터)
+        conn.execute(insert(CacheEvent).values(event_id=3, topic="questions", payload='{"question_ids": [3]}', origin="other", created_at=datetime.utcnow()))
+    second_backend._poll_once(second)
+    first_backend._poll_once(first)
+    assert second_received == [{"question_ids": [1]}, {"question_ids": [3]}]
+    assert first_received == [{"question_ids": [3]}]
+
+    with engine.begin() as conn:
+        conn.execute(insert(CacheEvent).values(event_id=2, topic="questions", payload='{"question_ids": [2]}', origin="other", created_at=datetime.utcnow()))
+    # 겹쳐 읽는 구간(POLL_OVERLAP)에서 늦게 들어온 2 만 새로 받고, 이미 본 1, 3 은 다시 실행하지 않는다
+    second_backend._poll_once(second)
+    assert second_received == [{"question_ids": [1]}, {"question_ids": [3]}, {"question_ids": [2]}]
+
+
+def test_database_backend_prunes_expired_events(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/bus.db")
+    CacheEvent.__table__.create(engine)
+    bus, backend, _ = _database_worker(engine)
+    expired = datetime.utcnow() - timedelta(seconds=cache_bus.CACHE_BUS_RETENTION_SECONDS + 60)
+    with engine.begin() as conn:
+        conn.execute(insert(CacheEvent).values(topic="questions", payload="{}", origin="other", created_at=expired))
+    bus.publish("questions", question_ids=[1])
+
+    backend._prune()
+    with engine.connect() as conn:
+        remaining = conn.execute(select(CacheEvent.payload)).scalars().all()
+    assert remaining == ['{"question_ids": [1]}']
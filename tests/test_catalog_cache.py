@@ -0,0 +1,37 @@
+"""카탈로그 캐시 (user-029). 무효화 전에 시작한 로드가 옛 목록을 다시 넣지 않고, 목록은 primary 에서 읽는다."""
+from fastapi.testclient import TestClient
+from core.cache import TTLCache
+from app.domain.company.service import catalog_service
+
+
+def test_load_finishing_after_invalidate_is_not_stored():
+    cache = TTLCache(ttl=60)
+
+    def stale_load():
+        # 로드 도중 다른 요청이 무효화한 경우
+        cache.invalidate("companies")
+        return "stale"
+
+    assert cache.get_or_load("companies", stale_load) == "stale"
+    assert cache.get("companies") is None
+    assert cache.get_or_load("companies", lambda: "fresh") == "fresh"
+    assert cache.get("companies") == "fresh"
+
+
+def test_clear_during_load_discards_value():
+    cache = TTLCache(ttl=60)
+
+    def load():
+        cache.clear()
+        return "stale"
+
+    cache.get_or_load("positions", load)
+    assert cache.get("positions") is None
+    assert not cache._loading and not cache._generations
+
+
+def test_catalog_reads_primary(app):
+    # 테스트의 replica 는 복제되지 않으므로 primary 에만 있는 회사가 보이면 primary 에서 읽은 것이다
+    company_id = TestClient(app).post("/companies", json={"company_name": "catalog-primary"}).json()["data"]
+    catalog_service.invalidate_companies()
+    assert catalog_service.get_companies_by_id()[company_id].company_name == "catalog-primary"
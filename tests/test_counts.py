@@ -0,0 +1,27 @@
+"""목록 total 의 exact=true 는 admin 만 (user-038). 그 외 호출자는 추정값 경로로 내려간다."""
+from api.depends import auth
+from core import counts
+from core.database import PRIMARY_PIN_HEADER
+from app.domain.user.model.user import User
+
+
+def _total_exact(client):
+    headers = {PRIMARY_PIN_HEADER: "1"}
+    companies = client.get("/companies", params={"name": "exact-count", "with_total": "true", "exact": "true"}, headers=headers)
+    questions = client.get("/questions", params={"search": "exact-count", "with_total": "true", "exact": "true"}, headers=headers)
+    return companies.json()["total_exact"], questions.json()["total_exact"]
+
+
+def test_exact_count_requires_admin(client, monkeypatch):
+    # 모든 테이블을 '큰 테이블'로 취급해 exact 가 아니면 추정값(total_exact=false)이 나오게 한다
+    monkeypatch.setattr(counts, "EXACT_COUNT_MAX_ROWS", -1)
+
+    # 토큰 없는 호출자는 회사/질문 목록 모두 추정값
+    assert _total_exact(client) == (False, False)
+
+    async def admin_token(credentials, db):
+        return User(user_id=1, nickname="admin", email="admin@example.com", role="admin")
+
+    # 두 목록 모두 같은 exact_count_allowed 로 판단한다
+    monkeypatch.setattr(auth, "get_optional_current_user", admin_token)
+    assert _total_exact(client) == (True, True)
@@ -0,0 +1,44 @@
+"""요청 프로파일 저장 (user-039). 저장은 이벤트 루프 밖에서, 다른 워커와 같은 디렉터리를 정리해도 실패하지 않는다."""
+import threading
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from core import profiling
+from core.profiling import ProfileStore, ProfilingMiddleware, SamplingProfiler
+
+
+def test_prune_tolerates_files_removed_by_another_worker(tmp_path, monkeypatch):
+    store = ProfileStore(str(tmp_path), max_files=1)
+    profiler = SamplingProfiler(threading.get_ident())
+    store.save({}, profiler)
+    # 다른 워커가 먼저 지운 파일이 목록에 남아 있는 경우
+    listed = store._files
+    monkeypatch.setattr(store, "_files", lambda: ["0-gone.json"] + listed())
+    store.save({}, profiler)
+    assert len(listed()) == 1
+
+
+def test_middleware_saves_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILE_SECRET", "secret")
+    store = ProfileStore(str(tmp_path))
+    saved_on = []
+    original = store.save
+
+    def save(*args, **kwargs):
+        saved_on.append(threading.current_thread().name)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(store, "save", save)
+    loop_thread = []
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        loop_thread.append(threading.current_thread().name)
+        return {}
+
+    app.add_middleware(ProfilingMiddleware, store=store)
+    response = TestClient(app).get("/ping", headers={"x-profile": "secret"})
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+    assert store.load(profile_id)["path"] == "/ping"
+    assert saved_on and saved_on[0] != loop_thread[0]
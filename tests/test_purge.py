@@ -0,0 +1,43 @@
+"""soft delete 된 질문의 purge 배치 (user-026). 복합키 조인 테이블도 batch_size 단위로 지운다."""
+from datetime import date, datetime
+from sqlalchemy import func, select
+from app.domain.company.model.company import Company
+from app.domain.company.model.position import Position
+from app.domain.question.model.question import Question, QuestionTag
+from app.domain.question.model.question_position import QuestionPosition
+from app.domain.question.service.delete_service import purge_deleted_questions
+from core.database import SessionLocal
+
+
+def _count(db, model, question_id) -> int:
+    return db.execute(
+        select(func.count()).select_from(model).where(model.question_id == question_id)
+        .execution_options(include_deleted=True)
+    ).scalar()
+
+
+def test_join_table_purged_in_batches(app):
+    db = SessionLocal()
+    company = Company(company_name="purge-batches")
+    positions = [Position(position_name=f"purge-{i}") for i in range(5)]
+    db.add_all([company, *positions])
+    db.flush()
+    question = Question(
+        registrant_id=1, company_id=company.company_id, question="삭제될 질문", category="기술",
+        tag=QuestionTag.TECHNOLOGY, question_at=date(2024, 1, 1), deleted_at=datetime.utcnow(),
+    )
+    db.add(question)
+    db.flush()
+    question_id = question.question_id
+    db.add_all([QuestionPosition(question_id=question_id, position_id=p.position_id) for p in positions])
+    db.commit()
+
+    # 배치 하나는 조인 테이블 row 두 개만 지운다
+    assert purge_deleted_questions(db, 2, 1) == 1
+    assert _count(db, QuestionPosition, question_id) == 3
+
+    while purge_deleted_questions(db, 2, 1):
+        pass
+    assert _count(db, QuestionPosition, question_id) == 0
+    assert _count(db, Question, question_id) == 0
+    db.close()
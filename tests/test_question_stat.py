@@ -0,0 +1,51 @@
+"""인기순 목록 (user-050). 조회/답변이 없는 새 질문과 기존 질문도 question_stat row 가 있어야 목록에 나온다."""
+from datetime import date
+import app.backfills  # noqa: F401  (backfill 등록)
+from app.domain.company.model.company import Company
+from app.domain.question.model.question import Question, QuestionTag
+from core.backfill import BACKFILLS, run_backfill
+from core.database import PRIMARY_PIN_HEADER, SessionLocal
+
+
+def _company(name: str) -> int:
+    db = SessionLocal()
+    company = Company(company_name=name)
+    db.add(company)
+    db.commit()
+    db.close()
+    return company.company_id
+
+
+def _popular_ids(client, company_name: str):
+    # 테스트 데이터는 primary 에만 있으므로 primary 에서 읽는다
+    response = client.get(
+        "/questions", params={"sort": "popular", "company_name": company_name, "size": 50},
+        headers={PRIMARY_PIN_HEADER: "1"},
+    )
+    assert response.status_code == 200
+    return [value["question_id"] for value in response.json()["values"]]
+
+
+def test_new_question_listed_as_popular(client):
+    company_id = _company("popular-new")
+    response = client.post("/questions/single", params={"on_duplicate": "allow"}, json={
+        "company_id": company_id, "question": "조회가 없는 새 질문", "category": "기술", "tag": "technology",
+    })
+    assert response.status_code == 200
+    assert len(_popular_ids(client, "popular-new")) == 1
+
+
+def test_backfill_creates_missing_stats(client):
+    company_id = _company("popular-existing")
+    db = SessionLocal()
+    question = Question(
+        registrant_id=1, company_id=company_id, question="stat row 가 없는 기존 질문", category="기술",
+        tag=QuestionTag.TECHNOLOGY, question_at=date(2024, 1, 1),
+    )
+    db.add(question)
+    db.commit()
+    db.close()
+    assert _popular_ids(client, "popular-existing") == []
+
+    run_backfill(SessionLocal, BACKFILLS["question_stats"], pause_ratio=0)
+    assert _popular_ids(client, "popular-existing") == [question.question_id]
@@ -0,0 +1,37 @@
+"""
+read-your-writes 라우팅 (user-028). 테스트의 replica 는 복제되지 않는 별도 SQLite 라서
+primary 에만 있는 row 가 보이는지로 어느 쪽에서 읽었는지 알 수 있다.
+"""
+from fastapi.testclient import TestClient
+from core.database import PRIMARY_PIN_COOKIE, PRIMARY_PIN_HEADER
+
+
+def test_writer_reads_primary_until_pin_expires(app):
+    writer = TestClient(app)
+    response = writer.post("/companies", json={"company_name": "read-your-writes"})
+    assert response.status_code == 200
+    assert PRIMARY_PIN_COOKIE in response.cookies
+    company_id = response.json()["data"]
+
+    # 쓰지 않은 클라이언트는 replica 에서 읽는다 (아직 복제되지 않음). overview 는 없는 회사를 캐시하지 않는다.
+    assert TestClient(app).get(f"/companies/{company_id}/overview").status_code == 404
+    # 쓴 클라이언트는 쿠키가 유효한 동안 primary 에서 읽는다
+    assert writer.get(f"/companies/{company_id}/overview").status_code == 200
+
+
+def test_pin_header_and_expired_cookie(app):
+    company_id = TestClient(app).post("/companies", json={"company_name": "read-pin-header"}).json()["data"]
+
+    expired = TestClient(app, cookies={PRIMARY_PIN_COOKIE: "1"})
+    assert expired.get(f"/companies/{company_id}/overview").status_code == 404
+    header = TestClient(app).get(f"/companies/{company_id}/overview", headers={PRIMARY_PIN_HEADER: "1"})
+    assert header.status_code == 200
+
+
+def test_failed_write_does_not_pin(app):
+    client = TestClient(app)
+    client.post("/companies", json={"company_name": "read-no-pin"})
+    # 같은 이름은 400 이고 커밋이 없으므로 쿠키를 새로 붙이지 않는다
+    response = TestClient(app).post("/companies", json={"company_name": "read-no-pin"})
+    assert response.status_code == 400
+    assert PRIMARY_PIN_COOKIE not in response.cookies
@@ -0,0 +1,31 @@
+"""느린 쿼리 EXPLAIN 캐시 (user-040). 만료된 plan 은 다시 뜨고, 캐시는 크기가 제한된다."""
+import time
+from sqlalchemy import create_engine
+from core.slow_query import SlowQueryLog
+
+
+def wait_for_explain(entry):
+    deadline = time.monotonic() + 5
+    while entry["explain"] is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return entry["explain"]
+
+
+def test_expired_plan_is_explained_again():
+    engine = create_engine("sqlite://")
+    log = SlowQueryLog()
+    statement = "SELECT 1"
+    entry = {"sql": statement, "explain": None}
+    log._plans.set(("sqlite", statement), "old plan", ttl=-1)
+
+    log._queue_explain(engine, statement, (), entry)
+    plan = wait_for_explain(entry)
+    assert isinstance(plan, list) and plan
+    assert log._plans.get(("sqlite", statement)) == plan
+
+
+def test_plan_cache_is_bounded():
+    log = SlowQueryLog()
+    for i in range(log._plans.maxsize + 10):
+        log._plans.get_or_load(("sqlite", f"SELECT {i}"), lambda: [])
+    assert len(log._plans) == log._plans.maxsize
@@ -0,0 +1,51 @@
+"""soft delete 표시 전파와 조회 필터 (user-026). 조회는 부모 테이블 서브쿼리 없이 row 자신의 deleted_at 만 본다."""
+from datetime import date
+from sqlalchemy import select
+from app.domain.company.model.company import Company
+from app.domain.company.service import delete_service as company_delete_service
+from app.domain.question.model.answer import Answer
+from app.domain.question.model.answer_comment import AnswerComment
+from app.domain.question.model.question import Question, QuestionTag
+from core.database import SessionLocal
+
+
+def test_company_soft_delete_marks_descendants(app, statements, monkeypatch):
+    monkeypatch.setattr(company_delete_service, "SOFT_DELETE_ENABLED", True)
+    db = SessionLocal()
+    company = Company(company_name="soft-delete-cascade")
+    db.add(company)
+    db.flush()
+    question = Question(
+        registrant_id=1, company_id=company.company_id, question="질문", category="기술",
+        tag=QuestionTag.TECHNOLOGY, question_at=date(2024, 1, 1),
+    )
+    db.add(question)
+    db.flush()
+    answer = Answer(question_id=question.question_id, user_id=1, answer="a")
+    db.add(answer)
+    db.flush()
+    comment = AnswerComment(answer_id=answer.answer_id, user_id=1, comment="c")
+    db.add(comment)
+    db.commit()
+    ids = (company.company_id, question.question_id, answer.answer_id, comment.answer_comment_id)
+
+    company_delete_service.delete_company(db, ids[0])
+    db.commit()
+
+    with statements.capture() as read:
+        assert db.execute(select(AnswerComment).where(AnswerComment.answer_comment_id == ids[3])).first() is None
+    assert "NOT IN" not in read.sql[0].upper()
+    assert db.execute(select(Answer).where(Answer.answer_id == ids[2])).first() is None
+    assert db.execute(select(Question).where(Question.question_id == ids[1])).first() is None
+
+    marked = [
+        db.execute(select(model.deleted_at).where(pk == id_value).execution_options(include_deleted=True)).scalar()
+        for model, pk, id_value in [
+            (Company, Company.company_id, ids[0]),
+            (Question, Question.question_id, ids[1]),
+            (Answer, Answer.answer_id, ids[2]),
+            (AnswerComment, AnswerComment.answer_comment_id, ids[3]),
+        ]
+    ]
+    assert marked[0] is not None and len(set(marked)) == 1
+    db.close()
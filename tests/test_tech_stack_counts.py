@@ -0,0 +1,35 @@
+"""기술스택 카운터 감소 (user-035). 0 이 된 row 정리는 방금 뺀 키로만 좁힌다."""
+from sqlalchemy import select
+from app.domain.company.model.company import Company
+from app.domain.company.model.company_job_posting import CompanyJobPosting
+from app.domain.company.model.tech_stack_stat import CompanyTechStackStat
+from app.domain.company.service import tech_stack_service
+from core.database import SessionLocal
+
+
+def test_decrement_deletes_only_touched_zero_rows(app, statements):
+    db = SessionLocal()
+    company = Company(company_name="tech-stack-decrement")
+    db.add(company)
+    db.flush()
+    posting = CompanyJobPosting(company_id=company.company_id)
+    db.add(posting)
+    db.flush()
+    # 다른 작업이 남긴 0 row (이번 감소와 무관하므로 건드리지 않아야 한다)
+    db.add(CompanyTechStackStat(company_id=company.company_id, tech_key="untouched", posting_count=0))
+    db.flush()
+    connection = db.connection()
+    stacks = [(posting.company_job_posting_id, "React"), (posting.company_job_posting_id, "Go")]
+    tech_stack_service.apply_tech_stacks(connection, stacks, 1)
+
+    with statements.capture() as removed:
+        tech_stack_service.apply_tech_stacks(connection, stacks[:1], -1)
+    deletes = [sql for sql in removed.sql if sql.lstrip().upper().startswith("DELETE")]
+    assert deletes and all(" IN " in sql.upper() for sql in deletes), deletes
+
+    keys = set(db.execute(
+        select(CompanyTechStackStat.tech_key).where(CompanyTechStackStat.company_id == company.company_id)
+    ).scalars())
+    assert keys == {"go", "untouched"}
+    db.rollback()
+    db.close()
@@ -0,0 +1,74 @@
+"""쓰기 API 가 실행하는 SQL 문장 수 (user-046). RETURNING 을 지원하는 SQLite 기준."""
+from datetime import date
+from app.domain.company.model.company import Company
+from app.domain.question.model.question import Question, QuestionTag
+from core.database import SessionLocal
+
+
+def _question(company_name: str) -> int:
+    db = SessionLocal()
+    company = Company(company_name=company_name)
+    db.add(company)
+    db.flush()
+    question = Question(
+        registrant_id=1, company_id=company.company_id, question="질문", category="기술",
+        tag=QuestionTag.TECHNOLOGY, question_at=date(2024, 1, 1),
+    )
+    db.add(question)
+    db.commit()
+    db.close()
+    return question.question_id
+
+
+def test_create_and_edit_answer(client, statements):
+    question_id = _question("answer-statements")
+
+    with statements.capture() as created:
+        response = client.post(f"/questions/{question_id}/answers", json={"answer": "a"})
+    assert response.status_code == 200
+    # INSERT … SELECT … RETURNING, 질문별 시퀀스 upsert … RETURNING, 버전 UPDATE
+    assert len(created.sql) == 3, created.sql
+    answer_id = response.json()["data"]
+
+    with statements.capture() as edited:
+        response = client.patch(f"/answers/{answer_id}", json={"answer": "b"})
+    assert response.status_code == 200
+    # UPDATE … WHERE owner RETURNING, 시퀀스 upsert, 버전 UPDATE
+    assert len(edited.sql) == 3, edited.sql
+
+
+def test_create_and_edit_comment(client, statements):
+    question_id = _question("comment-statements")
+    answer_id = client.post(f"/questions/{question_id}/answers", json={"answer": "a"}).json()["data"]
+
+    with statements.capture() as created:
+        response = client.post(f"/answers/{answer_id}/comments", json={"comment": "c"})
+    assert response.status_code == 200
+    assert len(created.sql) == 3, created.sql
+    comment_id = response.json()["data"]
+
+    with statements.capture() as edited:
+        response = client.patch(f"/answers/comments/{comment_id}", json={"comment": "d"})
+    assert response.status_code == 200
+    assert len(edited.sql) == 3, edited.sql
+
+
+def test_create_company(client, statements):
+    with statements.capture() as created:
+        response = client.post("/companies", json={"company_name": "statement-count-company"})
+    assert response.status_code == 200
+    # 중복 검사와 생성을 INSERT … SELECT WHERE NOT EXISTS … RETURNING 한 문장으로
+    assert len(created.sql) == 1, created.sql
+
+    with statements.capture() as duplicate:
+        response = client.post("/companies", json={"company_name": "statement-count-company"})
+    assert response.status_code == 400
+    assert len(duplicate.sql) == 1, duplicate.sql
+
+
+def test_rejected_writes_do_not_touch_change_sequence(client, statements):
+    with statements.capture() as missing:
+        assert client.post("/questions/999999/answers", json={"answer": "a"}).status_code == 404
+        assert client.patch("/answers/999999", json={"answer": "a"}).status_code == 404
+        assert client.post("/answers/999999/comments", json={"comment": "c"}).status_code == 404
+    assert not [sql for sql in missing.sql if "change_sequence" in sql], missing.sql